@@ -23,7 +23,8 @@ import re
 import resource
 import signal
 import sys
-from collections import ChainMap
+import time
+from collections import ChainMap, deque
 from itertools import chain
 from os.path import basename
 from string import Template
@@ -732,6 +733,10 @@ class MiniCmd:
         self.exitcode = 0
         self.progress = None
         self.watcher = None
+        #  Set sign_cache=True in subclasses to reuse jobspec signatures
+        #  for identical jobspecs (see signer_init()):
+        self.sign_cache = False
+        self.signer = None
         self.parser = self.create_parser(prog, usage, description, exclude_io)
 
     @staticmethod
@@ -1090,6 +1095,12 @@ class MiniCmd:
         if not self.flux_handle:
             self.flux_handle = flux.Flux()
 
+        jobspec = jobspec.dumps()
+        pre_signed = False
+        if self.sign_cache and self.signer_init():
+            jobspec = self.signer.sign(jobspec)
+            pre_signed = True
+
         if args.urgency == "default":
             urgency = flux.constants.FLUX_JOB_URGENCY_DEFAULT
         elif args.urgency == "hold":
@@ -1101,13 +1112,29 @@ class MiniCmd:
 
         return job.submit_async(
             self.flux_handle,
-            jobspec.dumps(),
+            jobspec,
             urgency=urgency,
             waitable=arg_waitable,
             debug=arg_debug,
+            pre_signed=pre_signed,
             novalidate=arg_novalidate,
         )
 
+    def signer_init(self):
+        """
+        Initialize a SignedJobspecCache so that identical jobspecs are only
+        signed once. Returns False if flux-security is not available or
+        could not be configured, in which case jobspecs are signed for each
+        submission by flux_job_submit(3).
+        """
+        if self.signer is None:
+            try:
+                self.signer = job.SignedJobspecCache(self.flux_handle)
+            except (ImportError, OSError) as exc:
+                LOGGER.debug("disabling jobspec signature cache: %s", exc)
+                self.signer = False
+        return bool(self.signer)
+
     def submit(self, args, jobspec=None):
         return self.submit_async(args, jobspec).get_id()
 
@@ -1318,6 +1345,65 @@ class SubmitBaseCmd(MiniCmd):
         sys.exit(self.exitcode)
 
 
+class SubmitWindow:
+    """
+    Bound the number of outstanding job submission requests
+
+    Jobs are only submitted while :meth:`available` returns True. Each
+    submission calls :meth:`acquire`, and each response :meth:`release`.
+
+    If ``adaptive`` is True, the window starts at ``min_size`` and grows by
+    one for every response received within twice the lowest latency seen
+    so far. When latency exceeds this bound, the window is halved (but not
+    below ``min_size``) at most once per round trip, i.e. only responses to
+    requests sent after the previous reduction can shrink it again.
+    """
+
+    def __init__(self, size=1024, adaptive=False, min_size=16):
+        self.max_size = size
+        self.min_size = min(min_size, size)
+        self.adaptive = adaptive
+        self.size = self.min_size if adaptive else size
+        self.inflight = 0
+        self.min_latency = None
+        self.t_reduced = 0.0
+
+    @classmethod
+    def from_arg(cls, arg):
+        """Create a SubmitWindow from a --max-inflight=N|auto argument"""
+        if arg == "auto":
+            return cls(size=8192, adaptive=True)
+        try:
+            size = int(arg)
+            if size <= 0:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"--max-inflight: invalid value '{arg}'")
+        return cls(size=size)
+
+    def available(self):
+        return self.inflight < self.size
+
+    def acquire(self):
+        """Account for a new request, returning its start time"""
+        self.inflight += 1
+        return time.monotonic()
+
+    def release(self, t0):
+        """Account for response to a request started at time ``t0``"""
+        self.inflight -= 1
+        if not self.adaptive:
+            return
+        latency = time.monotonic() - t0
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if latency <= 2 * self.min_latency:
+            self.size = min(self.size + 1, self.max_size)
+        elif t0 > self.t_reduced:
+            self.size = max(self.size // 2, self.min_size)
+            self.t_reduced = time.monotonic()
+
+
 class SubmitBulkCmd(SubmitBaseCmd):
     """
     SubmitBulkCmd adds options for submitting copies of jobs,
@@ -1329,8 +1415,12 @@ class SubmitBulkCmd(SubmitBaseCmd):
         #  dictionary of open logfiles for --log, --log-stderr:
         self._logfiles = {}
         self.t0 = None
+        #  queue of pending submission generators, see submit_async_with_cc():
+        self._submissions = deque()
+        self.window = None
 
         super().__init__(prog, usage, description)
+        self.sign_cache = True
         self.parser.add_argument(
             "--quiet",
             action="store_true",
@@ -1389,6 +1479,14 @@ class SubmitBulkCmd(SubmitBaseCmd):
             action="store_true",
             help="With --progress, show job throughput",
         )
+        self.parser.add_argument(
+            "--max-inflight",
+            metavar="N|auto",
+            default="1024",
+            help="Limit the number of outstanding job submission requests "
+            + "to N, or adapt the limit to observed submission latency "
+            + "with 'auto' (default: 1024)",
+        )
 
     def submit_cb(self, future, args, label=""):
         try:
@@ -1520,16 +1618,53 @@ class SubmitBulkCmd(SubmitBaseCmd):
             self._logfiles[filename] = filep
         return self._logfiles[filename]
 
+    def _submit_window_cb(self, future, t0, args, label):
+        self.window.release(t0)
+        self.submit_cb(future, args, label)
+        self._submit_pump()
+
+    def _submit_pump(self):
+        """
+        Submit queued jobs while the submission window allows
+        """
+        while self._submissions and self.window.available():
+            try:
+                xargs, jobspec, label = next(self._submissions[0])
+            except StopIteration:
+                self._submissions.popleft()
+                continue
+            except Exception as exc:  # pylint: disable=broad-except
+                #  Jobspec for a queued job could not be created. This may
+                #  occur in a reactor callback after earlier jobs were
+                #  submitted, so report the error and skip the remaining
+                #  jobs of this submission, but let outstanding
+                #  submissions complete normally:
+                LOGGER.error("%s", exc)
+                self.exitcode = 1
+                self._submissions.popleft()
+                continue
+            t0 = self.window.acquire()
+            self.submit_async(xargs, jobspec).then(
+                self._submit_window_cb, t0, xargs, label
+            )
+
     def submit_async_with_cc(self, args, cclist=None):
         """
         Asynchronously submit jobs, optionally submitting a copy of
         each job for each member of a cc-list. If the cclist is not
         passed in to the method, then one is created from either
         --cc or --bcc options.
+
+        Jobs are queued and submitted as responses to earlier submissions
+        arrive, such that no more than --max-inflight requests are
+        outstanding at once. Jobspec for the first job is created
+        immediately, so that errors common to all jobs are raised before
+        any job is submitted. Jobspec for other queued jobs is created
+        only just before submission, and an error there is reported and
+        stops submission of the remaining jobs.
         """
         if not cclist:
             cclist = self.cc_list(args)
-        label = ""
 
         #  Save default stdout/err location in args so it can be overridden
         #   by --log and --log-stderr and the correct location is available
@@ -1544,6 +1679,20 @@ class SubmitBulkCmd(SubmitBaseCmd):
         elif args.progress:
             self.progress_start(args, len(cclist))
 
+        if self.window is None:
+            self.window = SubmitWindow.from_arg(args.max_inflight)
+
+        submissions = self._cc_submissions(args, cclist)
+        first = next(submissions, None)
+        if first is not None:
+            self._submissions.append(chain([first], submissions))
+        self._submit_pump()
+
+    def _cc_submissions(self, args, cclist):
+        """
+        Generate (args, jobspec, label) for each job in cclist
+        """
+        label = ""
         for i in cclist:
             #  substitute any {cc} in args (only if --cc or --bcc):
             xargs = Xcmd(args, cc=i) if i else args
@@ -1577,7 +1726,7 @@ class SubmitBulkCmd(SubmitBaseCmd):
             if xargs.log_stderr:
                 xargs.stderr = self.openlog(xargs.log_stderr)
 
-            self.submit_async(xargs, jobspec).then(self.submit_cb, xargs, label)
+            yield xargs, jobspec, label
 
     def main(self, args):
         self.submit_async_with_cc(args)
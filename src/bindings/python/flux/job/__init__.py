@@ -12,19 +12,36 @@ from flux.job.Jobspec import Jobspec, JobspecV1, validate_jobspec
 from flux.job.JobID import id_parse, id_encode, JobID
 from flux.job.kvs import job_kvs, job_kvs_guest
 from flux.job.kill import kill_async, kill, cancel_async, cancel
-from flux.job.submit import submit_async, submit, submit_get_id
+from flux.job.submit import submit_async, submit, submit_get_id, SignedJobspecCache
 from flux.job.info import JobInfo, JobInfoFormat, job_fields_to_attrs
-from flux.job.list import job_list, job_list_inactive, job_list_id, JobList, get_job
+from flux.job.list import (
+    job_list,
+    job_list_inactive,
+    job_list_id,
+    JobList,
+    JobListConstraintParser,
+    get_job,
+)
 from flux.job.kvslookup import job_info_lookup, JobKVSLookup, job_kvs_lookup
-from flux.job.wait import wait_async, wait, wait_get_status, result_async, result
+from flux.job.wait import (
+    wait_async,
+    wait,
+    wait_get_status,
+    result_async,
+    result,
+    results_async,
+    results,
+)
 from flux.job.event import (
     event_watch_async,
     event_watch,
     event_wait,
     JobEventWatchFuture,
     EventLogEvent,
+    EventLogRecord,
     JobException,
     MAIN_EVENTS,
+    parse_eventlog,
 )
 from flux.job.executor import (
     FluxExecutor,
@@ -33,12 +50,22 @@ from flux.job.executor import (
 from flux.job.timeleft import timeleft
 from flux.core.inner import ffi
 from flux.job.output import (
+    OutputSink,
     job_output,
+    job_outputs,
     output_event_watch,
     output_event_watch_async,
     output_watch,
     output_watch_async,
     output_watch_lines,
     output_watch_lines_async,
+    write_output,
 )
 from flux.job.watcher import JobWatcher
+from flux.job.journal import (
+    EventWaitManyFuture,
+    JournalConsumer,
+    JournalEvent,
+    event_wait_many,
+    journal_consumer,
+)
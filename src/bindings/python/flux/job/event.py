@@ -9,6 +9,7 @@
 ###############################################################
 import errno
 import json
+import re
 
 from _flux._core import ffi
 from flux.future import Future
@@ -74,6 +75,105 @@ class EventLogEvent(dict):
         )
 
 
+#  Match the leading timestamp and name of an eventlog entry as encoded
+#  by libeventlog, i.e. compact JSON with keys in insertion order. Entries
+#  in any other form are handled by a full decode in EventLogRecord.
+_EVENTLOG_ENTRY_RE = re.compile(
+    r'\{"timestamp":([-+.0-9eE]+),"name":"([^"\\]*)"(?:(,"context":)|\}$)'
+)
+_json_decoder = json.JSONDecoder()
+
+
+class EventLogRecord:
+    """
+    A compact, lazily decoded eventlog entry
+
+    Unlike :obj:`EventLogEvent`, only the entry name and timestamp are
+    extracted when an EventLogRecord is created. The entry context is
+    decoded on first access of the ``context`` attribute. This makes
+    scanning large numbers of eventlog entries for a few events of
+    interest, or for timestamps alone, much cheaper.
+
+    EventLogRecord objects are usually created in bulk from an eventlog
+    with :func:`parse_eventlog`.
+
+    Attributes:
+        name (str): event name
+        timestamp (float): event timestamp
+        context (dict): event context, decoded on first access
+    """
+
+    __slots__ = ("name", "timestamp", "_entry", "_context")
+
+    def __init__(self, entry):
+        match = _EVENTLOG_ENTRY_RE.match(entry)
+        if match is None:
+            event = json.loads(entry)
+            self.name = event["name"]
+            self.timestamp = event["timestamp"]
+            self._entry = None
+            self._context = event.get("context", {})
+            return
+        self.name = match.group(2)
+        self.timestamp = float(match.group(1))
+        if match.group(3) is None:
+            self._entry = None
+            self._context = {}
+        else:
+            self._entry = (entry, match.end())
+            self._context = None
+
+    def __str__(self):
+        return "{0.timestamp:<0.5f}: {0.name} {0.context}".format(self)
+
+    def __repr__(self):
+        return "EventLogRecord({0.timestamp!r}, {0.name!r})".format(self)
+
+    @property
+    def context(self):
+        if self._context is None:
+            entry, offset = self._entry
+            self._context = _json_decoder.raw_decode(entry, offset)[0]
+            self._entry = None
+        return self._context
+
+    @property
+    def context_string(self):
+        if not self.context:
+            return ""
+        return json.dumps(
+            self.context, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        )
+
+    def to_event(self):
+        """Return this entry as an :obj:`EventLogEvent`"""
+        return EventLogEvent(
+            {"timestamp": self.timestamp, "name": self.name, "context": self.context}
+        )
+
+
+def parse_eventlog(eventlog, names=None):
+    """Parse an eventlog into a list of EventLogRecord objects
+
+    Split ``eventlog``, a string containing one JSON encoded entry per
+    line, into a list of :obj:`EventLogRecord`. Entry contexts are not
+    decoded until accessed.
+
+    Args:
+        eventlog (str): eventlog contents, e.g. as returned from a KVS lookup
+        names (iterable): Optional set of event names. If set, only entries
+            with one of these names are returned.
+
+    Returns:
+        list: EventLogRecord objects in eventlog order
+    """
+    records = (EventLogRecord(line) for line in eventlog.splitlines() if line)
+    if names is None:
+        return list(records)
+    names = frozenset(names)
+    return [record for record in records if record.name in names]
+
+
 class JobEventWatchFuture(Future):
     """
     A future returned from job.event_watch_async().
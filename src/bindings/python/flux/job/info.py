@@ -10,20 +10,22 @@
 
 import json
 import os
-import pwd
 import string
 import sys
 import time
 from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain
 
 import flux.constants
 from flux.core.inner import raw
+from flux.idset import IDset
 from flux.job.JobID import JobID
 from flux.job.stats import JobStats
 from flux.memoized_property import memoized_property
 from flux.uri import JobURI
+from flux.util import getpwuid
 
 try:
     from flux.resource import SchedResourceList
@@ -136,7 +138,7 @@ def statustoemoji(stateid, resultid):
 
 def get_username(userid):
     try:
-        return pwd.getpwuid(userid).pw_name
+        return getpwuid(userid).pw_name
     except KeyError:
         return str(userid)
 
@@ -172,6 +174,13 @@ class EmptyObject:
         return "".__format__(spec)
 
 
+#  Creating a namedtuple type is expensive, so cache one per set of keys,
+#  since most jobs will share the same few sets of annotation keys.
+@lru_cache(maxsize=256)
+def _annotations_tuple_type(keys):
+    return namedtuple("X", keys)
+
+
 # AnnotationsInfo is a wrapper for a namedtuple.  We need this
 # object so that we can we detect when an attribute is missing and
 # ultimately return an empty string (e.g. when an attribute does not
@@ -182,7 +191,7 @@ class EmptyObject:
 class AnnotationsInfo:
     def __init__(self, annotationsDict):
         self.annotationsDict = annotationsDict
-        self.atuple = namedtuple("X", annotationsDict.keys())(
+        self.atuple = _annotations_tuple_type(tuple(annotationsDict))(
             *(
                 AnnotationsInfo(v) if isinstance(v, dict) else v
                 for v in annotationsDict.values()
@@ -220,21 +229,250 @@ class StatsInfo(JobStats):
         return str(self).__format__(fmt)
 
 
+class ResourceCounts:
+    """Core, gpu and node counts of one set of instance resources
+
+    Attributes other than ``ncores``, ``ngpus``, and ``nnodes`` are
+    fetched from the corresponding full ResourceSet, which is only
+    constructed on demand.
+    """
+
+    def __init__(self, resources, state, ncores=0, ngpus=0, nnodes=0):
+        self._resources = resources
+        self._state = state
+        self.ncores = ncores
+        self.ngpus = ngpus
+        self.nnodes = nnodes
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._resources.resource_list[self._state], attr)
+
+
+class InstanceResources:
+    """
+    Lightweight alternative to SchedResourceList for instance.* fields
+
+    Compute only the resource counts required by ``instance.*`` fields
+    directly from the ``R_lite`` of each resource set in a
+    ``sched.resource-status`` response, instead of constructing a full
+    ResourceSet for each state. The "up" and "free" counts are computed
+    per rank only when some resources are down or allocated.
+    """
+
+    states = ("all", "down", "allocated", "up", "free")
+
+    def __init__(self, resp):
+        self.resp = resp
+
+    @memoized_property
+    def resource_list(self):
+        return SchedResourceList(self.resp)
+
+    def _entries(self, state):
+        try:
+            return self.resp[state]["execution"]["R_lite"]
+        except (KeyError, TypeError):
+            return []
+
+    def _rankmap(self, state):
+        """Return a dict of rank -> (cores, gpus) for ``state``"""
+        if state == "up":
+            return self._difference(self._rankmap("all"), self._rankmap("down"))
+        if state == "free":
+            return self._difference(self._rankmap("up"), self._rankmap("allocated"))
+        result = {}
+        for entry in self._entries(state):
+            children = entry.get("children", {})
+            cores = set(IDset(children.get("core", "")))
+            gpus = set(IDset(children.get("gpu", "")))
+            for rank in IDset(entry["rank"]):
+                result[rank] = (cores, gpus)
+        return result
+
+    @staticmethod
+    def _difference(rankmap, other):
+        result = {}
+        for rank, (cores, gpus) in rankmap.items():
+            if rank in other:
+                cores = cores - other[rank][0]
+                gpus = gpus - other[rank][1]
+            if cores or gpus:
+                result[rank] = (cores, gpus)
+        return result
+
+    def _count(self, state):
+        if state == "up" and not self._entries("down"):
+            state = "all"
+        if state == "free" and not self._entries("down"):
+            if not self._entries("allocated"):
+                state = "all"
+        if state in ("up", "free"):
+            rankmap = self._rankmap(state)
+            ncores = sum(len(cores) for cores, gpus in rankmap.values())
+            ngpus = sum(len(gpus) for cores, gpus in rankmap.values())
+            return ncores, ngpus, len(rankmap)
+
+        #  all, down, and allocated sets can be counted without
+        #  expanding each rank:
+        ncores = ngpus = 0
+        ranks = IDset()
+        for entry in self._entries(state):
+            children = entry.get("children", {})
+            nranks = len(IDset(entry["rank"]))
+            ncores += nranks * len(IDset(children.get("core", "")))
+            ngpus += nranks * len(IDset(children.get("gpu", "")))
+            ranks.add(entry["rank"])
+        return ncores, ngpus, len(ranks)
+
+    def __getattr__(self, attr):
+        if attr not in self.states:
+            raise AttributeError(f"Invalid InstanceResources attr {attr}")
+        counts = ResourceCounts(self, attr, *self._count(attr))
+        self.__dict__[attr] = counts
+        return counts
+
+    def __getitem__(self, item):
+        return getattr(self, item)
+
+
 class InstanceInfo:
-    def __init__(self, uri=None):
+    """Information about a running Flux instance for instance.* fields
+
+    If ``fields`` is provided, only the requests required by those
+    ``instance.*`` fields are sent to the instance (see
+    :meth:`requests`).  Use :meth:`cached` with a caller-owned dict to
+    reuse a previous result for the same instance, e.g. for the duration
+    of a command.
+    """
+
+    #  Requests required by the first component of each instance.* field
+    field_requests = {
+        "stats": ("job-stats",),
+        "progress": ("job-stats",),
+        "utilization": ("resource-status",),
+        "gpu_utilization": ("resource-status",),
+        "resources": ("resource-status",),
+    }
+    topics = {
+        "job-stats": ("job-list.job-stats", {}),
+        "resource-status": ("sched.resource-status", None),
+    }
+
+    def __init__(self, uri=None, fields=None):
         self.initialized = False
+        self.stats = EmptyObject()
+        self.resources = EmptyObject()
+        self.fetched = set()
+        if not uri or SchedResourceList is None:
+            return
+        requests = self.requests(fields)
+        if not requests:
+            self.fetched = requests
+            return
         try:
-            if not uri or SchedResourceList is None:
-                raise ValueError
             handle = flux.Flux(str(uri))
-            future = handle.rpc("sched.resource-status")
-            self.stats = StatsInfo(handle).update_sync()
-            self.resources = SchedResourceList(future.get())
-            self.initialized = True
+            futures = {name: handle.rpc(*self.topics[name]) for name in requests}
+            self._update(handle, {name: f.get() for name, f in futures.items()})
+        except (OSError, FileNotFoundError):
             return
-        except (ValueError, OSError, FileNotFoundError):
-            self.stats = EmptyObject()
-            self.resources = EmptyObject()
+        #  Only record requests as fetched on success, so that a failed
+        #  fetch is never reused from a cache:
+        self.fetched = requests
+
+    @classmethod
+    def requests(cls, fields=None):
+        """Return the set of requests needed for ``fields``
+
+        ``fields`` is an iterable of format field names. Fields that do
+        not start with ``instance.`` are ignored. If ``fields`` is None,
+        then all requests are returned.
+        """
+        if fields is None:
+            return set(cls.topics)
+        result = set()
+        for field in fields:
+            prefix, _, name = field.partition(".")
+            if prefix != "instance":
+                continue
+            name = name.split(".")[0]
+            result.update(cls.field_requests.get(name, cls.topics))
+        return result
+
+    @classmethod
+    def cached(cls, cache, uri, fields=None):
+        """Return InstanceInfo for ``uri``, fetching it only if necessary
+
+        ``cache`` is a dict owned by the caller, which determines the
+        lifetime of cached results. A previous result for ``uri`` in
+        ``cache``, from this method or from :meth:`fetch_async`, is reused
+        if it included the requests needed for ``fields``. Only successful
+        results are stored.
+        """
+        info = cls.lookup(cache, uri, fields)
+        if info is None:
+            info = cls(uri, fields)
+            if info.fetched == cls.requests(fields):
+                cache[str(uri)] = info
+        return info
+
+    @staticmethod
+    def lookup(cache, uri, fields=None):
+        """Return InstanceInfo for ``uri`` and ``fields`` from ``cache`` or None"""
+        info = cache.get(str(uri))
+        if info is not None and InstanceInfo.requests(fields) <= info.fetched:
+            return info
+        return None
+
+    def _update(self, handle, responses):
+        if "job-stats" in responses:
+            self.stats = StatsInfo(handle)
+            self.stats._update(responses["job-stats"])
+        if "resource-status" in responses:
+            self.resources = InstanceResources(responses["resource-status"])
+        self.initialized = True
+
+    @classmethod
+    def fetch_async(cls, handle, callback, *args, fields=None, uri=None, cache=None):
+        """Asynchronously fetch instance info using an open handle
+
+        Send the requests needed for ``fields`` (by default
+        ``sched.resource-status`` and ``job-list.job-stats``) to the
+        instance connected by ``handle`` and call
+        ``callback(info, *args)`` with the resulting InstanceInfo once
+        all responses have been received. Requires that the reactor
+        for ``handle`` be running. If any request fails, ``info`` is
+        empty, as if the instance could not be contacted. If ``cache``
+        and ``uri`` are set, a successful result is also stored in
+        ``cache`` for use by :meth:`cached`.
+        """
+        info = cls()
+        requests = set()
+        if SchedResourceList is not None:
+            requests = cls.requests(fields)
+        if not requests:
+            info.fetched = requests
+            callback(info, *args)
+            return
+        responses = {}
+
+        def response_cb(future, name):
+            try:
+                responses[name] = future.get()
+            except OSError:
+                responses[name] = None
+            if len(responses) < len(requests):
+                return
+            if None not in responses.values():
+                info._update(handle, responses)
+                info.fetched = requests
+                if cache is not None and uri is not None:
+                    cache[str(uri)] = info
+            callback(info, *args)
+
+        for name in requests:
+            handle.rpc(*cls.topics[name]).then(response_cb, name)
 
     @memoized_property
     def utilization(self):
@@ -341,57 +579,86 @@ class JobInfo:
         "dependencies",
     )
 
-    def __init__(self, info_resp):
-        #  Set defaults, then update with job-list.list response items:
-        combined_dict = self.defaults.copy()
-        combined_dict.update(info_resp)
-
-        #  Cast jobid to JobID
-        combined_dict["id"] = JobID(combined_dict["id"])
-
-        #  Rename "state" to "state_id" and "result" to "result_id"
-        #  until returned state is a string:
-        if "state" in combined_dict:
-            combined_dict["state_id"] = combined_dict.pop("state")
-
-        if "result" in combined_dict:
-            combined_dict["result_id"] = combined_dict.pop("result")
+    #  job-list.list response keys which are renamed in JobInfo
+    #  (until returned state is a string):
+    renamed = {"state_id": "state", "result_id": "result"}
 
-        # Overwrite "exception" with our exception object
-        exc1 = combined_dict.get("exception_occurred", "")
-        exc2 = combined_dict.get("exception_severity", "")
-        exc3 = combined_dict.get("exception_type", "")
-        exc4 = combined_dict.get("exception_note", "")
-        combined_dict["exception"] = ExceptionInfo(exc1, exc2, exc3, exc4)
-
-        aDict = combined_dict.get("annotations", {})
-        combined_dict["annotations"] = AnnotationsInfo(aDict)
-        combined_dict["sched"] = combined_dict["annotations"].sched
-        combined_dict["user"] = combined_dict["annotations"].user
-
-        deps = combined_dict.get("dependencies", [])
-        combined_dict["dependencies"] = DependencyList(deps)
-
-        #  Set all keys as self._{key} to be found by getattr and
-        #   memoized_property decorator:
-        for key, value in combined_dict.items():
-            setattr(self, "_{0}".format(key), value)
+    def __init__(self, info_resp):
+        #  Keep a reference to the job-list.list response. Attributes are
+        #  then resolved from the response (or defaults) on first access
+        #  by __getattr__(), so that jobs which are never displayed, or
+        #  attributes which are not used in the current output format,
+        #  cost nothing to construct.
+        #
+        #  The jobid is always needed, so cast it to JobID immediately,
+        #  which also validates the response.
+        self._info_resp = info_resp
+        self._id = JobID(info_resp["id"])
+
+    def _resolve(self, key):
+        """
+        Construct attribute ``key`` from the job-list response, raising
+        KeyError if it does not exist.
+        """
+        resp = self.__dict__["_info_resp"]
+        if key == "exception":
+            return ExceptionInfo(
+                resp.get("exception_occurred", ""),
+                resp.get("exception_severity", ""),
+                resp.get("exception_type", ""),
+                resp.get("exception_note", ""),
+            )
+        if key == "annotations":
+            return AnnotationsInfo(resp.get("annotations", {}))
+        if key in ("sched", "user"):
+            return getattr(self.annotations, key)
+        if key == "dependencies":
+            return DependencyList(resp.get("dependencies", []))
+        if key in self.renamed:
+            key = self.renamed[key]
+            if key == "result":
+                return resp.get(key, "")
+        elif key in self.renamed.values():
+            raise KeyError(key)
+        if key in resp:
+            return resp[key]
+        return self.defaults[key]
 
     #  getattr method to return all non-computed values in job-list.list
     #   response by default. Avoids the need to wrap @property methods
     #   that just return self._<attr>.
     #
+    #  Values are memoized as self._<attr>, which is also where the
+    #   memoized_property decorator stores results, so a value in the
+    #   response overrides any computed property of the same name.
+    #
     def __getattr__(self, attr):
+        if attr.startswith("__") or "_info_resp" not in self.__dict__:
+            raise AttributeError(attr)
         if attr.startswith("_"):
-            raise AttributeError
+            try:
+                value = self._resolve(attr[1:])
+            except KeyError:
+                raise AttributeError(attr)
+            self.__dict__[attr] = value
+            return value
         try:
             return getattr(self, "_{0}".format(attr))
         except (KeyError, AttributeError):
             raise AttributeError("invalid JobInfo attribute '{}'".format(attr))
 
-    def get_instance_info(self):
+    def get_instance_info(self, fields=None, cache=None):
+        """Fetch instance info required by ``fields`` (default: all)
+
+        If ``cache`` is a dict, reuse or store the result there with
+        :meth:`InstanceInfo.cached`. Otherwise, always fetch it.
+        """
         if self.uri and self.state_single == "R":  # pylint: disable=W0143
-            setattr(self, "_instance", InstanceInfo(self.uri))
+            if cache is not None:
+                info = InstanceInfo.cached(cache, self.uri, fields)
+            else:
+                info = InstanceInfo(self.uri, fields)
+            setattr(self, "_instance", info)
         else:
             setattr(self, "_instance", InstanceInfo())
         return self
@@ -0,0 +1,518 @@
+###############################################################
+# Copyright 2023 Lawrence Livermore National Security, LLC
+# (c.f. AUTHORS, NOTICE.LLNS, COPYING)
+#
+# This file is part of the Flux resource manager framework.
+# For details, see https://github.com/flux-framework.
+#
+# SPDX-License-Identifier: LGPL-3.0
+###############################################################
+
+import errno
+import os
+from collections import deque
+
+from flux.constants import FLUX_RPC_NORESPONSE, FLUX_RPC_STREAMING
+from flux.core.inner import ffi
+from flux.future import Future, FutureExt
+from flux.job.event import (
+    EventLogEvent,
+    JobException,
+    event_watch_async,
+    parse_eventlog,
+)
+from flux.job.JobID import JobID
+from flux.job.kvslookup import job_info_lookup
+
+
+class JournalEvent(EventLogEvent):
+    """
+    A single main eventlog entry delivered by the job manager journal
+
+    Attributes:
+        jobid (JobID): The job to which this event applies
+        eventlog_seq (int): The sequence number of this event in the job's
+            main eventlog. May be used to detect duplicates when events
+            are also read from another source, e.g. the KVS.
+        name (str): event name
+        timestamp (float): event timestamp
+        context (dict): event context
+    """
+
+    def __init__(self, jobid, eventlog_seq, entry):
+        super().__init__(entry)
+        self.jobid = JobID(jobid)
+        self.eventlog_seq = eventlog_seq
+
+    def __str__(self):
+        return "{0.jobid.f58}: {1}".format(self, super().__str__())
+
+
+class JournalConsumer:
+    """Consume main eventlog events for many jobs over one streaming RPC
+
+    The JournalConsumer class opens a single ``job-manager.events-journal``
+    streaming RPC and delivers :obj:`JournalEvent` objects for all jobs,
+    or for a set of jobs registered with :meth:`add_job`. This is much
+    cheaper for both the client and the broker than watching the eventlog
+    of each job individually with :func:`flux.job.event_watch_async`.
+
+    Note that ``job-manager.events-journal`` requires owner credentials,
+    so a JournalConsumer cannot be used by guest users of a multi-user
+    instance. Such callers should check that they are the instance owner,
+    e.g. compare the ``security.owner`` broker attribute with their
+    userid, and otherwise fall back to per-job eventlog watches or
+    ``job-list`` queries.
+
+    Events may be consumed asynchronously by registering callbacks, either
+    per-job with :meth:`add_job` or for all jobs with :meth:`set_callback`,
+    and running the reactor, or synchronously via :meth:`poll`.
+
+    Callbacks are called as ``callback(event, *args, **kwargs)``. Once the
+    event stream ends (i.e. after :meth:`stop`), the default callback, if
+    set, is called once with ``event=None``. If the stream ended due to an
+    error, e.g. EPERM for a guest user, the error is stored in
+    :attr:`error` before the default callback is called, and is raised
+    by :meth:`poll`.
+
+    On startup the job manager replays its journal of recent events (see
+    the ``job-manager.journal-size-limit`` configuration), so events that
+    occurred just before the consumer was started are also delivered.
+    To resume a previous consumer, pass ``since`` and/or ``resume``.
+    Events that are older than the journal backlog cannot be recovered
+    from this interface and must be fetched from the job eventlog in
+    the KVS.
+
+    Args:
+        flux_handle (flux.Flux): Flux handle
+        jobids (iterable): Optional initial set of jobids of interest.
+            If None (the default), events for all jobs are delivered
+            unless :meth:`add_job` is later called.
+        allow (iterable): Optional list of event names to deliver. This
+            filter is applied in the job manager.
+        deny (iterable): Optional list of event names to suppress. This
+            filter is applied in the job manager.
+        since (float): Skip events with a timestamp earlier than ``since``
+        resume (dict): Optional mapping of jobid to the last eventlog
+            sequence number already processed for that job, e.g. from
+            a previous consumer's :attr:`last_seq`. Events at or before
+            this sequence number are skipped.
+    """
+
+    def __init__(
+        self,
+        flux_handle,
+        jobids=None,
+        allow=None,
+        deny=None,
+        since=0.0,
+        resume=None,
+    ):
+        self.handle = flux_handle
+        self.allow = allow
+        self.deny = deny
+        self.since = since
+        self.jobids = None
+        self.rpc = None
+        self.error = None
+        self.last_seq = {}
+        if resume:
+            self.last_seq = {JobID(x): seq for x, seq in resume.items()}
+        self._callbacks = {}
+        self._default_cb = None
+        self._backlog = deque()
+        self._stopped = False
+        if jobids is not None:
+            self.jobids = set(map(JobID, jobids))
+
+    def _payload(self):
+        payload = {}
+        if self.allow is not None:
+            payload["allow"] = {name: 1 for name in self.allow}
+        if self.deny is not None:
+            payload["deny"] = {name: 1 for name in self.deny}
+        return payload
+
+    def add_job(self, jobid, callback=None, *args, **kwargs):
+        """
+        Add a job to the set of jobs of interest, optionally registering
+        a callback for events from this job only.
+
+        Args:
+            jobid (JobID): jobid to add
+            callback (callable): Optional callback to call for each event
+                for this job. Called as ``callback(event, *args, **kwargs)``.
+        """
+        jobid = JobID(jobid)
+        if self.jobids is None:
+            self.jobids = set()
+        self.jobids.add(jobid)
+        if callback is not None:
+            self._callbacks[jobid] = (callback, args, kwargs)
+        return self
+
+    def remove_job(self, jobid):
+        """
+        Stop delivering events for ``jobid``. Note that if no other jobs
+        remain registered, then events for no jobs will be delivered.
+        """
+        jobid = JobID(jobid)
+        if self.jobids is not None:
+            self.jobids.discard(jobid)
+        self._callbacks.pop(jobid, None)
+        self.last_seq.pop(jobid, None)
+        return self
+
+    def set_callback(self, callback, *args, **kwargs):
+        """
+        Set a callback for all events not handled by a per-job callback.
+        Called as ``callback(event, *args, **kwargs)``.
+        """
+        self._default_cb = (callback, args, kwargs)
+        return self
+
+    def start(self):
+        """
+        Start the streaming journal RPC. If any callbacks have been
+        registered, events are delivered via the reactor. Otherwise,
+        use :meth:`poll` to fetch events.
+        """
+        if self.rpc is not None:
+            raise RuntimeError("JournalConsumer already started")
+        self.rpc = self.handle.rpc(
+            "job-manager.events-journal",
+            self._payload(),
+            flags=FLUX_RPC_STREAMING,
+        )
+        if self._callbacks or self._default_cb is not None:
+            self.rpc.then(self._journal_cb)
+        return self
+
+    def stop(self):
+        """
+        Cancel the streaming journal RPC. Events already in flight will
+        still be delivered, followed by the end of stream.
+        """
+        if self.rpc is not None and not self._stopped:
+            self._stopped = True
+            self.handle.rpc(
+                "job-manager.events-journal-cancel",
+                {"matchtag": self.rpc.pimpl.get_matchtag()},
+                flags=FLUX_RPC_NORESPONSE,
+            )
+        return self
+
+    def _accept(self, entry):
+        #  Note: JobID is a subclass of int, so the raw integer id can be
+        #  used for lookups, deferring JobID creation to accepted events.
+        jobid = entry["id"]
+        if self.jobids is not None and jobid not in self.jobids:
+            return None
+        seq = entry["eventlog_seq"]
+        if seq <= self.last_seq.get(jobid, -1):
+            return None
+        if entry["entry"]["timestamp"] < self.since:
+            return None
+        return JournalEvent(jobid, seq, entry["entry"])
+
+    def _process_response(self):
+        """
+        Read one response from the journal RPC and append accepted events
+        to the backlog. Returns False when the event stream has ended,
+        with any error other than end of stream stored in :attr:`error`.
+        """
+        try:
+            resp = self.rpc.get()
+        except OSError as exc:
+            if exc.errno != errno.ENODATA:
+                self.error = exc
+            return False
+        for entry in resp["events"]:
+            event = self._accept(entry)
+            if event is not None:
+                self._backlog.append(event)
+        self.rpc.reset()
+        return True
+
+    def _dispatch(self, event):
+        #  A previous callback may have removed this job:
+        if self.jobids is not None and event.jobid not in self.jobids:
+            return
+        self.last_seq[event.jobid] = event.eventlog_seq
+        callback = self._callbacks.get(event.jobid, self._default_cb)
+        if callback is not None:
+            func, args, kwargs = callback
+            func(event, *args, **kwargs)
+
+    def _journal_cb(self, future):
+        active = self._process_response()
+        while self._backlog:
+            self._dispatch(self._backlog.popleft())
+        if not active and self._default_cb is not None:
+            func, args, kwargs = self._default_cb
+            func(None, *args, **kwargs)
+
+    def poll(self, timeout=-1.0):
+        """
+        Synchronously return the next :obj:`JournalEvent`, blocking up to
+        ``timeout`` seconds if necessary. Returns None once the event stream
+        has ended.
+
+        Raises:
+            TimeoutError: No event was received within ``timeout`` seconds
+            OSError: The event stream ended with an error, e.g. EPERM if
+                this user is not the instance owner
+        """
+        if self.rpc is None:
+            self.start()
+        while not self._backlog:
+            self.rpc.wait_for(timeout)
+            if not self._process_response():
+                if self.error is not None:
+                    raise self.error
+                return None
+        event = self._backlog.popleft()
+        self.last_seq[event.jobid] = event.eventlog_seq
+        return event
+
+    def __iter__(self):
+        event = self.poll()
+        while event is not None:
+            yield event
+            event = self.poll()
+
+
+def journal_consumer(flux_handle, jobids=None, allow=None, deny=None, since=0.0):
+    """Return a started JournalConsumer
+
+    Convenience function to create and start a :obj:`JournalConsumer`
+    for synchronous use, e.g.::
+
+        >>> for event in flux.job.journal_consumer(h, allow=["finish"]):
+        ...     print(event)
+
+    Args:
+        flux_handle (flux.Flux): Flux handle
+        jobids (iterable): Optional set of jobids of interest (default: all)
+        allow (iterable): Optional list of event names to deliver
+        deny (iterable): Optional list of event names to suppress
+        since (float): Skip events with a timestamp earlier than ``since``
+    """
+    return JournalConsumer(
+        flux_handle, jobids=jobids, allow=allow, deny=deny, since=since
+    ).start()
+
+
+class EventWaitManyFuture(FutureExt):
+    """
+    A future returned from :func:`event_wait_many`.
+
+    This Future is fulfilled once for each job with a ``(jobid, result)``
+    tuple, in the order results become available, and then once more
+    with None after results for all jobs have been delivered. ``result``
+    is the matching :obj:`EventLogEvent`, or, if the event will never
+    occur, the exception :func:`flux.job.event_wait` would have raised
+    for the job, e.g. :py:exc:`flux.job.JobException` or an OSError.
+
+    Use :meth:`get_event` to fetch the current result.
+
+    The job manager journal is used if ``journal`` is True, or, by
+    default, if this user is the instance owner. Otherwise, the eventlog
+    of each job is watched individually.
+    """
+
+    def __init__(self, flux_handle, jobids, name, raiseJobException=True, journal=None):
+        self.name = name
+        self.raise_job_exception = raiseJobException
+        self.journal = journal
+        self.consumer = None
+
+        #  Per-job eventlog watches, used only if the journal is not
+        #  available to this user:
+        self._watches = {}
+
+        #  Journal events for each job awaiting a result. Events are
+        #  buffered (in a list) until the job's eventlog has been fetched
+        #  from the KVS, then processed directly (None):
+        self._pending = {JobID(jobid): [] for jobid in jobids}
+
+        #  Results not yet consumed by the caller. The head of the queue
+        #  is the current result of this Future, if it is ready.
+        self._queue = deque()
+        super().__init__(self._init, flux_handle=flux_handle)
+
+    def _put(self, value):
+        self._queue.append(value)
+        self.pimpl.fulfill(ffi.NULL, ffi.NULL)
+
+    def _result(self, jobid, result):
+        del self._pending[jobid]
+        if self.consumer is not None:
+            self.consumer.remove_job(jobid)
+        if jobid in self._watches:
+            self._watches.pop(jobid).cancel(stop=True)
+        self._put((jobid, result))
+        if not self._pending:
+            if self.consumer is not None:
+                self.consumer.stop()
+            self._put(None)
+
+    def _no_event(self):
+        error = f"eventlog ended before event='{self.name}'"
+        return OSError(errno.ENODATA, error)
+
+    def _process(self, jobid, event):
+        #  Return True if event resolved the result for jobid
+        if event.name == self.name:
+            self._result(jobid, event)
+        elif (
+            self.raise_job_exception
+            and event.name == "exception"
+            and event.context["severity"] == 0
+        ):
+            self._result(jobid, JobException(event))
+        elif event.name == "clean":
+            self._result(jobid, self._no_event())
+        else:
+            return False
+        return True
+
+    def _init(self, future):
+        #  Events that occur after the journal is started are delivered by
+        #  the journal. Events older than the journal backlog are fetched
+        #  from each job's eventlog in the KVS. Only events which could
+        #  resolve a result are requested from the job manager.
+        #
+        #  The journal is only available to the instance owner, so other
+        #  users fall back to watching the eventlog of each job.
+        handle = future.get_flux()
+        if not self._pending:
+            self._put(None)
+            return
+        if self.journal is None:
+            self.journal = int(handle.attr_get("security.owner")) == os.getuid()
+        if not self.journal:
+            for jobid in list(self._pending):
+                self._watches[jobid] = event_watch_async(handle, jobid)
+                self._watches[jobid].then(self._watch_cb, jobid)
+            return
+        allow = {self.name, "clean"}
+        if self.raise_job_exception:
+            allow.add("exception")
+        self.consumer = JournalConsumer(handle, jobids=self._pending, allow=allow)
+        self.consumer.set_callback(self._journal_cb)
+        self.consumer.start()
+        for jobid in list(self._pending):
+            job_info_lookup(handle, jobid, keys=["eventlog"]).then(
+                self._lookup_cb, jobid
+            )
+
+    def _watch_cb(self, future, jobid):
+        try:
+            event = future.get_event()
+        except OSError as exc:
+            self._watches.pop(jobid)
+            self._result(jobid, exc)
+            return
+        if event is None:
+            self._watches.pop(jobid)
+            self._result(jobid, self._no_event())
+        else:
+            self._process(jobid, event)
+
+    def _journal_cb(self, event):
+        if event is None:
+            #  If the journal failed, no more results can be delivered:
+            if self.consumer.error is not None:
+                for jobid in list(self._pending):
+                    self._result(jobid, self.consumer.error)
+            return
+        if event.jobid not in self._pending:
+            return
+        backlog = self._pending[event.jobid]
+        if backlog is not None:
+            #  The KVS eventlog has not been processed yet. Since a
+            #  journal event may be newer than events missing from the
+            #  journal backlog, defer it until the lookup is complete.
+            backlog.append(event)
+            return
+        self._process(event.jobid, event)
+
+    def _lookup_cb(self, future, jobid):
+        try:
+            eventlog = future.get()["eventlog"]
+        except OSError as exc:
+            self._result(jobid, OSError(exc.errno, future.error_string()))
+            return
+        backlog = self._pending[jobid]
+        self._pending[jobid] = None
+        for record in parse_eventlog(eventlog, names=self.consumer.allow):
+            if self._process(jobid, record.to_event()):
+                return
+        for event in backlog:
+            if self._process(jobid, event):
+                return
+
+    def get(self):
+        """
+        Return the current result of this Future, blocking until one is
+        available.
+        """
+        Future.get(self)
+        return self._queue[0]
+
+    def reset(self):
+        #  Consume the current result, if any:
+        if self._queue and self.is_ready():
+            self._queue.popleft()
+        super().reset()
+
+    def get_event(self, autoreset=True):
+        """
+        Return the next ``(jobid, result)`` tuple, or None once results
+        for all jobs have been returned.
+
+        The future is auto-reset unless autoreset=False, so a subsequent
+        call to get_event() will try to fetch the next result and thus
+        may block.
+        """
+        value = self.get()
+        if autoreset and value is not None:
+            self.reset()
+        return value
+
+    def __iter__(self):
+        value = self.get_event()
+        while value is not None:
+            yield value
+            value = self.get_event()
+
+
+def event_wait_many(flux_handle, jobids, name, raiseJobException=True):
+    """Wait for a main eventlog entry ``name`` for many jobs
+
+    This is a bulk version of :func:`flux.job.event_wait` for the main
+    eventlog. Instead of watching the full eventlog of each job, a single
+    job manager journal stream, filtered in the job manager to ``name``
+    and the few other events that determine a result, is shared by all
+    jobs. Events that occurred before the journal backlog are read from
+    each job's eventlog in the KVS.
+
+    Returns an :obj:`EventWaitManyFuture`, which is fulfilled once per
+    job as its result becomes available, e.g.::
+
+        >>> for jobid, result in flux.job.event_wait_many(h, ids, "start"):
+        ...     print(jobid, result)
+
+    :param flux_handle: handle for Flux broker from flux.Flux()
+    :type flux_handle: Flux
+    :param jobids: the job IDs for which to wait for event ``name``
+    :param name: The event name for which to wait
+    :param raiseJobException: if True, the result for a job is a
+      JobException if a fatal job exception is seen before event 'name'
+      (default=True)
+    :rtype: EventWaitManyFuture
+    """
+    return EventWaitManyFuture(
+        flux_handle, jobids, name, raiseJobException=raiseJobException
+    )
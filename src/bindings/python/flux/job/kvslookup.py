@@ -13,7 +13,7 @@ import json
 from _flux._core import ffi, lib
 from flux.future import WaitAllFuture
 from flux.job import JobID, JobspecV1
-from flux.job.event import EventLogEvent
+from flux.job.event import parse_eventlog
 from flux.rpc import RPC
 
 
@@ -79,11 +79,9 @@ def _get_updated_jobspec(job_data):
     else:
         data = job_data["jobspec"]
     jobspec = JobspecV1(**data)
-    for entry in job_data["eventlog"].splitlines():
-        event = EventLogEvent(entry)
-        if event.name == "jobspec-update":
-            for key, value in event.context.items():
-                jobspec.setattr(key, value)
+    for event in parse_eventlog(job_data["eventlog"], names=["jobspec-update"]):
+        for key, value in event.context.items():
+            jobspec.setattr(key, value)
     return jobspec.dumps()
 
 
@@ -9,13 +9,15 @@
 ###############################################################
 import errno
 import os
-import pwd
+import re
 
 import flux.constants
+from flux.constraint.parser import ConstraintParser
 from flux.future import WaitAllFuture
 from flux.job import JobID
 from flux.job.info import JobInfo
 from flux.rpc import RPC
+from flux.util import getpwnam, parse_datetime
 
 
 class JobListRPC(RPC):
@@ -45,9 +47,13 @@ def job_list(
     since=0.0,
     name=None,
     queue=None,
+    constraint=None,
 ):
     # N.B. an "and" operation with no values returns everything
+    extra = constraint
     constraint = {"and": []}
+    if extra:
+        constraint["and"].append(extra)
     if userid != flux.constants.FLUX_USERID_UNKNOWN:
         constraint["and"].append({"userid": [userid]})
     if name:
@@ -166,6 +172,159 @@ class JobListIdsFuture(WaitAllFuture):
         return [JobInfo(job) for job in self.get_jobs()]
 
 
+def _match_bitmask(values, masks, value):
+    bitmask = 0
+    for entry in values:
+        bitmask |= masks[entry.lower()] if isinstance(entry, str) else entry
+    return bool(bitmask & value)
+
+
+def constraint_match(constraint, job):
+    """Return True if JobInfo ``job`` matches a job-list constraint
+
+    Evaluate an RFC 31 constraint object, e.g. as returned by
+    :obj:`JobListConstraintParser`, against a single job in the same
+    way as the job-list service. ``job`` must include any attributes
+    referenced by ``constraint``.
+    """
+    inactive = flux.constants.FLUX_JOB_STATE_INACTIVE
+    for operator, values in constraint.items():
+        if operator == "and":
+            return all(constraint_match(entry, job) for entry in values)
+        if operator == "or":
+            return any(constraint_match(entry, job) for entry in values)
+        if operator == "not":
+            return not constraint_match(values[0], job)
+        if operator == "userid":
+            return flux.constants.FLUX_USERID_UNKNOWN in values or job.userid in values
+        if operator in ("name", "queue"):
+            return getattr(job, operator) in values
+        if operator == "states":
+            return _match_bitmask(values, JobList.STATES, job.state_id)
+        if operator == "results":
+            return job.state_id == inactive and _match_bitmask(
+                values, JobList.RESULTS, job.result_id
+            )
+        if operator in JobListConstraintParser.timestamps:
+            timestamp = getattr(job, operator)
+            if operator != "t_submit" and not timestamp:
+                return False
+            comparison, value = re.match(r"(<=|>=|<|>)(.*)$", values[0]).groups()
+            value = float(value)
+            return {
+                "<=": timestamp <= value,
+                ">=": timestamp >= value,
+                "<": timestamp < value,
+                ">": timestamp > value,
+            }[comparison]
+        raise ValueError(f"unknown constraint operator: {operator}")
+    return True
+
+
+class JobListConstraintParser(ConstraintParser):
+    """Constraint query parser for the job-list service
+
+    Parse an RFC 35 constraint query into an RFC 31 constraint object
+    suitable for the ``constraint`` argument of :func:`job_list` or
+    :obj:`JobList`, so that jobs are filtered by the job-list module
+    instead of by the client. Supported operators are:
+
+    ``name:NAME[,NAME,...]``
+        Match job name. This is the default for terms with no operator.
+    ``queue:QUEUE[,QUEUE,...]``
+        Match queue.
+    ``user:USER[,USER,...]`` (or ``userid:``)
+        Match username or userid.
+    ``state:STATE[,STATE,...]`` (or ``states:``)
+        Match job state or state group, e.g. ``running``, ``sched``.
+    ``result:RESULT[,RESULT,...]`` (or ``results:``)
+        Match job result, e.g. ``failed``.
+    ``t_run:OPTIME`` (or ``t_submit``, ``t_depend``, ``t_cleanup``, ``t_inactive``)
+        Compare a job timestamp, where ``OP`` is one of ``>``, ``>=``,
+        ``<``, or ``<=``, and ``TIME`` is a timestamp, or a datetime
+        or offset accepted by :func:`flux.util.parse_datetime`,
+        e.g. ``t_run:>=-1h``.
+    """
+
+    operator_map = {
+        None: "name",
+        "user": "userid",
+        "state": "states",
+        "result": "results",
+    }
+    split_values = {
+        "name": ",",
+        "queue": ",",
+        "userid": ",",
+        "states": ",",
+        "results": ",",
+    }
+
+    timestamps = ("t_submit", "t_depend", "t_run", "t_cleanup", "t_inactive")
+
+    def parse(self, query, **kw_args):
+        return self.convert(super().parse(query, **kw_args))
+
+    @staticmethod
+    def _bitmask(operator, values, masks):
+        result = 0
+        for value in values:
+            try:
+                result |= masks[value.lower()]
+            except KeyError:
+                raise ValueError(f"{operator}: invalid value '{value}'") from None
+        return [result]
+
+    @staticmethod
+    def _userid(value):
+        try:
+            return getpwnam(value).pw_uid
+        except KeyError:
+            try:
+                return int(value)
+            except ValueError:
+                raise ValueError(f"Invalid user {value} specified") from None
+
+    @staticmethod
+    def _timestamp(operator, values):
+        if len(values) != 1:
+            raise ValueError(f"{operator}: exactly one value required")
+        match = re.match(r"(<=|>=|<|>)(.+)$", values[0])
+        if not match:
+            raise ValueError(
+                f"{operator}:{values[0]}: expected comparison operator "
+                + "(>, >=, <, <=) followed by a time"
+            )
+        comparison, value = match.groups()
+        try:
+            timestamp = float(value)
+        except ValueError:
+            try:
+                timestamp = parse_datetime(value).timestamp()
+            except ValueError:
+                raise ValueError(f"{operator}: invalid time '{value}'") from None
+        return [f"{comparison}{timestamp!r}"]
+
+    def convert(self, constraint):
+        """Convert values in parsed constraint to the job-list format"""
+        result = {}
+        for operator, values in constraint.items():
+            if operator in ("and", "or", "not"):
+                values = [self.convert(entry) for entry in values]
+            elif operator == "userid":
+                values = [self._userid(value) for value in values]
+            elif operator == "states":
+                values = self._bitmask(operator, values, JobList.STATES)
+            elif operator == "results":
+                values = self._bitmask(operator, values, JobList.RESULTS)
+            elif operator in self.timestamps:
+                values = self._timestamp(operator, values)
+            elif operator not in ("name", "queue"):
+                raise ValueError(f"unsupported job-list operator '{operator}'")
+            result[operator] = values
+        return result
+
+
 class JobList:
     """User friendly class for querying lists of jobs from Flux
 
@@ -181,6 +340,9 @@ class JobList:
           not empty.
     :user: Username or userid for which to fetch jobs. Default is all users.
     :max_entries: Maximum number of jobs to return
+    :constraint: Optional RFC 31 constraint object, e.g. as returned by
+                 :obj:`JobListConstraintParser`, used to further filter jobs
+                 in the job-list service. Ignored if ``ids`` is not empty.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -203,6 +365,21 @@ class JobList:
         "timeout": flux.constants.FLUX_JOB_RESULT_TIMEOUT,
     }
 
+    #  Default columns returned by JobList.columns(), with the value
+    #  substituted for each when the attribute is not set for a job:
+    COLUMNS = {
+        "id": 0,
+        "userid": 0,
+        "state": 0,
+        "result": 0,
+        "t_submit": 0.0,
+        "t_run": 0.0,
+        "t_cleanup": 0.0,
+        "t_inactive": 0.0,
+        "ncores": 0,
+        "nnodes": 0,
+    }
+
     def __init__(
         self,
         flux_handle,
@@ -214,6 +391,7 @@ class JobList:
         since=0.0,
         name=None,
         queue=None,
+        constraint=None,
     ):
         self.handle = flux_handle
         self.attrs = list(attrs)
@@ -223,6 +401,7 @@ class JobList:
         self.since = since
         self.name = name
         self.queue = queue
+        self.constraint = constraint
         self.ids = list(map(JobID, ids)) if ids else None
         self.errors = []
         for fname in filters:
@@ -238,7 +417,7 @@ class JobList:
             self.userid = flux.constants.FLUX_USERID_UNKNOWN
         else:
             try:
-                self.userid = pwd.getpwnam(user).pw_uid
+                self.userid = getpwnam(user).pw_uid
             except KeyError:
                 try:
                     self.userid = int(user)
@@ -255,7 +434,7 @@ class JobList:
         else:
             raise ValueError(f"Invalid filter specified: {fname}")
 
-    def fetch_jobs(self):
+    def fetch_jobs(self, attrs=None):
         """Initiate the JobList query to the Flux job-info module
 
         JobList.fetch_jobs() returns a JobListRPC or JobListIdsFuture,
@@ -264,24 +443,64 @@ class JobList:
         Once the Future has been fulfilled, a list of JobInfo objects
         can be obtained via JobList.jobs(). If JobList.errors is non-empty,
         then it will contain a list of errors returned via the query.
+
+        If ``attrs`` is set, it overrides the list of attributes passed
+        to the JobList constructor for this query.
         """
+        if attrs is None:
+            attrs = self.attrs
         if self.ids:
             listids = JobListIdsFuture()
             for jobid in self.ids:
-                listids.push(job_list_id(self.handle, jobid, self.attrs))
+                listids.push(job_list_id(self.handle, jobid, attrs))
             return listids
         return job_list(
             self.handle,
             max_entries=self.max_entries,
-            attrs=self.attrs,
+            attrs=attrs,
             userid=self.userid,
             states=self.states,
             results=self.results,
             since=self.since,
             name=self.name,
             queue=self.queue,
+            constraint=self.constraint,
         )
 
+    def match(self, job):
+        """Return True if JobInfo ``job`` matches the filters of this JobList
+
+        The filters are evaluated in the same way as by the job-list
+        service, so this method may be used to check if a job fetched
+        individually, e.g. after it changed state, would be included in
+        the results of this query. ``job`` must include the ``userid``,
+        ``state``, ``result``, ``t_inactive`` attributes, and any other
+        attributes used by the name, queue, or constraint filters.
+        """
+        if self.ids:
+            return job.id in self.ids
+        inactive = flux.constants.FLUX_JOB_STATE_INACTIVE
+        if (
+            self.userid != flux.constants.FLUX_USERID_UNKNOWN
+            and job.userid != self.userid
+        ):
+            return False
+        if self.name and job.name != self.name:
+            return False
+        if self.queue and job.queue != self.queue:
+            return False
+        if self.states or self.results:
+            if not (
+                job.state_id & self.states
+                or (job.state_id == inactive and job.result_id & self.results)
+            ):
+                return False
+        if job.state_id == inactive and job.t_inactive <= self.since:
+            return False
+        if self.constraint:
+            return constraint_match(self.constraint, job)
+        return True
+
     def jobs(self):
         """Synchronously fetch a list of JobInfo objects from JobList query
 
@@ -295,3 +514,161 @@ class JobList:
         if hasattr(rpc, "errors"):
             self.errors = rpc.errors
         return [JobInfo(job) for job in jobs]
+
+    def _fetch_page(self, max_entries, states, results, attrs, t_inactive=None):
+        constraint = self.constraint
+        if t_inactive is not None:
+            cursor = {"t_inactive": [f"<={t_inactive!r}"]}
+            constraint = {"and": [constraint, cursor]} if constraint else cursor
+        return job_list(
+            self.handle,
+            max_entries=max_entries,
+            attrs=attrs,
+            userid=self.userid,
+            states=states,
+            results=results,
+            since=self.since,
+            name=self.name,
+            queue=self.queue,
+            constraint=constraint,
+        )
+
+    def pages(self, page_size=1000, max_query_size=None):
+        """Generator which fetches JobList query results in pages
+
+        Yield lists of at most ``page_size`` JobInfo objects, in the same
+        order as :meth:`jobs`, until ``max_entries`` jobs have been returned
+        or there are no more matching jobs. Unlike :meth:`jobs`, only the
+        results of one query are held in memory at a time, so this method
+        may be used to process arbitrarily many jobs with ``max_entries=0``.
+
+        Active jobs are fetched in one query, since their order changes
+        as jobs are scheduled. Inactive jobs are then fetched in a series
+        of queries, using the ``t_inactive`` of the last job returned as
+        a cursor for the next query. The next query is sent before the
+        current results are yielded, so it is fetched while the caller
+        processes the current page.
+
+        The job-list service scans inactive jobs from the most recent one
+        up to the cursor for each query, so the cost of a query grows with
+        the number of jobs already returned. To avoid quadratic cost, the
+        query size starts at ``page_size`` and doubles with each query, up
+        to ``max_query_size`` (default: 64 times ``page_size``). A larger
+        ``max_query_size`` reduces the work done by the job-list service,
+        at the expense of holding more results in memory at once.
+
+        If ``ids`` were given, all jobs are returned in a single page.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be greater than zero")
+        if max_query_size is None:
+            max_query_size = 64 * page_size
+        max_query_size = max(max_query_size, page_size)
+        if self.ids:
+            yield self.jobs()
+            return
+
+        active = flux.constants.FLUX_JOB_STATE_ACTIVE
+        inactive = flux.constants.FLUX_JOB_STATE_INACTIVE
+        limit = self.max_entries
+        count = 0
+
+        #  Mirror the filter semantics of job_list(), i.e. jobs matching
+        #  any requested state or result, or all jobs if neither is given:
+        if self.states or self.results:
+            active_states = self.states & active
+        else:
+            active_states = active
+        if self.states & inactive or not (self.states or self.results):
+            inactive_filter = (inactive, 0)
+        else:
+            inactive_filter = (0, self.results)
+
+        active_jobs = []
+        if active_states:
+            rpc = self._fetch_page(limit, active_states, 0, self.attrs)
+            active_jobs = rpc.get_jobs()
+            count = len(active_jobs)
+
+        attrs = self.attrs
+        if "all" not in attrs and "t_inactive" not in attrs:
+            attrs = attrs + ["t_inactive"]
+
+        cursor = None
+        #  ids of jobs already returned with t_inactive == cursor, which
+        #  will be returned again by the next query:
+        seen = set()
+        query_size = page_size
+
+        def fetch_next():
+            nonlocal query_size
+            if not any(inactive_filter) or (limit and count >= limit):
+                return None, 0
+            size = query_size
+            query_size = min(query_size * 2, max_query_size)
+            if limit:
+                size = min(size, limit - count)
+            size += len(seen)
+            return self._fetch_page(size, *inactive_filter, attrs, cursor), size
+
+        rpc, size = fetch_next()
+
+        for index in range(0, len(active_jobs), page_size):
+            yield [JobInfo(job) for job in active_jobs[index : index + page_size]]
+        del active_jobs
+
+        while rpc is not None:
+            response = rpc.get_jobs()
+            jobs = [job for job in response if job["id"] not in seen]
+            if limit:
+                jobs = jobs[: limit - count]
+            count += len(jobs)
+            if jobs:
+                t_last = jobs[-1]["t_inactive"]
+                if t_last != cursor:
+                    seen = set()
+                    cursor = t_last
+                seen.update(job["id"] for job in jobs if job["t_inactive"] == cursor)
+            rpc = None
+            if len(response) == size:
+                rpc, size = fetch_next()
+            for index in range(0, len(jobs), page_size):
+                yield [JobInfo(job) for job in jobs[index : index + page_size]]
+            del jobs, response
+
+    def columns(self, fields=None, numpy=False):
+        """Synchronously fetch JobList query results in columnar form
+
+        Return a dict mapping each attribute in ``fields`` to a list of
+        values, one per job, in the order returned by the query. The
+        columns are built directly from the job-list response, without
+        creating a JobInfo object per job, which is much more efficient
+        for bulk analysis of large numbers of jobs.
+
+        Only ``fields`` are requested from the job-list service. If a job
+        does not have a value for an attribute, e.g. ``t_run`` for a job
+        that never ran, the default from ``JobList.COLUMNS`` is used, or
+        an empty string for attributes not listed there. Note that
+        ``state`` and ``result`` are the numeric state and result ids.
+
+        Args:
+            fields (list): attributes to return (default: the keys of
+                ``JobList.COLUMNS``)
+            numpy (bool): If True, return each column as a NumPy array.
+                Raises ImportError if NumPy is not installed.
+        """
+        if fields is None:
+            fields = list(self.COLUMNS)
+        if numpy:
+            import numpy as np
+        attrs = [field for field in fields if field != "id"]
+        rpc = self.fetch_jobs(attrs=attrs)
+        jobs = rpc.get_jobs()
+        if hasattr(rpc, "errors"):
+            self.errors = rpc.errors
+        result = {}
+        for field in fields:
+            default = self.COLUMNS.get(field, "")
+            column = [job.get(field, default) for job in jobs]
+            result[field] = np.array(column) if numpy else column
+        return result
@@ -8,11 +8,18 @@
 # SPDX-License-Identifier: LGPL-3.0
 ###############################################################
 
+import atexit
 import base64
 import errno
+import json
+import os
+import threading
+from collections import deque
+from functools import lru_cache
 from typing import NamedTuple
 
-from flux.future import FutureExt
+from flux.core.inner import ffi
+from flux.future import Future, FutureExt
 from flux.idset import IDset
 from flux.job import (
     EventLogEvent,
@@ -21,9 +28,19 @@ from flux.job import (
     event_wait,
     event_watch,
     event_watch_async,
+    job_info_lookup,
     job_kvs_lookup,
+    parse_eventlog,
 )
 
+# Maximum number of buffers passed to a single os.writev() call:
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
 # Log levels from shell.h for use with log_stderr_level:
 LOG_QUIET = -1
 LOG_FATAL = 0
@@ -54,7 +71,7 @@ class Taskset:
         if isinstance(tasks, Taskset):
             # Copy an existing Taskset
             self.all = tasks.all
-            self.ids = tasks.ids.copy()
+            self.ids = None if tasks.all else tasks.ids.copy()
             return
         if isinstance(tasks, IDset):
             self.ids = tasks.copy()
@@ -83,25 +100,46 @@ class Taskset:
         return str(self.ids)
 
 
+@lru_cache(maxsize=1024)
+def _taskset(ranks):
+    """
+    Return a shared Taskset for the idset string ``ranks``. Output events
+    from a job typically use only a few distinct rank strings, so this
+    avoids creating an IDset for every event.
+    """
+    return Taskset(ranks)
+
+
+@lru_cache(maxsize=1024)
+def _tasks_intersect(ranks, tasks):
+    """Return True if idset string ``ranks`` intersects Taskset ``tasks``"""
+    if tasks.all:
+        return True
+    return bool(_taskset(ranks).intersect(tasks))
+
+
 class OutputEvent(EventLogEvent):
     """
     Object representing RFC 24 Job Standard I/O data events
     Attributes:
         timestamp (float): timestamp for this event
         name (str): Name of this event: 'data'
-        rank (Taskset): Set of ranks to which this event applies
+        rank (Taskset): Set of ranks to which this event applies. This
+            Taskset may be shared with other events and should not be
+            modified.
         stream (str): name of output stream ("stdout", "stderr")
         eof (bool): True if this event marks EOF for stream
-        data (str): output data
+        data (str, bytes): output data. If ``binary`` is True, data is
+            bytes, otherwise it is decoded to str.
         dict (dict): original event as dict
     """
 
-    def __init__(self, entry, labelio=False):
+    def __init__(self, entry, labelio=False, binary=False):
         super().__init__(entry)
         if self.name != "data":
             raise ValueError(f"event {self.name} is not a data event")
 
-        self.rank = Taskset(self.context["rank"])
+        self.rank = _taskset(self.context["rank"])
         self.stream = self.context["stream"]
         self.data = None
         self.eof = False
@@ -111,16 +149,29 @@ class OutputEvent(EventLogEvent):
 
         if "data" in self.context:
             data = self.context["data"]
-            if "encoding" in self.context:
-                if self.context["encoding"] == "base64":
-                    data = base64.b64decode(data)
+            if self.context.get("encoding") == "base64":
+                data = base64.b64decode(data)
+                if not binary:
+                    data = data.decode("utf-8", errors="replace")
+            elif binary:
+                data = data.encode("utf-8", errors="surrogateescape")
             if "repeat" in self.context:
                 data *= self.context["repeat"]
             if labelio:
-                data = [f"{self.rank}: {x}" for x in data.splitlines()]
-                data = "\n".join(data) + "\n"
+                data = self._label(data, f"{self.rank}: ")
             self.data = data
 
+    @staticmethod
+    def _label(data, prefix):
+        newline = "\n"
+        if isinstance(data, bytes):
+            prefix = prefix.encode()
+            newline = b"\n"
+        lines = data.splitlines()
+        if not lines:
+            return newline
+        return prefix + (newline + prefix).join(lines) + newline
+
     def render(self):
         return self.data
 
@@ -162,7 +213,7 @@ class LogEvent(EventLogEvent):
         if self.name != "log":
             raise ValueError(f"event {self.name} is not a log event")
         self.level = self.context["level"]
-        self.rank = Taskset(self.context["rank"])
+        self.rank = _taskset(self.context["rank"])
         self.message = self.context["message"]
         self.component = self.context.get("component", None)
         self.file = self.context.get("file", None)
@@ -221,7 +272,7 @@ class RedirectEvent(EventLogEvent):
         if self.name != "redirect":
             raise ValueError("event {self.name} is not a redirect event")
         self.stream = self.context["stream"]
-        self.rank = Taskset(self.context["rank"])
+        self.rank = _taskset(self.context["rank"])
         self.path = self.context["path"]
 
     def render(self):
@@ -258,9 +309,9 @@ class JobOutput(NamedTuple):
     """
     Tuple containing job output result
     Attributes:
-        stdout (str): stdout from all tasks
-        stderr (str): stderr from all tasks
-        log (str): log messages
+        stdout (str, bytes): stdout from all tasks
+        stderr (str, bytes): stderr from all tasks
+        log (str, bytes): log messages
     """
 
     stdout: str
@@ -268,7 +319,7 @@ class JobOutput(NamedTuple):
     log: str
 
 
-def _parse_output_eventlog_entry(entry, labelio=False):
+def _parse_output_eventlog_entry(entry, labelio=False, binary=False):
     """
     Parse a single output eventlog entry, returning an object of the
     appropriate type: OutputEvent, LogEvent, OutputHeaderEvent,
@@ -282,7 +333,7 @@ def _parse_output_eventlog_entry(entry, labelio=False):
         event = EventLogEvent(entry)
     name = event.name
     if name == "data":
-        return OutputEvent(event, labelio)
+        return OutputEvent(event, labelio, binary)
     elif name == "log":
         return LogEvent(event)
     elif name == "header":
@@ -296,43 +347,64 @@ def _parse_output_eventlog_entry(entry, labelio=False):
 
 
 def _output_eventlog_entry_decode(
-    entry, stream_dict, tasks, labelio=False, log_stderr_level=LOG_TRACE
+    entry,
+    stream_dict,
+    tasks,
+    labelio=False,
+    log_stderr_level=LOG_TRACE,
+    binary=False,
 ):
     """
     Decode RFC 24 output eventlog entry ``entry``, appending the result
     to the stream_dict[stream_name] list if the entry is in the set of
     requested ``tasks``. If stream_dict[stream_name] does not exist,
-    the entry will be created.
+    the entry will be created. If ``binary`` is True, the result is bytes.
     """
     if not isinstance(tasks, Taskset):
         raise ValueError("tasks argument must be a Taskset, got " + type(tasks))
-    event = _parse_output_eventlog_entry(entry, labelio)
+    if isinstance(entry, str):
+        entry = json.loads(entry)
 
+    #  Fast path: skip decoding data events for unselected tasks
+    if entry["name"] == "data" and not tasks.all:
+        if not _tasks_intersect(entry["context"]["rank"], tasks):
+            return
+    event = _parse_output_eventlog_entry(entry, labelio, binary)
+    _output_event_append(event, stream_dict, tasks, log_stderr_level, binary)
+
+
+def _output_event_append(
+    event, stream_dict, tasks, log_stderr_level=LOG_TRACE, binary=False
+):
+    """
+    Append the rendered output of parsed output event ``event`` to
+    stream_dict[stream_name] if applicable.
+    """
     #  Determine stream name of this event:
     stream = None
     if event.name == "data":
-        if event.rank.intersect(tasks):
-            stream = event.stream
+        if not tasks.all and not event.rank.intersect(tasks):
+            return
+        stream = event.stream
     elif event.name == "log":
         if event.level <= log_stderr_level:
             stream = "stderr"
         else:
             stream = "log"
-    elif event.name in "exception":
-        if event.rank.intersect(tasks):
-            stream = "stderr"
     elif event.name == "exception":
         stream = "stderr"
     else:
         return
 
     text = event.render()
+    if binary and isinstance(text, str):
+        text = text.encode("utf-8", errors="surrogateescape")
     if text:
         stream_dict.setdefault(stream, []).append(text)
 
 
 def _parse_output_eventlog(
-    eventlog, tasks="*", labelio=False, log_stderr_level=LOG_TRACE
+    eventlog, tasks="*", labelio=False, log_stderr_level=LOG_TRACE, binary=False
 ):
     """
     Given an eventlog, return a JobOutput tuple with stdout, stderr,
@@ -341,13 +413,19 @@ def _parse_output_eventlog(
     stream_dict = {"stdout": [], "stderr": [], "log": []}
     tasks = Taskset(tasks)
 
-    for line in eventlog.splitlines():
+    #  Decode all entries in the eventlog with a single call to json.loads()
+    entries = json.loads("[" + ",".join(filter(None, eventlog.splitlines())) + "]")
+    for entry in entries:
         _output_eventlog_entry_decode(
-            line, stream_dict, tasks, labelio, log_stderr_level
+            entry, stream_dict, tasks, labelio, log_stderr_level, binary
         )
+    return _join_output(stream_dict, binary)
 
-    # Join lines and return result
-    results = ["".join(stream_dict.get(k)) for k in ("stdout", "stderr", "log")]
+
+def _join_output(stream_dict, binary=False):
+    """Join the output in stream_dict and return a JobOutput tuple"""
+    empty = b"" if binary else ""
+    results = [empty.join(stream_dict[k]) for k in ("stdout", "stderr", "log")]
     return JobOutput(*results)
 
 
@@ -358,6 +436,7 @@ def job_output(
     labelio=False,
     nowait=False,
     log_stderr_level=LOG_TRACE,
+    binary=False,
 ):
     """
     Synchronously fetch output for a job.
@@ -382,6 +461,9 @@ def job_output(
     ``stderr``. To separate all log messages in the ``log`` stream, set
     ``log_stderr_level=-1`` (``LOG_QUIET``).
 
+    If ``binary`` is True, then output is returned as bytes exactly as
+    written by the job, without decoding to str.
+
     Args:
         flux_handle (Flux): Flux handle
         jobid (int, JobID, str): target jobid
@@ -389,6 +471,7 @@ def job_output(
         labelio (bool): prefix lines of output with source task rank
         log_stderr_level (int): combine log messages at or below level with
             stderr (default=LOG_TRACE)
+        binary (bool): return output as bytes (default=False)
     Returns:
         JobOutput: JobOutput tuple containing output for ``stdout``,
             ``stderr``, and ``log`` streams.
@@ -405,7 +488,7 @@ def job_output(
             msg = f"job {jobid} does not exist or output not ready"
             raise FileNotFoundError(msg)
         return _parse_output_eventlog(
-            eventlog["guest.output"], tasks, labelio, log_stderr_level
+            eventlog["guest.output"], tasks, labelio, log_stderr_level, binary
         )
 
     stream_dict = {"stdout": [], "stderr": [], "log": []}
@@ -427,24 +510,29 @@ def job_output(
     #  Output eventlog is ready, synchronously gather all output
     for event in event_watch(flux_handle, jobid, "guest.output"):
         _output_eventlog_entry_decode(
-            event, stream_dict, tasks, labelio, log_stderr_level
+            event, stream_dict, tasks, labelio, log_stderr_level, binary
         )
 
     #  Join lines and return JobOutput result
-    results = ["".join(stream_dict.get(k)) for k in ("stdout", "stderr", "log")]
-    return JobOutput(*results)
+    return _join_output(stream_dict, binary)
 
 
-class JobOutputEventWatch(FutureExt):
+class _JobOutputWatchBase(FutureExt):
     """
-    A class for watching job output events.
-
-    See output_watch_events_async() for full documentation.
+    Single-layer engine for watching job output.
+
+    Watch the main, exec, and output eventlogs of a job directly and
+    parse each output eventlog entry exactly once. Results are passed
+    to the caller through an in-process queue instead of being encoded
+    into the payload of this Future: each result of the Future is an
+    empty token which corresponds to the entry at the head of the queue.
+    Subclasses transform parsed events in :meth:`_process_event`.
     """
 
-    def __init__(self, flux_handle, jobid, labelio=False, nowait=False):
+    def __init__(self, flux_handle, jobid, labelio=False, nowait=False, binary=False):
         self.labelio = labelio
         self.nowait = nowait
+        self.binary = binary
 
         #  Capture when 'start' and 'finish' events have been posted to
         #  the main eventlog:
@@ -454,18 +542,44 @@ class JobOutputEventWatch(FutureExt):
         #  Capture when the end of the output eventlog has been reached
         #  (indicated by None returned from watching the eventlog)
         self.closed = False
+
+        #  Results not yet consumed by the caller. The head of the queue
+        #  is the current result of this Future, if it is ready.
+        self._queue = deque()
         super().__init__(self._watch_init, JobID(jobid), flux_handle=flux_handle)
 
-    def get_event(self, autoreset=True):
-        event = self.get()
-        if event is None:
-            return None
-        if autoreset:
-            self.reset()
-        return _parse_output_eventlog_entry(event, labelio=self.labelio)
+    def _put(self, value):
+        self._queue.append(value)
+        self.pimpl.fulfill(ffi.NULL, ffi.NULL)
+
+    def _put_error(self, errnum, errstr):
+        #  Errors are queued in order with results, so that any results
+        #  queued before the error are still delivered.
+        self._put(OSError(errnum, errstr))
+
+    def _process_event(self, event):
+        """Queue a parsed output event or None at the end of output"""
+        self._put(event)
+
+    def get(self):
+        """
+        Return the current result of this Future, blocking until one is
+        available. Raise OSError if the result is an error.
+        """
+        Future.get(self)
+        value = self._queue[0]
+        if isinstance(value, OSError):
+            raise OSError(value.errno, value.strerror)
+        return value
+
+    def reset(self):
+        #  Consume the current result, if any:
+        if self._queue and self.is_ready():
+            self._queue.popleft()
+        super().reset()
 
     def _watch_output(self, future):
-        #  Watch output events and propagate to output_watch_future.
+        #  Watch output events, parse them, and pass to _process_event()
         #
         #  Note: handle and propagate OSError from future.get_event() for
         #  reasons noted in wait_for_start_event() below.
@@ -486,11 +600,13 @@ class JobOutputEventWatch(FutureExt):
                 #  eventlog is already being monitored.
                 #
                 if self.nowait or self.finished:
-                    self.fulfill()
+                    self._process_event(None)
                 return
-            self.fulfill(event)
+            self._process_event(
+                _parse_output_eventlog_entry(event, self.labelio, self.binary)
+            )
         except OSError as exc:
-            self.fulfill_error(exc.errno, exc.strerror)
+            self._put_error(exc.errno, exc.strerror)
 
         if event is not None:
             future.reset()
@@ -506,7 +622,7 @@ class JobOutputEventWatch(FutureExt):
         try:
             event = future.get_event()
         except OSError as exc:
-            self.fulfill_error(exc.errno, exc.strerror)
+            self._put_error(exc.errno, exc.strerror)
 
         if event is not None and event.name == "shell.init":
             event_watch_async(
@@ -530,7 +646,7 @@ class JobOutputEventWatch(FutureExt):
             if exc.errno == errno.ENOENT:
                 # Translate strerror to more helpful string:
                 exc.strerror = f"job {jobid} not found"
-            self.fulfill_error(exc.errno, exc.strerror)
+            self._put_error(exc.errno, exc.strerror)
             return
         if event is None:
             #  If the eventlog ended without a start event, then the output
@@ -548,15 +664,13 @@ class JobOutputEventWatch(FutureExt):
             #  unhandled exception will terminate the reactor.
             #
             if not self.started:
-                self.fulfill_error(
-                    errnum=errno.EIO, errstr=f"job {jobid} never started"
-                )
+                self._put_error(errno.EIO, f"job {jobid} never started")
             return
         if event.name == "exception":
             #  Emit a JobExceptionEvent in the output since expectation is
             #  than an exception message will appear on stderr:
             #
-            self.fulfill(event)
+            self._process_event(JobExceptionEvent(event))
         elif event.name == "start":
             #  Note that we've seen a 'start' event and proceed to watch the
             #  exec eventlog for the 'shell.init' event:
@@ -577,7 +691,7 @@ class JobOutputEventWatch(FutureExt):
             #  and any exceptions before the finish event have been captured.
             #
             if self.closed:
-                self.fulfill()
+                self._process_event(None)
 
     def _watch_init(self, future, jobid):
         if self.nowait:
@@ -595,7 +709,23 @@ class JobOutputEventWatch(FutureExt):
             )
 
 
-class JobOutputWatch(FutureExt):
+class JobOutputEventWatch(_JobOutputWatchBase):
+    """
+    A class for watching job output events.
+
+    See output_watch_events_async() for full documentation.
+    """
+
+    def get_event(self, autoreset=True):
+        event = self.get()
+        if event is None:
+            return None
+        if autoreset:
+            self.reset()
+        return event
+
+
+class JobOutputWatch(_JobOutputWatchBase):
     """
     A class for watching job output.
 
@@ -609,60 +739,34 @@ class JobOutputWatch(FutureExt):
         labelio=False,
         log_stderr_level=LOG_TRACE,
         nowait=False,
+        binary=False,
     ):
-        self.labelio = labelio
         self.log_stderr_level = log_stderr_level
-        self.nowait = nowait
-        super().__init__(self._watch_init, JobID(jobid), flux_handle=flux_handle)
+        super().__init__(
+            flux_handle, jobid, labelio=labelio, nowait=nowait, binary=binary
+        )
 
-    def _watch_init(self, future, jobid):
-        #  Start watching job output events. The `output_event_watch`
-        #  callback will then process these events and fulfill this Future
-        #  as lines of stdout, stderr, or log output arrive.
-        #
-        flux_handle = future.get_flux()
-        JobOutputEventWatch(
-            flux_handle, jobid, labelio=self.labelio, nowait=self.nowait
-        ).then(self._output_event_watch)
+    def _put_output(self, stream, data):
+        self._put((stream, data))
 
-    def _fulfill_output(self, event):
+    def _process_event(self, event):
+        #  Only propagate events that will result in one or more lines of
+        #  output. "redirect" and "exception" events result in an
+        #  informational message to stderr, so they are propagated as well.
+        #
         if event is None:
-            self.fulfill((None, None))
-            return
-        if event.name == "data" and event.data is not None:
-            self.fulfill((event.stream, event.render()))
+            self._put_output(None, None)
+        elif event.name == "data":
+            if event.data is not None:
+                self._put_output(event.stream, event.render())
         elif event.name in ("log", "redirect", "exception"):
             stream = "stderr"
             if event.name == "log" and event.level > self.log_stderr_level:
                 stream = "log"
-            self.fulfill((stream, event.render() + "\n"))
-
-    def _output_event_watch(self, future):
-        #   Output event watch callback.
-        #
-        #   Note: Use a try/except block here to handle the case where
-        #   the underlying output_event_watch_async() future is fulfilled
-        #   with an error (future.get_event() raises an OSError in this case)
-        #   If an OSError is raised, then error is simply propagated to the
-        #   output_watch_future (which was returned to the user)
-        #
-        try:
-            #  Get event and only propagate events that will result in one
-            #  or more lines of output. "redirect" and "exception" events
-            #  result in an informational message to stderr (see getline())
-            #  so they are propagated as well:
-            #
-            event = future.get_event()
-            if (
-                event is None
-                or (event.name == "data" and event.data is not None)
-                or (event.name == "log")
-                or (event.name == "redirect")
-                or (event.name == "exception")
-            ):
-                self._fulfill_output(event)
-        except OSError as exc:
-            self.fulfill_error(exc.errno, exc.strerror)
+            text = event.render() + "\n"
+            if self.binary:
+                text = text.encode("utf-8", errors="surrogateescape")
+            self._put_output(stream, text)
 
     def get_output(self):
         """
@@ -677,7 +781,7 @@ class JobOutputWatch(FutureExt):
         return result
 
 
-class JobOutputWatchLines(FutureExt):
+class JobOutputWatchLines(JobOutputWatch):
     """
     A class for watching lines of job output.
 
@@ -693,38 +797,22 @@ class JobOutputWatchLines(FutureExt):
         nowait=False,
         keepends=False,
     ):
-        self.labelio = labelio
-        self.log_stderr_level = log_stderr_level
-        self.nowait = nowait
         self.keepends = keepends
-        super().__init__(self._watch_lines_init, JobID(jobid), flux_handle=flux_handle)
-
-    def _watch_lines_init(self, future, jobid):
-        #  Start watching job output events. The `output_event_watch`
-        #  callback will then process these events and fulfill this Future
-        #  as lines of stdout, stderr, or log output arrive.
-        #
-        flux_handle = future.get_flux()
-        JobOutputWatch(
+        super().__init__(
             flux_handle,
             jobid,
-            labelio=self.labelio,
-            log_stderr_level=self.log_stderr_level,
-            nowait=self.nowait,
-        ).then(self._output_watch_cb)
+            labelio=labelio,
+            log_stderr_level=log_stderr_level,
+            nowait=nowait,
+        )
 
-    def _output_watch_cb(self, future):
+    def _put_output(self, stream, data):
         #  Split data into multiple lines and fulfill future once per line
-        try:
-            stream, lines = future.get_output()
-        except OSError as exc:
-            self.fulfill_error(exc.errno, exc.strerror)
+        if data is None:
+            self._put((None, None))
             return
-        if lines is not None:
-            for line in lines.splitlines(keepends=self.keepends):
-                self.fulfill((stream, line))
-        else:
-            self.fulfill((None, None))
+        for line in data.splitlines(keepends=self.keepends):
+            self._put((stream, line))
 
     def getline(self):
         """
@@ -734,9 +822,7 @@ class JobOutputWatchLines(FutureExt):
 
         When no more output is available, (None, None) will be returned.
         """
-        result = self.get()
-        self.reset()
-        return result
+        return self.get_output()
 
 
 def output_event_watch_async(flux_handle, jobid, labelio=False, nowait=False):
@@ -770,6 +856,7 @@ def output_watch_async(
     labelio=False,
     log_stderr_level=LOG_TRACE,
     nowait=False,
+    binary=False,
 ):
     """
     Asynchronously get output data for a job.
@@ -795,6 +882,8 @@ def output_watch_async(
             log messages are copied to stderr)
         nowait (bool): Assume output eventlog already exists and skip watching
             precursor eventlogs.
+        binary (bool): Return output data as bytes instead of str, e.g. for
+            use with :func:`write_output`. (default=False)
     Returns:
         JobOutputWatch: JobOutputWatch Future
     """
@@ -804,6 +893,7 @@ def output_watch_async(
         labelio=labelio,
         log_stderr_level=log_stderr_level,
         nowait=nowait,
+        binary=binary,
     )
 
 
@@ -895,6 +985,7 @@ def output_watch(
     labelio=False,
     log_stderr_level=LOG_TRACE,
     nowait=False,
+    binary=False,
 ):
     """
     Synchronously fetch job output via a generator.
@@ -915,6 +1006,7 @@ def output_watch(
             all log messages are sent to stderr)
         nowait (bool): If True, assume output eventlog already exists and skip
             watching precursor eventlogs.
+        binary (bool): If True, return output data as bytes instead of str.
     """
     jobid = JobID(jobid)
     watcher = output_watch_async(
@@ -923,6 +1015,7 @@ def output_watch(
         labelio=labelio,
         log_stderr_level=log_stderr_level,
         nowait=nowait,
+        binary=binary,
     )
     stream, data = watcher.get_output()
     while data is not None:
@@ -980,3 +1073,338 @@ def output_watch_lines(
     while line is not None:
         yield stream, line
         stream, line = watcher.getline()
+
+
+class _JobOutputs:
+    """
+    Concurrently collect output for many jobs. See job_outputs().
+    """
+
+    def __init__(
+        self,
+        flux_handle,
+        jobids,
+        tasks="*",
+        labelio=False,
+        log_stderr_level=LOG_TRACE,
+        binary=False,
+        sink=None,
+        max_active=256,
+    ):
+        self.handle = flux_handle
+        self.pending = deque(JobID(jobid) for jobid in jobids)
+        self.tasks = Taskset(tasks)
+        self.labelio = labelio
+        self.log_stderr_level = log_stderr_level
+        self.binary = binary
+        self.sink = sink
+        self.max_active = max(1, max_active)
+        self.active = 0
+        self.results = {}
+
+    def run(self):
+        self._start()
+        if self.active:
+            self.handle.reactor_run()
+        return self.results
+
+    def _start(self):
+        while self.pending and self.active < self.max_active:
+            jobid = self.pending.popleft()
+            self.active += 1
+            job_info_lookup(self.handle, jobid, keys=["eventlog", "guest.output"]).then(
+                self._lookup_cb, jobid
+            )
+
+    def _complete(self, jobid, result):
+        if self.sink is not None:
+            self.sink(jobid, result)
+        else:
+            self.results[jobid] = result
+        self.active -= 1
+        self._start()
+        if self.active == 0:
+            self.handle.reactor_stop()
+
+    def _lookup_cb(self, future, jobid):
+        #  If the job has finished, its output eventlog is complete and can
+        #  be parsed directly. Otherwise (including when the output eventlog
+        #  does not exist yet), watch the output eventlog until it is done.
+        try:
+            data = future.get()
+            finished = bool(parse_eventlog(data["eventlog"], names=["finish"]))
+        except OSError:
+            finished = False
+        if not finished:
+            self._watch(jobid)
+            return
+        output = _parse_output_eventlog(
+            data["guest.output"],
+            self.tasks,
+            self.labelio,
+            self.log_stderr_level,
+            self.binary,
+        )
+        self._complete(jobid, output)
+
+    def _watch(self, jobid):
+        stream_dict = {"stdout": [], "stderr": [], "log": []}
+        JobOutputEventWatch(
+            self.handle, jobid, labelio=self.labelio, binary=self.binary
+        ).then(self._watch_cb, jobid, stream_dict, [])
+
+    def _watch_cb(self, future, jobid, stream_dict, exceptions):
+        try:
+            while True:
+                event = future.get_event()
+                if event is None:
+                    future.stop()
+                    self._complete(jobid, _join_output(stream_dict, self.binary))
+                    return
+                if event.name == "exception":
+                    #  As with job_output(), exceptions are not included
+                    #  in the output, but a fatal exception is reported
+                    #  if the job never started (see below)
+                    if event.severity == 0:
+                        exceptions.append(event)
+                else:
+                    _output_event_append(
+                        event,
+                        stream_dict,
+                        self.tasks,
+                        self.log_stderr_level,
+                        self.binary,
+                    )
+                if not future.is_ready():
+                    return
+        except OSError as exc:
+            future.stop()
+            #  As with job_output(), report a fatal exception which
+            #  prevented the job from starting as a JobException:
+            if exc.errno == errno.EIO and exceptions:
+                exc = JobException(exceptions[0])
+            self._complete(jobid, exc)
+
+
+def job_outputs(
+    flux_handle,
+    jobids,
+    tasks="*",
+    labelio=False,
+    log_stderr_level=LOG_TRACE,
+    binary=False,
+    sink=None,
+    max_active=256,
+):
+    """
+    Concurrently fetch output for many jobs.
+
+    This is the bulk equivalent of :func:`job_output`. Instead of waiting
+    for each job in turn, requests for up to ``max_active`` jobs are
+    outstanding at once. The complete output eventlog of finished jobs
+    is fetched from the KVS with a single lookup, while the output of
+    active jobs is watched until it is complete.
+
+    Each result is either a JobOutput tuple or, if output could not be
+    fetched for a job, the exception that :func:`job_output` would have
+    raised, e.g. :py:exc:`FileNotFoundError` for an invalid jobid or
+    :py:exc:`flux.job.JobException` for a job that never started.
+
+    If ``sink`` is set, it is called as ``sink(jobid, result)`` as the
+    result for each job becomes available and results are not retained.
+    This allows output for each job to be written out, e.g. to a per-job
+    file, as soon as it is complete.
+
+    This function runs the reactor of ``flux_handle`` until output for
+    all jobs has been collected.
+
+    Args:
+        flux_handle (Flux): Flux handle
+        jobids (iterable): jobids for which to fetch output
+        tasks (str): idset of task ranks to include in output (default=all)
+        labelio (bool): prefix lines of output with source task rank
+        log_stderr_level (int): combine log messages at or below level with
+            stderr (default=LOG_TRACE)
+        binary (bool): return output as bytes (default=False)
+        sink (callable): If set, call ``sink(jobid, result)`` for each job
+            instead of returning results.
+        max_active (int): maximum number of jobs for which output is
+            fetched concurrently (default=256)
+    Returns:
+        dict: mapping of JobID to JobOutput or exception, empty if ``sink``
+        is set.
+    """
+    return _JobOutputs(
+        flux_handle,
+        jobids,
+        tasks=tasks,
+        labelio=labelio,
+        log_stderr_level=log_stderr_level,
+        binary=binary,
+        sink=sink,
+        max_active=max_active,
+    ).run()
+
+
+def write_output(fd, chunks):
+    """
+    Write a list of bytes-like output ``chunks`` to file descriptor ``fd``
+
+    The chunks are written with as few system calls as possible using
+    :func:`os.writev`, without first joining them into a single buffer.
+    Partial writes are retried until all data has been written.
+
+    Args:
+        fd (int): file descriptor open for writing
+        chunks (list): list of bytes or memoryview objects
+    """
+    chunks = [memoryview(chunk) for chunk in chunks if chunk]
+    while chunks:
+        count = os.writev(fd, chunks[:_IOV_MAX])
+        #  Drop fully written chunks and trim a partially written one:
+        while chunks and count >= len(chunks[0]):
+            count -= len(chunks.pop(0))
+        if count:
+            chunks[0] = chunks[0][count:]
+
+
+class OutputSink:
+    """
+    Buffer output for a file and write it from a background thread
+
+    An OutputSink accepts job output for a single text file object, e.g.
+    ``sys.stdout``, and writes it from a dedicated writer thread, so that
+    a slow terminal or file system does not stall the caller, typically a
+    reactor callback. Data accumulated while the writer thread is busy is
+    written in a batch on its next iteration.
+
+    If more than ``high_water`` characters or bytes are buffered, then
+    :meth:`write` blocks until the writer thread catches up, bounding the
+    memory used by the sink.
+
+    An error from the writer thread, e.g. :py:exc:`BrokenPipeError`, is
+    raised by the next call to :meth:`write`, :meth:`flush`, or
+    :meth:`close`.
+
+    Buffered output is written at program exit if the sink has not been
+    closed explicitly.
+
+    Args:
+        stream (TextIOWrapper): file object to which output is written
+        high_water (int): maximum amount of buffered data (default=1MiB)
+    """
+
+    def __init__(self, stream, high_water=1 << 20):
+        self.stream = stream
+        self.high_water = max(1, high_water)
+        self._items = deque()
+        self._size = 0
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self._close_at_exit)
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, data, label=None):
+        """
+        Queue ``data`` to be written to the stream.
+
+        Args:
+            data (str, list): A string, or a list of bytes-like objects.
+                Bytes are written directly to the file descriptor of the
+                stream after any buffered text has been flushed.
+            label (str): If set, prefix each line of string ``data`` with
+                ``label``.
+        """
+        if isinstance(data, str):
+            size = len(data)
+        else:
+            size = sum(len(chunk) for chunk in data)
+        with self._cond:
+            while self._size >= self.high_water and self._error is None:
+                self._cond.wait()
+            self._raise_error()
+            if self._closed:
+                raise ValueError("write to closed OutputSink")
+            self._items.append((data, label, size))
+            self._size += size
+            self._cond.notify_all()
+
+    def flush(self):
+        """
+        Block until all buffered output has been written to the stream.
+        """
+        with self._cond:
+            while (self._items or self._busy) and self._error is None:
+                self._cond.wait()
+            self._raise_error()
+
+    def close(self):
+        """
+        Write all buffered output and stop the writer thread.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        atexit.unregister(self._close_at_exit)
+        self._raise_error()
+
+    def _close_at_exit(self):
+        try:
+            self.close()
+        except (OSError, ValueError):
+            pass
+
+    def _write_batch(self, items):
+        text = []
+        for data, label, _ in items:
+            if isinstance(data, str):
+                if label:
+                    data = "".join(
+                        label + line for line in data.splitlines(keepends=True)
+                    )
+                text.append(data)
+                continue
+            if text:
+                self.stream.write("".join(text))
+                text = []
+            #  Flush any buffered text to keep output ordered:
+            self.stream.flush()
+            write_output(self.stream.fileno(), data)
+        if text:
+            self.stream.write("".join(text))
+        self.stream.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait()
+                if not self._items:
+                    return
+                items = list(self._items)
+                self._items.clear()
+                self._busy = True
+            try:
+                self._write_batch(items)
+            except Exception as exc:  # pylint: disable=broad-except
+                #  Errors are raised in the calling thread instead
+                error = exc
+            else:
+                error = None
+            with self._cond:
+                self._size -= sum(size for _, _, size in items)
+                self._busy = False
+                if error is not None and self._error is None:
+                    self._error = error
+                self._cond.notify_all()
@@ -58,7 +58,12 @@ class JobStats:
             setattr(self, attr, -1)
 
     def _update_cb(self, rpc):
-        resp = rpc.get()
+        self._update(rpc.get())
+        if self.callback:
+            self.callback(self, **self.cb_kwargs)
+
+    def _update(self, resp):
+        """Update this object from a job-list.job-stats response"""
         if self.queue:
             tmpstat = None
             if resp["queues"]:
@@ -84,9 +89,6 @@ class JobStats:
         self.failed += self.timeout
         self.failed += self.canceled
 
-        if self.callback:
-            self.callback(self, **self.cb_kwargs)
-
     def _query(self):
         return RPC(self.handle, "job-list.job-stats", {})
 
@@ -8,6 +8,9 @@
 # SPDX-License-Identifier: LGPL-3.0
 ###############################################################
 import errno
+import os
+import time
+from collections import OrderedDict
 
 from _flux._core import ffi, lib
 from flux import constants
@@ -18,6 +21,87 @@ from flux.job.Jobspec import _convert_jobspec_arg_to_string
 from flux.util import check_future_error
 
 
+class SignedJobspecCache:
+    """Sign jobspecs with flux-security, reusing signatures across submissions
+
+    When a jobspec is not pre-signed, ``flux_job_submit(3)`` signs it
+    for every submission. For bulk submission of many identical jobs this
+    signing cost can dominate submission time. A SignedJobspecCache signs
+    a given jobspec once and returns the same signed payload for identical
+    jobspecs for up to ``ttl`` seconds. The result should be submitted
+    with ``pre_signed=True``, e.g.::
+
+        signer = SignedJobspecCache(h)
+        for i in range(100):
+            submit_async(h, signer.sign(jobspec), pre_signed=True)
+
+    Since the signed payload embeds a creation time, ``ttl`` should be
+    well below the configured ``sign.max-ttl`` of the instance.
+
+    Args:
+        flux_handle (Flux): Optional Flux handle. If provided, and the
+            current user is the instance owner, the signing mechanism is
+            forced to "none", as is done by ``flux_job_submit(3)``.
+        mech_type (str): Signing mechanism. By default, use the default
+            mechanism from the flux-security configuration.
+        ttl (float): Time in seconds for which a signature may be reused
+            (default: 60)
+        maxsize (int): Maximum number of distinct jobspecs to cache
+            (default: 64)
+        context (SecurityContext): Optional existing security context
+
+    Raises:
+        ImportError: flux-security support is not available
+    """
+
+    def __init__(
+        self, flux_handle=None, mech_type=None, ttl=60.0, maxsize=64, context=None
+    ):
+        if context is None:
+            # flux.security is only available when built with flux-security
+            # pylint: disable=import-outside-toplevel
+            from flux.security import SecurityContext
+
+            context = SecurityContext()
+        self.context = context
+        self.mech_type = mech_type
+        if mech_type is None and flux_handle is not None:
+            if int(flux_handle.attr_get("security.owner")) == os.getuid():
+                self.mech_type = "none"
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def sign(self, jobspec):
+        """Return the signed form of ``jobspec``, signing only if necessary
+
+        Args:
+            jobspec (Jobspec, str, bytes): The jobspec to sign
+        Returns:
+            bytes: signed jobspec, suitable for submission with
+            ``pre_signed=True``
+        """
+        jobspec = _convert_jobspec_arg_to_string(jobspec)
+        now = time.monotonic()
+        entry = self._cache.get(jobspec)
+        if entry is not None and now < entry[1]:
+            self._cache.move_to_end(jobspec)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        if self.mech_type is None:
+            signed = self.context.sign_wrap(jobspec)
+        else:
+            signed = self.context.sign_wrap(jobspec, mech_type=self.mech_type)
+        self._cache[jobspec] = (signed, now + self.ttl)
+        self._cache.move_to_end(jobspec)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return signed
+
+
 class SubmitFuture(Future):
     """Future subclass representing job IDs."""
 
@@ -0,0 +1,206 @@
+###############################################################
+# Copyright 2023 Lawrence Livermore National Security, LLC
+# (c.f. AUTHORS, NOTICE.LLNS, COPYING)
+#
+# This file is part of the Flux resource manager framework.
+# For details, see https://github.com/flux-framework.
+#
+# SPDX-License-Identifier: LGPL-3.0
+###############################################################
+
+import math
+from typing import NamedTuple
+
+from flux.job.event import parse_eventlog
+from flux.job.JobID import JobID
+from flux.job.kvslookup import JobKVSLookup
+
+EXEC_EVENTLOG = "guest.exec.eventlog"
+
+
+class Phase(NamedTuple):
+    """
+    A phase of a job's lifetime, measured from the first occurrence of
+    event ``start`` to the last occurrence of event ``end`` in ``eventlog``.
+    """
+
+    name: str
+    start: str
+    end: str
+    eventlog: str = "eventlog"
+
+
+# Default phases. Names starting with "exec." are measured from the
+# guest.exec.eventlog, others from the main eventlog (see Flux RFC 21).
+PHASES = (
+    Phase("queue", "submit", "alloc"),
+    Phase("sched", "priority", "alloc"),
+    Phase("startup", "alloc", "start"),
+    Phase("prolog", "prolog-start", "prolog-finish"),
+    Phase("run", "start", "finish"),
+    Phase("cleanup", "finish", "clean"),
+    Phase("epilog", "epilog-start", "epilog-finish"),
+    Phase("exec.init", "init", "starting", EXEC_EVENTLOG),
+    Phase("exec.shell", "starting", "shell.init", EXEC_EVENTLOG),
+    Phase("exec.tasks", "shell.init", "complete", EXEC_EVENTLOG),
+    Phase("exec.done", "complete", "done", EXEC_EVENTLOG),
+)
+
+
+def _percentile(values, percent):
+    #  Return percentile of sorted list ``values`` using linear
+    #  interpolation between closest ranks
+    rank = (len(values) - 1) * percent / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def _timestamps(eventlog, names):
+    #  Return first and last timestamp of each event in ``names``
+    first = {}
+    last = {}
+    for record in parse_eventlog(eventlog, names=names):
+        first.setdefault(record.name, record.timestamp)
+        last[record.name] = record.timestamp
+    return first, last
+
+
+class JobTimelines:
+    """Phase durations for a set of jobs in columnar form
+
+    Durations are stored per phase as a column with one entry per job,
+    in the order of :attr:`jobids`. An entry is None if the phase did not
+    occur or has not yet completed for the corresponding job.
+
+    Attributes:
+        jobids (list): list of JobIDs, one per row
+        phases (tuple): the :obj:`Phase` objects measured
+        columns (dict): mapping of phase name to list of durations in
+            floating point seconds
+        errors (list): errors from fetching eventlogs, if any
+    """
+
+    def __init__(self, phases=PHASES):
+        self.phases = tuple(phases)
+        self.jobids = []
+        self.columns = {phase.name: [] for phase in self.phases}
+        self.errors = []
+        self._names = {}
+        for phase in self.phases:
+            names = self._names.setdefault(phase.eventlog, set())
+            names.update((phase.start, phase.end))
+
+    @property
+    def eventlogs(self):
+        """The set of eventlogs required for :attr:`phases`"""
+        return set(self._names)
+
+    def __len__(self):
+        return len(self.jobids)
+
+    def add(self, jobid, eventlogs):
+        """
+        Add a row for ``jobid`` computed from ``eventlogs``, a mapping of
+        eventlog name, e.g. "eventlog" or "guest.exec.eventlog", to the
+        eventlog contents. Missing eventlogs are treated as empty.
+        """
+        events = {}
+        for name, names in self._names.items():
+            events[name] = _timestamps(eventlogs.get(name) or "", names)
+        self.jobids.append(JobID(jobid))
+        for phase in self.phases:
+            first, last = events[phase.eventlog]
+            duration = None
+            if phase.start in first and phase.end in last:
+                duration = last[phase.end] - first[phase.start]
+            self.columns[phase.name].append(duration)
+        return self
+
+    def rows(self):
+        """
+        Generator which yields one dict per job, containing the jobid as
+        "id" and the duration of each phase.
+        """
+        names = [phase.name for phase in self.phases]
+        for i, jobid in enumerate(self.jobids):
+            row = {"id": jobid}
+            for name in names:
+                row[name] = self.columns[name][i]
+            yield row
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """Return summary statistics for each phase
+
+        Returns a dict of phase name to a dict containing the ``count`` of
+        jobs for which the phase was measured, and the ``min``, ``mean``,
+        and ``max`` durations, plus one entry per requested percentile,
+        e.g. ``p50``, ``p90``. Statistics are None if ``count`` is 0.
+
+        Args:
+            percentiles (iterable): percentiles to compute
+                (default=(50, 90, 99))
+        """
+        result = {}
+        for name, column in self.columns.items():
+            values = sorted(x for x in column if x is not None)
+            stats = {"count": len(values)}
+            if values:
+                stats["min"] = values[0]
+                stats["mean"] = math.fsum(values) / len(values)
+                stats["max"] = values[-1]
+                for percent in percentiles:
+                    stats[f"p{percent:g}"] = _percentile(values, percent)
+            else:
+                stats["min"] = stats["mean"] = stats["max"] = None
+                for percent in percentiles:
+                    stats[f"p{percent:g}"] = None
+            result[name] = stats
+        return result
+
+
+def job_timelines(flux_handle, jobids, phases=PHASES):
+    """Fetch eventlogs for many jobs and compute their phase durations
+
+    All required eventlogs are fetched concurrently with
+    :obj:`flux.job.JobKVSLookup`. Only event names and timestamps are
+    decoded. Jobs which do not exist are omitted from the result and
+    reported in its ``errors`` attribute. The exec eventlog is not
+    available in the KVS for jobs that never started or are still
+    running, so exec phases of these jobs are None.
+
+    Example:
+        >>> timelines = job_timelines(h, jobids)
+        >>> timelines.summary()["queue"]["p90"]
+
+    Args:
+        flux_handle (flux.Flux): Flux handle
+        jobids (iterable): jobids for which to compute phase durations
+        phases (iterable): :obj:`Phase` objects to measure
+            (default=flux.job.timeline.PHASES)
+
+    Returns:
+        JobTimelines: columnar phase durations and summary statistics
+    """
+    timelines = JobTimelines(phases)
+    jobids = list(jobids)
+
+    #  Issue all lookups before waiting for any of them:
+    futures = {}
+    for eventlog in sorted(timelines.eventlogs):
+        lookup = JobKVSLookup(flux_handle, jobids, keys=[eventlog], decode=False)
+        futures[eventlog] = lookup.fetch_data()
+
+    data = {}
+    for eventlog, future in futures.items():
+        for response in future.get():
+            data.setdefault(response["id"], {})[eventlog] = response[eventlog]
+        #  Errors for the exec eventlog are expected for jobs that never
+        #  started, so only report errors for the main eventlog:
+        if eventlog == "eventlog":
+            timelines.errors.extend(future.errors)
+
+    for jobid in map(JobID, jobids):
+        if jobid in data:
+            timelines.add(jobid, data[jobid])
+    return timelines
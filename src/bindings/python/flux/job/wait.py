@@ -13,7 +13,7 @@ import json
 
 import flux
 from _flux._core import ffi, lib
-from flux.future import Future
+from flux.future import Future, FutureExt
 from flux.job._wrapper import _RAW as RAW
 from flux.util import check_future_error, interruptible
 
@@ -199,3 +199,130 @@ def result(flux_handle, jobid, flags=0):
     """
     future = result_async(flux_handle, flux.job.JobID(jobid), flags)
     return future.get_info()
+
+
+class JobResultsFuture(FutureExt):
+    """Future fulfilled with the result of each job in a set as it completes
+
+    See :func:`results_async` for full documentation.
+    """
+
+    def __init__(self, flux_handle, jobids, max_concurrency=1024, flags=0):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.flags = flags
+        self._jobids = collections.deque(flux.job.JobID(x) for x in jobids)
+        self._remaining = len(self._jobids)
+        super().__init__(self._results_init, flux_handle=flux_handle)
+
+    def _start_next(self, flux_handle):
+        jobid = self._jobids.popleft()
+        result_async(flux_handle, jobid, self.flags).then(self._result_cb, jobid)
+
+    def _results_init(self, future):
+        if self._remaining == 0:
+            self.fulfill(None)
+            return
+        flux_handle = future.get_flux()
+        for _ in range(min(self.max_concurrency, len(self._jobids))):
+            self._start_next(flux_handle)
+
+    def _result_cb(self, future, jobid):
+        #  Errors for one job are reported in that job's result instead of
+        #  failing this future, so results for other jobs are not lost:
+        try:
+            result = future.get_dict()
+        except OSError as exc:
+            result = {"id": int(jobid), "errno": exc.errno, "errstr": exc.strerror}
+        self.fulfill(result)
+        self._remaining -= 1
+        if self._jobids:
+            self._start_next(future.get_flux())
+        elif self._remaining == 0:
+            self.fulfill(None)
+
+    def get_dict(self):
+        """Get the raw "result" dictionary for the next job to complete
+
+        Returns None once results for all jobs have been returned. If the
+        result for a job could not be obtained, the returned dictionary
+        contains only the keys ``id``, ``errno`` and ``errstr``.
+        """
+        result = self.get()
+        self.reset()
+        return result
+
+    def get_info(self):
+        """Get a :obj:`flux.job.info.JobInfo` object for the next job result
+
+        Returns None once results for all jobs have been returned. See
+        :meth:`JobResultFuture.get_info` for the limitations of the returned
+        JobInfo object.
+
+        Raises:
+            OSError: the result for the next job could not be obtained
+        """
+        result = self.get_dict()
+        if result is None:
+            return None
+        if "errno" in result:
+            raise OSError(result["errno"], f"{result['id']}: {result['errstr']}")
+        return flux.job.JobInfo(result)
+
+
+def results_async(flux_handle, jobids, max_concurrency=1024, flags=0):
+    """Wait for a set of jobs to complete and return each job result
+
+    Asynchronously wait for the jobs in ``jobids`` to reach their terminal
+    state, as with :func:`result_async`, but with a single Future which is
+    fulfilled once for each job as it completes, in completion order.
+    At most ``max_concurrency`` job results are requested at once.
+
+    Call ``get_dict()`` or ``get_info()`` on the returned Future to obtain
+    the next result. Both return None after the results for all jobs have
+    been returned.
+
+    Example:
+        >>> def cb(future):
+        ...     result = future.get_dict()
+        ...     if result is not None:
+        ...         print(result["id"], result["result"])
+        >>> flux.job.results_async(h, jobids).then(cb)
+        >>> h.reactor_run()
+
+    Args:
+        flux_handle (:obj:`flux.Flux`): handle for Flux broker
+        jobids (iterable): the jobids for which to fetch results
+        max_concurrency (int): maximum number of in-flight result requests
+            (default: 1024)
+
+    Returns:
+        JobResultsFuture: A Future fulfilled with each job result.
+    """
+    return JobResultsFuture(
+        flux_handle, jobids, max_concurrency=max_concurrency, flags=flags
+    )
+
+
+def results(flux_handle, jobids, max_concurrency=1024, flags=0):
+    """Python generator returning the result of each job in a set
+
+    Synchronous version of :func:`results_async`. Yields the raw result
+    dictionary for each job in ``jobids`` as it completes.
+
+    Example:
+        >>> for result in flux.job.results(h, jobids):
+        ...     print(result["id"], result.get("waitstatus"))
+
+    Args:
+        flux_handle (:obj:`flux.Flux`): handle for Flux broker
+        jobids (iterable): the jobids for which to fetch results
+        max_concurrency (int): maximum number of in-flight result requests
+            (default: 1024)
+    """
+    future = results_async(flux_handle, jobids, max_concurrency, flags)
+    result = future.get_dict()
+    while result is not None:
+        yield result
+        result = future.get_dict()
@@ -11,10 +11,10 @@
 import os
 import sys
 import time
-from collections import Counter
+from collections import Counter, deque
 
 import flux
-from flux.job import output_watch_async
+from flux.job import OutputSink, output_watch_async
 from flux.progress import ProgressBar
 
 
@@ -325,6 +325,31 @@ class JobWatcher:
             self.stderr = stderr
             self.wait = wait
 
+            #  Futures for the main, exec, and output eventlog streams
+            #  of this job, each set only while the stream is watched:
+            self.main = None
+            self.exec = None
+            self.output = None
+
+            #  True once the shell.init exec event has been seen:
+            self.shell_init = False
+
+            #  True while this job holds one of the JobWatcher's limited
+            #  output watch slots:
+            self.output_slot = False
+
+        @property
+        def exec_wait(self):
+            """True if the job's wait event is in the exec eventlog"""
+            return bool(self.wait) and self.wait.startswith("exec.")
+
+        def cancel(self, stream):
+            """Cancel the watch of the ``main`` or ``exec`` eventlog"""
+            future = getattr(self, stream)
+            if future is not None:
+                future.cancel(stop=True)
+                setattr(self, stream, None)
+
     def __init__(
         self,
         flux_handle,
@@ -339,6 +364,9 @@ class JobWatcher:
         stderr=sys.stderr,
         labelio=False,
         starttime=None,
+        binary=False,
+        max_output_watch=256,
+        sink_high_water=1 << 20,
     ):
         """
         Initialize an instance of the JobWatcher class.
@@ -359,6 +387,17 @@ class JobWatcher:
             stderr (TextIOWrapper): Default stderr location (default=sys.stderr)
             labelio (bool): Label lines of output with jobid and taskid
             starttime (float): If not None, start elapsed timer at this time.
+            binary (bool): Copy job output as bytes directly to the file
+                descriptors of ``stdout`` and ``stderr``, without decoding
+                it (default=False)
+            max_output_watch (int): Maximum number of jobs for which output
+                is watched concurrently. Output of other jobs is watched in
+                turn as these complete (default=256)
+            sink_high_water (int): Output, logs, and status messages are
+                written to each distinct ``stdout`` and ``stderr`` file from
+                a background thread. This is the maximum amount of data
+                buffered for each such file before the JobWatcher blocks
+                (default=1MiB)
         """
         self.flux_handle = flux_handle
         self.progress = None
@@ -370,12 +409,23 @@ class JobWatcher:
         self.stdout = stdout
         self.stderr = stderr
         self.labelio = labelio
+        self.binary = binary
+        self.max_output_watch = max(1, max_output_watch)
+        self.sink_high_water = sink_high_water
         self.exitcode = 0
         self.show_progress = progress
         self.progress = JobProgressBar(flux_handle, starttime=self.t0, jps=jps)
 
         self._states = Counter()
 
+        #  Jobs waiting for an output watch slot, and the number of
+        #  slots currently in use:
+        self._output_queue = deque()
+        self._output_active = 0
+
+        #  OutputSinks by id of the file object to which they write:
+        self._sinks = {}
+
         if jobs:
             self.add_jobs(*jobs)
 
@@ -398,8 +448,11 @@ class JobWatcher:
 
     def stop(self):
         """
-        Stop JobWatcher progress bar if configured
+        Write all buffered output and stop JobWatcher progress bar if
+        configured
         """
+        for sink in self._sinks.values():
+            sink.flush()
         if self.show_progress:
             self.progress.stop()
         return self
@@ -429,9 +482,8 @@ class JobWatcher:
                 self.t0 = job.t_submit
 
             job_status = self.JobWatchStatus(job, stdout, stderr, wait=wait)
-            flux.job.event_watch_async(self.flux_handle, job.id).then(
-                self._event_watch_cb, job_status
-            )
+            job_status.main = flux.job.event_watch_async(self.flux_handle, job.id)
+            job_status.main.then(self._event_watch_cb, job_status)
             if not job_status.active:
                 self._progress_update(job_status)
         return self
@@ -465,9 +517,19 @@ class JobWatcher:
     def _progress_update(self, job, event=None):
         self.progress.process_event(job.id, event)
 
+    def _sink(self, stream):
+        #  Return the OutputSink for file object ``stream``, which is shared
+        #  by all jobs writing to the same file so that output is ordered:
+        try:
+            return self._sinks[id(stream)]
+        except KeyError:
+            sink = OutputSink(stream, high_water=self.sink_high_water)
+            self._sinks[id(stream)] = sink
+            return sink
+
     def _log(self, job, timestamp, msg):
         dt = timestamp - self.t0
-        print(f"{job.id.f58}: {dt:4.3f}s: {msg}", file=job.stderr)
+        self._sink(job.stderr).write(f"{job.id.f58}: {dt:4.3f}s: {msg}\n")
 
     def _log_event(self, job, event, event_prefix=""):
         if self.log_events and event is not None:
@@ -477,6 +539,51 @@ class JobWatcher:
                 f"{event_prefix}{event.name} {event.context_string}",
             )
 
+    def _exec_watch(self, job):
+        if job.exec is None:
+            job.exec = flux.job.event_watch_async(
+                self.flux_handle, job.id, eventlog="guest.exec.eventlog"
+            )
+            job.exec.then(self._exec_event_cb, job)
+
+    def _output_watch(self, job):
+        #  shell.init event indicates output eventlog is ready
+        #  (use nowait=True to avoid watching intermediate eventlogs)
+        #
+        job.output = output_watch_async(
+            self.flux_handle,
+            job.id,
+            labelio=self.labelio,
+            nowait=True,
+            binary=self.binary,
+        )
+        job.output.then(self._output_watch_cb, job)
+
+    def _output_request(self, job):
+        #  Request an output watch slot for job. The output of at most
+        #  max_output_watch jobs (including the exec eventlog watch used
+        #  to wait for the output eventlog to be ready) is watched at once.
+        #  Other jobs are queued until a slot is released.
+        if job.output_slot or job.output is not None:
+            return
+        if self._output_active >= self.max_output_watch:
+            self._output_queue.append(job)
+            return
+        self._output_active += 1
+        job.output_slot = True
+        if job.shell_init:
+            self._output_watch(job)
+        else:
+            self._exec_watch(job)
+
+    def _output_release(self, job):
+        if not job.output_slot:
+            return
+        job.output_slot = False
+        self._output_active -= 1
+        while self._output_queue and self._output_active < self.max_output_watch:
+            self._output_request(self._output_queue.popleft())
+
     def _event_watch_cb(self, future, job):
         event = future.get_event()
 
@@ -485,6 +592,7 @@ class JobWatcher:
 
         # End of eventlog
         if event is None:
+            job.main = None
             return
 
         job.add_event(event.name)
@@ -507,17 +615,15 @@ class JobWatcher:
                 #  shell never initialized, then print the exception error
                 #  to stderr:
                 if not job.has_event("shell.init"):
-                    print(
-                        flux.job.output.JobExceptionEvent(event).render(),
-                        file=job.stderr,
-                    )
+                    exception = flux.job.output.JobExceptionEvent(event)
+                    self._sink(job.stderr).write(exception.render() + "\n")
         elif event.name == "alloc":
             job.status = "running"
         elif event.name == "start":
-            if self.watch or job.wait.startswith("exec."):
-                flux.job.event_watch_async(
-                    self.flux_handle, job.id, eventlog="guest.exec.eventlog"
-                ).then(self._exec_event_cb, job, future)
+            if job.exec_wait:
+                self._exec_watch(job)
+            elif self.watch:
+                self._output_request(job)
         elif event.name == "finish":
             #
             # job finished. Collect wait status into self.exitcode
@@ -534,43 +640,79 @@ class JobWatcher:
             # Done with this job: update progress bar and cancel future
             #
             self._progress_update(job)
-            future.cancel(stop=True)
+            job.cancel("main")
 
-    def _exec_event_cb(self, future, job, main_eventlog_future):
+    def _exec_event_cb(self, future, job):
         event = future.get_event()
         if event is None:
+            #  The job's shell never initialized, so there is no output
+            #  to watch.
+            job.exec = None
+            if not job.shell_init:
+                self._output_release(job)
             return
         self._log_event(job, event, event_prefix="exec.")
-        if self.watch and event.name == "shell.init":
-            #  shell.init event indicates output eventlog is ready
-            #  (use nowait=True to avoid watching intermediate eventlogs)
-            #
-            output_watch_async(
-                self.flux_handle,
-                job.id,
-                labelio=self.labelio,
-                nowait=True,
-            ).then(self._output_watch_cb, job)
-
-            if not job.wait or not job.wait.startswith("exec."):
+        if event.name == "shell.init":
+            job.shell_init = True
+            if self.watch:
+                if job.output_slot:
+                    self._output_watch(job)
+                else:
+                    self._output_request(job)
+            if not job.exec_wait:
                 # No more events from exec eventlog are needed
-                future.cancel(stop=True)
+                job.cancel("exec")
 
         if job.wait and job.wait == f"exec.{event.name}":
             #  Done with this job
             #
-            future.cancel(stop=True)
-            main_eventlog_future.cancel(stop=True)
+            job.cancel("exec")
+            job.cancel("main")
+            if not job.shell_init:
+                self._output_release(job)
+
+    def _write_binary(self, job, stream, chunks):
+        self._sink(getattr(job, stream)).write(chunks)
+
+    def _output_watch_binary(self, future, job):
+        #  Drain all output currently available from the future and queue
+        #  consecutive chunks for the same stream to be written together
+        #  with os.writev().
+        #  With labelio, the label is written as a separate buffer instead
+        #  of being copied onto each line.
+        stream = None
+        chunks = []
+        while True:
+            next_stream, data = future.get_output()
+            if next_stream != stream and chunks:
+                self._write_binary(job, stream, chunks)
+                chunks = []
+            stream = next_stream
+            if stream is None:
+                break
+            if self.labelio:
+                label = f"{job.id}: ".encode()
+                for line in data.splitlines(keepends=True):
+                    chunks.extend((label, line))
+            else:
+                chunks.append(data)
+            if not future.is_ready():
+                break
+        if chunks:
+            self._write_binary(job, stream, chunks)
+        return stream is None
 
     def _output_watch_cb(self, future, job):
+        if self.binary:
+            if self._output_watch_binary(future, job):
+                job.output = None
+                self._output_release(job)
+            return
         stream, data = future.get_output()
         if stream is not None:
-            output_stream = getattr(job, stream)
-            if self.labelio:
-                for line in data.splitlines(keepends=True):
-                    output_stream.write(f"{job.id}: {line}")
-            else:
-                output_stream.write(data)
+            #  Lines are labeled by the writer thread of the sink:
+            label = f"{job.id}: " if self.labelio else None
+            self._sink(getattr(job, stream)).write(data, label=label)
         else:
-            for stream in ("stdout", "stderr"):
-                getattr(job, stream).flush()
+            job.output = None
+            self._output_release(job)
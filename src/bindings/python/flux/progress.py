@@ -90,6 +90,12 @@ class Bottombar:
     will print a statusbar with an iteration count left justified, and the
     current time right justified.
 
+    Since redrawing the bar requires formatting and writing to the terminal,
+    redraws triggered by ``update()`` are limited to one per
+    ``redraw_interval`` seconds. Updates made in between are coalesced
+    and drawn by the next call to ``update()`` or ``redraw()``, e.g. from
+    a periodic timer. The final state is always drawn by ``stop()``.
+
     Attributes:
         elapsed (float): The elapsed time since ``bb.start()`` in floating
             point seconds. As a convenience, ``bb.elapsed`` may be converted
@@ -98,19 +104,24 @@ class Bottombar:
 
     Args:
         formatter (function): Function which returns the status string
+        redraw_interval (float): Minimum interval in seconds between
+            redraws due to ``update()`` (default=0.05)
         kwargs: all extra keyword arguments are collected in the Bottombar
             instance and made available as attributes for convenience
 
     """
 
-    def __init__(self, formatter=None, **kwargs):
+    def __init__(self, formatter=None, redraw_interval=0.05, **kwargs):
         self.size = None
         if formatter is None:
             formatter = self._format
         self.formatter = formatter
+        self.redraw_interval = redraw_interval
         self.kwargs = kwargs
         self._running = False
         self._t0 = None
+        self._last_redraw = 0.0
+        self._pending = False
 
     def __getattr__(self, attr):
         if attr == "elapsed":
@@ -171,6 +182,8 @@ class Bottombar:
             "\0338" % (self.size.lines, self)
         )
         sys.stdout.flush()
+        self._last_redraw = time.monotonic()
+        self._pending = False
 
     def start(self):
         """Start drawing a Bottombar"""
@@ -188,10 +201,17 @@ class Bottombar:
             self._running = False
 
     def update(self, **kwargs):
-        """Update keyword args and redraw a bottombar"""
+        """Update keyword args and redraw a bottombar
+
+        The redraw is deferred if the bar was redrawn less than
+        ``redraw_interval`` seconds ago.
+        """
         self.kwargs.update(kwargs)
         if self._running:
-            self.redraw()
+            if time.monotonic() - self._last_redraw >= self.redraw_interval:
+                self.redraw()
+            else:
+                self._pending = True
 
 
 class ProgressBar(Bottombar):
@@ -325,5 +345,10 @@ class ProgressBar(Bottombar):
         """
         self.count += advance
         super().update(**kwargs)
-        if self.count == self.total and self.autostop:
-            self.stop()
+        if self.count == self.total:
+            #  Always draw the final state, even if the redraw by
+            #  update() was deferred:
+            if self.autostop:
+                self.stop()
+            elif self._pending:
+                self.redraw()
@@ -16,15 +16,18 @@ import glob
 import json
 import logging
 import math
+import operator
 import os
+import pwd
 import re
 import shutil
 import signal
 import stat
 import sys
 import threading
+import time
 import traceback
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path, PurePosixPath
 from string import Formatter
@@ -517,6 +520,59 @@ class UtilFormatter(Formatter):
         return retval
 
 
+#  Match one ".attr" or "[key]" component of a format field name
+_FIELD_COMPONENT_RE = re.compile(r"\.([^.[]+)|\[([^]]+)\]")
+
+
+def _split_field_name(field_name):
+    """
+    Split format field name ``field_name``, as returned by
+    Formatter.parse(), into its first component and a list of
+    (is_attribute, key) tuples, in the same way as Formatter.get_field().
+    Returns (None, None) if the field name is malformed.
+    """
+    first, _, _ = field_name.partition(".")
+    first, _, _ = first.partition("[")
+    pos = len(first)
+    rest = []
+    while pos < len(field_name):
+        match = _FIELD_COMPONENT_RE.match(field_name, pos)
+        if match is None:
+            return None, None
+        attr, key = match.groups()
+        if attr is not None:
+            rest.append((True, attr))
+        else:
+            rest.append((False, int(key) if key.isdecimal() else key))
+        pos = match.end()
+    if first.isdecimal():
+        first = int(first)
+    return first, rest
+
+
+def _field_getter(field_name):
+    """
+    Return a callable which returns the value of format field
+    ``field_name`` from an object passed as the first positional argument,
+    equivalent to Formatter.get_field(), or None if the field does not
+    refer to the first positional argument.
+    """
+    first, rest = _split_field_name(field_name)
+    if first != 0:
+        return None
+    if not rest:
+        return lambda obj: obj
+    if all(is_attr for is_attr, _ in rest):
+        return operator.attrgetter(".".join(key for _, key in rest))
+
+    def getter(obj):
+        for is_attr, key in rest:
+            obj = getattr(obj, key) if is_attr else obj[key]
+        return obj
+
+    return getter
+
+
 class OutputFormat:
     """
     Store a parsed version of the program's output format,
@@ -557,6 +613,7 @@ class OutputFormat:
             self.prepend = prepend
         self.fmt = fmt
         self.fmt_orig = fmt
+        self._compiled = None
         #  Parse format into list of (string, field, spec, conv) tuples,
         #   replacing any None values with empty string "" (this makes
         #   substitution back into a format string in self.header() and
@@ -663,12 +720,60 @@ class OutputFormat:
             prepend=self.prepend,
         )
 
+    def _compile(self, fmt):
+        """
+        Compile format string ``fmt`` into a list of
+        (literal_text, getter, conversion, spec) tuples, which may be used
+        to format many objects without parsing the format string and
+        resolving field names for each one. Returns None if the format
+        cannot be compiled, e.g. if it contains nested replacement
+        fields, or if the formatter class overrides field lookup.
+        """
+        formatter = self.formatter()
+        cls = type(formatter)
+        if cls.get_field is not Formatter.get_field or (
+            cls.get_value is not Formatter.get_value
+        ):
+            return None
+        compiled = []
+        for text, field, spec, conv in formatter.parse(fmt):
+            getter = None
+            if field is not None:
+                if "{" in spec:
+                    return None
+                getter = _field_getter(field)
+                if getter is None:
+                    return None
+            compiled.append((text, getter, conv, spec))
+        return formatter, compiled
+
+    def _format_compiled(self, formatter, compiled, obj):
+        result = []
+        for text, getter, conv, spec in compiled:
+            if text:
+                result.append(text)
+            if getter is not None:
+                value = formatter.convert_field(getter(obj), conv)
+                result.append(formatter.format_field(value, spec))
+        return "".join(result)
+
+    def _get_compiled(self):
+        fmt = self.get_format()
+        if self._compiled is None or self._compiled[0] != fmt:
+            self._compiled = (fmt, self._compile(fmt))
+        return self._compiled[1]
+
     def format(self, obj):
         """
         format object with internal format
         """
+        fmt = self.get_format()
         try:
-            retval = self.formatter().format(self.get_format(), obj)
+            compiled = self._get_compiled()
+            if compiled is None:
+                retval = self.formatter().format(fmt, obj)
+            else:
+                retval = self._format_compiled(*compiled, obj)
         except KeyError as exc:
             typestr = type(obj)
             raise KeyError(f"Invalid format field {exc} for {typestr}")
@@ -714,21 +819,74 @@ class OutputFormat:
             if not lst:
                 break
 
-        #  Remove any entries that were empty from self.format_list
-        #  (use index field of lst to remove by position in self.format_list)
-        format_list = [
-            x
-            for i, x in enumerate(self.format_list)
-            if i not in [x["index"] for x in lst]
-        ]
+        return self._filtered_format({x["index"] for x in lst})
+
+    def _filtered_format(self, empty):
+        """
+        Return a new format string with the entries of self.format_list
+        at positions in ``empty`` removed, and the "?:" sentinel removed
+        from any remaining collapsible entries.
+        """
+        format_list = []
+        for i, (text, field, spec, conv) in enumerate(self.format_list):
+            if i in empty:
+                continue
+            if text.endswith("?:"):
+                text = text[:-2]
+            format_list.append(self._fmt_tuple(text, field, spec, conv))
+        return "".join(format_list)
+
+    def _format_items_cached(self, items, collapsible, compiled):
+        """
+        Single pass equivalent of filter_empty() followed by format() of
+        each item. Each field value is computed once per item and cached,
+        then used both to determine which collapsible fields are empty
+        for all items and to generate the output lines.
 
-        #  Remove "?:" from remaining entries so they disappear in output.
-        for entry in format_list:
-            if entry[0].endswith("?:"):
-                entry[0] = entry[0][:-2]
+        Returns the filtered format string and a list of (item, line).
+        """
+        formatter, compiled = compiled
+        empty = empty_outputs()
+        fields = [
+            (i, getter, conv)
+            for i, (_, getter, conv, _) in enumerate(compiled)
+            if getter is not None
+        ]
+        rows = []
+        try:
+            for item in items:
+                values = {
+                    i: formatter.convert_field(getter(item), conv)
+                    for i, getter, conv in fields
+                }
+                if collapsible:
+                    collapsible = [
+                        i
+                        for i in collapsible
+                        if formatter.format_field(values[i], "") in empty
+                    ]
+                rows.append((item, values))
+        except KeyError as exc:
+            raise KeyError(f"Invalid format field {exc} for {type(item)}")
 
-        #  Return new format string created from pruned format_list
-        return "".join(self._fmt_tuple(*x) for x in format_list)
+        dropped = set(collapsible)
+        layout = []
+        for i, (text, getter, _, spec) in enumerate(compiled):
+            if i in dropped:
+                continue
+            if text.endswith("?:"):
+                text = text[:-2]
+            layout.append((text, i if getter is not None else None, spec))
+
+        lines = []
+        for item, values in rows:
+            line = []
+            for text, i, spec in layout:
+                line.append(text)
+                if i is not None:
+                    line.append(formatter.format_field(values[i], spec))
+            lines.append((item, "".join(line)))
+        return self._filtered_format(dropped), lines
 
     def print_items(self, items, no_header=False, pre=None, post=None):
         """
@@ -747,27 +905,72 @@ class OutputFormat:
             no_header (boolean): disable header row (default: False)
             pre (callable): Function to call before printing each item
             post (callable): Function to call after printing each item
+
+        Returns:
+            OutputFormat: the formatter with empty fields removed which
+            was used to print ``items``
         """
-        #  Preprocess original format by processing with filter_empty():
-        newfmt = self.filter_empty(items)
+        collapsible = [
+            i for i, entry in enumerate(self.format_list) if entry[0].endswith("?:")
+        ]
+        compiled = self._get_compiled() if collapsible else None
+        if compiled is not None:
+            #  Format each item only once, see _format_items_cached():
+            newfmt, lines = self._format_items_cached(items, collapsible, compiled)
+        else:
+            #  Preprocess original format by processing with filter_empty():
+            newfmt = self.filter_empty(items)
+            lines = None
+
         #  Get the current class for creating a new formatter instance:
         cls = self.__class__
         #  Create new instance of the current class from filtered format:
         formatter = cls(newfmt, headings=self.headings, prepend=self.prepend)
         if not no_header:
             print(formatter.header())
-        for item in items:
-            line = formatter.format(item)
-            if not line:
-                continue
-            if callable(pre):
-                pre(item)
+
+        if lines is None:
+            lines = ((item, formatter.format(item)) for item in items)
+
+        def write_line(line):
             try:
                 print(line)
             except UnicodeEncodeError:
                 print(line.encode("utf-8", errors="surrogateescape").decode())
+
+        if not callable(pre) and not callable(post):
+            #  Without per-item callbacks, lines can be written in large
+            #  chunks instead of one print() call per item:
+            chunk = []
+            for _, line in lines:
+                if line:
+                    chunk.append(line)
+                if len(chunk) >= 1024:
+                    self._write_lines(chunk, write_line)
+                    chunk = []
+            self._write_lines(chunk, write_line)
+            return formatter
+
+        for item, line in lines:
+            if not line:
+                continue
+            if callable(pre):
+                pre(item)
+            write_line(line)
             if callable(post):
                 post(item)
+        return formatter
+
+    @staticmethod
+    def _write_lines(lines, write_line):
+        if not lines:
+            return
+        try:
+            sys.stdout.write("\n".join(lines) + "\n")
+        except UnicodeEncodeError:
+            #  Fall back to writing one line at a time:
+            for line in lines:
+                write_line(line)
 
 
 class Deduplicator:
@@ -819,6 +1022,81 @@ class Deduplicator:
             self.items.append(item)
 
 
+class PasswdCache:
+    """
+    Bounded cache of password database lookups by uid and name
+
+    Lookups via :func:`pwd.getpwuid` and :func:`pwd.getpwnam` may be
+    expensive when the password database is backed by a network
+    service such as LDAP, and job listing tools look up the same few
+    users for every job. This class caches successful lookups for
+    ``ttl`` seconds and failed lookups for ``negative_ttl`` seconds,
+    keeping at most ``maxsize`` entries, least recently used first out.
+
+    The methods have the same semantics as the :mod:`pwd` functions,
+    including raising KeyError for unknown users. Use the module level
+    :func:`getpwuid` and :func:`getpwnam` to share one process-wide cache.
+    """
+
+    def __init__(self, maxsize=4096, ttl=600.0, negative_ttl=60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, key, entry, ttl):
+        self._cache[key] = (entry, time.monotonic() + ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, key, func, arg):
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() < cached[1]:
+                self._cache.move_to_end(key)
+                entry = cached[0]
+                if isinstance(entry, KeyError):
+                    raise KeyError(*entry.args)
+                return entry
+        try:
+            entry = func(arg)
+        except KeyError as exc:
+            with self._lock:
+                self._store(key, exc, self.negative_ttl)
+            raise
+        with self._lock:
+            self._store(("uid", entry.pw_uid), entry, self.ttl)
+            self._store(("name", entry.pw_name), entry, self.ttl)
+        return entry
+
+    def getpwuid(self, uid):
+        """Cached version of :func:`pwd.getpwuid`"""
+        return self._lookup(("uid", uid), pwd.getpwuid, uid)
+
+    def getpwnam(self, name):
+        """Cached version of :func:`pwd.getpwnam`"""
+        return self._lookup(("name", name), pwd.getpwnam, name)
+
+
+_PASSWD_CACHE = PasswdCache()
+
+
+def getpwuid(uid):
+    """Look up password database entry for ``uid`` in process-wide cache"""
+    return _PASSWD_CACHE.getpwuid(uid)
+
+
+def getpwnam(name):
+    """Look up password database entry for ``name`` in process-wide cache"""
+    return _PASSWD_CACHE.getpwnam(name)
+
+
 class Tree:
     """Very simple pstree-like display for the console
 
@@ -11,12 +11,12 @@
 import argparse
 import logging
 import os
-import pwd
 import sys
 from operator import itemgetter
 
 import flux
 from flux.job import cancel_async
+from flux.util import getpwnam
 
 LOGGER = logging.getLogger("flux-cancel")
 
@@ -114,7 +114,7 @@ def cancelall(args):
         userid = flux.constants.FLUX_USERID_UNKNOWN
     else:
         try:
-            userid = pwd.getpwnam(args.user).pw_uid
+            userid = getpwnam(args.user).pw_uid
         except KeyError:
             try:
                 userid = int(args.user)
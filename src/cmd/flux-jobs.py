@@ -10,14 +10,30 @@
 
 import argparse
 import concurrent.futures
+import errno
 import fileinput
 import json
 import logging
 import os
+import shutil
+import signal
 import sys
+import time
+from collections import deque
 
 import flux.constants
-from flux.job import JobID, JobInfo, JobInfoFormat, JobList, job_fields_to_attrs
+from flux.constraint.parser import ConstraintSyntaxError
+from flux.job import (
+    JobID,
+    JobInfo,
+    JobInfoFormat,
+    JobList,
+    JobListConstraintParser,
+    JournalConsumer,
+    job_fields_to_attrs,
+    job_list_id,
+)
+from flux.job.info import InstanceInfo
 from flux.job.stats import JobStats
 from flux.util import (
     FilterAction,
@@ -29,6 +45,9 @@ from flux.util import (
 
 LOGGER = logging.getLogger("flux-jobs")
 
+#  Number of jobs fetched per query when output is streamed (--count=0)
+PAGE_SIZE = 1000
+
 
 class FluxJobsConfig(UtilConfig):
     """flux-jobs specific user configuration class"""
@@ -114,7 +133,10 @@ def need_instance_info(fields):
 
 
 # pylint: disable=too-many-branches
-def fetch_jobs_flux(args, fields, flux_handle=None):
+def joblist_create(args, fields, flux_handle=None):
+    """
+    Return a JobList object for the job listing requested in args
+    """
     if not flux_handle:
         flux_handle = flux.Flux()
 
@@ -156,7 +178,14 @@ def fetch_jobs_flux(args, fields, flux_handle=None):
     if not args.filter:
         args.filter = {"pending", "running"}
 
-    jobs_rpc = JobList(
+    constraint = None
+    if args.filter_expr:
+        try:
+            constraint = JobListConstraintParser().parse(args.filter_expr)
+        except (ConstraintSyntaxError, ValueError) as exc:
+            raise ValueError(f"--filter-expr='{args.filter_expr}': {exc}") from None
+
+    return JobList(
         flux_handle,
         ids=args.jobids,
         attrs=attrs,
@@ -166,15 +195,23 @@ def fetch_jobs_flux(args, fields, flux_handle=None):
         since=since,
         name=args.name,
         queue=args.queue,
+        constraint=constraint,
     )
 
+
+def fetch_jobs_flux(args, fields, flux_handle=None):
+    if not flux_handle:
+        flux_handle = flux.Flux()
+
+    jobs_rpc = joblist_create(args, fields, flux_handle)
+
     jobs = jobs_rpc.jobs()
 
-    if need_instance_info(fields):
-        with concurrent.futures.ThreadPoolExecutor(args.threads) as executor:
-            concurrent.futures.wait(
-                [executor.submit(job.get_instance_info) for job in jobs]
-            )
+    #  Fetch instance.* fields and, with --recursive, the jobs of all
+    #  child instances in the hierarchy:
+    if need_instance_info(fields) or args.recursive:
+        fanout = InstanceFanout(flux_handle, args, fields, cache={})
+        fanout.add_jobs(jobs).run().close()
 
     #  Print all errors accumulated in JobList RPC:
     try:
@@ -269,6 +306,14 @@ def parse_args():
         metavar="QUEUE",
         help="Limit output to specific queue",
     )
+    parser.add_argument(
+        "--filter-expr",
+        action=FilterAction,
+        type=str,
+        metavar="QUERY",
+        help="Limit output to jobs matching constraint QUERY "
+        + "(e.g. 'queue:batch t_run:>=-1h')",
+    )
     parser.add_argument(
         "-o",
         "--format",
@@ -317,7 +362,7 @@ def parse_args():
         "--threads",
         type=int,
         metavar="N",
-        help="Set max number of worker threads",
+        help="Set max number of child instances queried at once (default 32)",
     )
     parser.add_argument(
         "--stats", action="store_true", help="Print job statistics before header"
@@ -329,6 +374,16 @@ def parse_args():
         "if there are no active jobs. Allows usage like: "
         "'while flux jobs --stats-only; do sleep 1; done'",
     )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        type=float,
+        metavar="INTERVAL",
+        nargs="?",
+        const=1.0,
+        help="Continuously update the job listing as jobs change state, "
+        + "at most once every INTERVAL seconds (default 1.0)",
+    )
     parser.add_argument(
         "jobids",
         metavar="JOBID",
@@ -342,21 +397,29 @@ def parse_args():
     return parser.parse_args()
 
 
-def color_setup(args, job):
+RESULT_COLORS = {
+    "COMPLETED": "\033[01;32m",
+    "FAILED": "\033[01;31m",
+    "CANCELED": "\033[37m",
+    "TIMEOUT": "\033[01;31m",
+}
+
+
+def color_code(args, job):
+    """Return the color escape sequence for job, or "" if none"""
     if args.color == "always" or (args.color == "auto" and sys.stdout.isatty()):
         if job.result:
-            if job.result == "COMPLETED":
-                sys.stdout.write("\033[01;32m")
-            elif job.result == "FAILED":
-                sys.stdout.write("\033[01;31m")
-            elif job.result == "CANCELED":
-                sys.stdout.write("\033[37m")
-            elif job.result == "TIMEOUT":
-                sys.stdout.write("\033[01;31m")
-            return True
+            return RESULT_COLORS.get(job.result, "")
         if job.uri:
-            sys.stdout.write("\033[01;34m")
-            return True
+            return "\033[01;34m"
+    return ""
+
+
+def color_setup(args, job):
+    code = color_code(args, job)
+    if code:
+        sys.stdout.write(code)
+        return True
     return False
 
 
@@ -374,26 +437,213 @@ def is_user_instance(job, args):
     )
 
 
-def get_jobs_recursive(job, args, fields):
-    jobs = []
-    stats = None
-    try:
-        #  Don't generate an error if we fail to connect to this
-        #   job. This could be because job services aren't up yet,
-        #   (OSError with errno ENOSYS) or this user is not the owner
-        #   of the job. Either way, simply skip descending into the job
-        #
-        handle = flux.Flux(str(job.uri))
-        jobs = fetch_jobs_flux(args, fields, flux_handle=handle)
-        stats = None
-        if args.stats:
-            stats = JobStats(handle).update_sync()
-    except (OSError, FileNotFoundError):
-        pass
-    return (job, jobs, stats)
-
+class InstanceFanout:
+    """
+    Bounded, reactor-driven fan-out of queries to child instances
+
+    For each job added with :meth:`add_jobs`, connect once to the job's
+    instance and send, concurrently over that one handle, the requests
+    needed for ``instance.*`` fields and, if the job is to be listed
+    recursively, the job listing (and ``--stats``) of the instance.
+    Jobs listed from a child instance are added in turn, so that all
+    levels of the hierarchy are queried concurrently rather than one
+    level at a time.
+
+    Connections are made in a pool of worker threads, since connecting
+    to a remote instance may block, but each child handle then shares
+    the reactor of the parent handle, so all requests are processed by
+    a single reactor. At most ``args.threads`` (default 32) instances
+    are queried at once. Once all requests for an instance are complete,
+    all references to its handle are dropped, including those held by
+    the resulting stats objects, so that the handle is closed.
+
+    Only the requests needed by the ``instance.*`` fields in ``fields``
+    are sent. If ``cache`` is a dict, instance info already fetched for
+    the same instance is reused from it, and successful results are
+    stored there, so the caller determines the lifetime of the cache.
+
+    The job listing and stats of each child instance are stored in
+    the ``child_jobs`` and ``child_stats`` attributes of its JobInfo.
+    """
 
-def print_jobs(jobs, args, formatter, path="", level=0):
+    def __init__(self, handle, args, fields, callback=None, cache=None):
+        self.handle = handle
+        self.args = args
+        self.fields = fields
+        self.callback = callback
+        self.cache = cache
+        self.instance_info = need_instance_info(fields)
+        self.max_active = args.threads or 32
+
+        #  jobids do not apply to child instances:
+        self.child_args = argparse.Namespace(**vars(args))
+        self.child_args.jobids = None
+
+        self.queue = deque()
+        self.active = 0
+        self.executor = None
+        self.connected = deque()
+        self.rfd = None
+        self.wfd = None
+        self.watcher = None
+        self.sync = False
+
+    @property
+    def busy(self):
+        return self.active > 0 or bool(self.queue)
+
+    def add_jobs(self, jobs, level=0, recursive=None):
+        """Queue queries for the child instances of ``jobs``"""
+        if recursive is None:
+            recursive = self.args.recursive
+        for job in jobs:
+            info = bool(self.instance_info and job.uri and job.state_single == "R")
+            recurse = bool(
+                recursive
+                and level < self.args.level
+                and is_user_instance(job, self.args)
+            )
+            if info and self.cache is not None:
+                instance = InstanceInfo.lookup(self.cache, job.uri, self.fields)
+                if instance is not None:
+                    setattr(job, "_instance", instance)
+                    info = False
+                    if not recurse:
+                        continue
+            if info or recurse:
+                self.queue.append((job, level, info, recurse))
+            elif self.instance_info:
+                setattr(job, "_instance", InstanceInfo())
+        self._start()
+        return self
+
+    def _start(self):
+        while self.queue and self.active < self.max_active:
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(self.max_active)
+                self.rfd, self.wfd = os.pipe()
+                self.watcher = self.handle.fd_watcher_create(
+                    self.rfd, self._connected_cb, events=flux.constants.FLUX_POLLIN
+                )
+            if not self.active:
+                self.watcher.start()
+            self.active += 1
+            self.executor.submit(self._connect, self.queue.popleft())
+
+    def _connect(self, item):
+        #  Called in a worker thread
+        handle = None
+        try:
+            handle = flux.Flux(str(item[0].uri))
+        except (OSError, FileNotFoundError):
+            #  Don't generate an error if we fail to connect to this
+            #   job. This could be because job services aren't up yet,
+            #   (OSError with errno ENOSYS) or this user is not the owner
+            #   of the job. Either way, simply skip this job.
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            #  Any other error would otherwise be lost in this thread,
+            #   and the reactor would never be signaled. Report it and
+            #   skip this job.
+            LOGGER.error("%s: %s", item[0].uri, exc)
+        finally:
+            self.connected.append((item, handle))
+            os.write(self.wfd, b"\0")
+
+    def _connected_cb(self, *args):
+        os.read(self.rfd, 4096)
+        while self.connected:
+            self._query(*self.connected.popleft())
+
+    def _query(self, item, handle):
+        job, level, info, recurse = item
+        if recurse:
+            job.child_jobs = []
+            job.child_stats = None
+        if handle is None:
+            if info:
+                setattr(job, "_instance", InstanceInfo())
+            self._complete()
+            return
+
+        handle.set_reactor(self.handle.get_reactor())
+        pending = [info, recurse, recurse and self.args.stats].count(True)
+
+        def complete():
+            nonlocal pending, handle
+            pending -= 1
+            if pending == 0:
+                #  Drop all references to the child handle so it is closed:
+                instance = getattr(job, "_instance", None)
+                for stats in (
+                    getattr(job, "child_stats", None),
+                    getattr(instance, "stats", None),
+                ):
+                    if isinstance(stats, JobStats):
+                        stats.handle = None
+                handle = None
+                self._complete()
+
+        def info_cb(instance):
+            setattr(job, "_instance", instance)
+            complete()
+
+        def jobs_cb(rpc):
+            try:
+                job.child_jobs = [JobInfo(x) for x in rpc.get_jobs()]
+            except OSError:
+                pass
+            #  JSON output only includes one level of child jobs:
+            self.add_jobs(job.child_jobs, level + 1, not self.args.json)
+            complete()
+
+        def stats_cb(rpc):
+            try:
+                job.child_stats = JobStats(handle)
+                job.child_stats._update(rpc.get())
+            except OSError:
+                job.child_stats = None
+            complete()
+
+        if info:
+            InstanceInfo.fetch_async(
+                handle, info_cb, fields=self.fields, uri=job.uri, cache=self.cache
+            )
+        if recurse:
+            joblist = joblist_create(self.child_args, self.fields, handle)
+            joblist.fetch_jobs().then(jobs_cb)
+            if self.args.stats:
+                handle.rpc("job-list.job-stats", {}).then(stats_cb)
+
+    def _complete(self):
+        self.active -= 1
+        self._start()
+        if not self.busy:
+            self.watcher.stop()
+            if self.callback:
+                self.callback()
+            if self.sync:
+                self.handle.reactor_stop()
+
+    def run(self):
+        """Run the reactor until all queued queries are complete"""
+        if self.busy:
+            self.sync = True
+            try:
+                self.handle.reactor_run()
+            finally:
+                self.sync = False
+        return self
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            os.close(self.rfd)
+            os.close(self.wfd)
+            self.executor = None
+
+
+def print_jobs(jobs, args, formatter, path="", level=0, header=False):
     children = []
     # Array of jobs as dict
     result = []
@@ -420,7 +670,9 @@ def print_jobs(jobs, args, formatter, path="", level=0):
             if args.recursive and is_user_instance(job, args):
                 children.append(job)
     else:
-        formatter.print_items(jobs, no_header=True, pre=pre, post=post)
+        formatter = formatter.print_items(
+            jobs, no_header=not header, pre=pre, post=post
+        )
 
     if not args.recursive or args.level == level:
         return result
@@ -428,18 +680,12 @@ def print_jobs(jobs, args, formatter, path="", level=0):
     #  Reset args.jobids since it won't apply recursively:
     args.jobids = None
 
-    futures = []
-    with concurrent.futures.ThreadPoolExecutor(args.threads) as executor:
-        for job in children:
-            futures.append(
-                executor.submit(get_jobs_recursive, job, args, formatter.fields)
-            )
-
     if path:
         path = f"{path}/"
 
-    for future in futures:
-        (job, jobs, stats) = future.result()
+    for job in children:
+        jobs = getattr(job, "child_jobs", [])
+        stats = getattr(job, "child_stats", None)
 
         #  If generating JSON, just add this job's children to a job["jobs"]
         #  array and continue:
@@ -460,6 +706,351 @@ def print_jobs(jobs, args, formatter, path="", level=0):
     return result
 
 
+def can_stream(args, fields):
+    """
+    Return True if jobs can be fetched and printed one page at a time
+    """
+    return (
+        args.count == 0
+        and not args.from_stdin
+        and not args.jobids
+        and not args.json
+        and not args.recursive
+        and not need_instance_info(fields)
+    )
+
+
+def print_jobs_paged(args, formatter):
+    """
+    Fetch and print jobs one page at a time, so that memory use and the
+    time to the first line of output do not depend on the number of jobs.
+    Fields which are omitted if empty for all jobs (``?:``) are evaluated
+    against the first page of jobs only.
+    """
+    sformatter = None
+    for jobs in joblist_create(args, formatter.fields).pages(PAGE_SIZE):
+        if sformatter is None:
+            sformatter = JobInfoFormat(formatter.filter_empty(jobs))
+            if not args.no_header:
+                print(sformatter.header())
+        print_jobs(jobs, args, sformatter)
+        sys.stdout.flush()
+
+    if sformatter is None and not args.no_header:
+        print(JobInfoFormat(formatter.filter_empty([])).header())
+
+
+class JobsWatch:
+    """
+    Live updating job listing for ``flux jobs --watch``
+
+    After one initial listing, follow the job manager journal and
+    refetch only jobs which have had events since the last update, at
+    most once per ``interval`` seconds. Refetched jobs are re-checked
+    against the listing filters, and only their output lines are
+    reformatted. Expensive ``instance.*`` fields are refreshed every
+    ``INSTANCE_INTERVALS`` updates using an :obj:`InstanceFanout`.
+
+    The journal is only available to the instance owner. For other
+    users, or if the journal is refused, the full listing query is
+    instead repeated every ``interval`` seconds.
+
+    On a terminal the listing is redrawn in place on the alternate
+    screen with a status line on the last row. Otherwise, the full
+    listing is printed after each update.
+    """
+
+    #  Minimum state a job will be in after an event, used to detect
+    #  a job-list response which predates the event:
+    EVENT_STATES = {
+        "validate": flux.constants.FLUX_JOB_STATE_DEPEND,
+        "depend": flux.constants.FLUX_JOB_STATE_PRIORITY,
+        "priority": flux.constants.FLUX_JOB_STATE_SCHED,
+        "alloc": flux.constants.FLUX_JOB_STATE_RUN,
+        "finish": flux.constants.FLUX_JOB_STATE_CLEANUP,
+        "clean": flux.constants.FLUX_JOB_STATE_INACTIVE,
+    }
+
+    #  Attributes required by JobList.match() and for sorting:
+    MATCH_ATTRS = {
+        "userid",
+        "priority",
+        "name",
+        "queue",
+        "state",
+        "result",
+        "t_submit",
+        "t_depend",
+        "t_run",
+        "t_cleanup",
+        "t_inactive",
+    }
+
+    INSTANCE_INTERVALS = 10
+
+    def __init__(self, args, formatter):
+        self.args = args
+        self.formatter = formatter
+        self.handle = flux.Flux()
+        self.joblist = joblist_create(args, formatter.fields, self.handle)
+        if "all" not in self.joblist.attrs:
+            self.joblist.attrs = list(self.MATCH_ATTRS.union(self.joblist.attrs))
+        self.tty = sys.stdout.isatty()
+        self.jobs = {}
+        self.lines = {}
+        self.sformatter = None
+        self.dirty = {}
+        self.inflight = set()
+        self.ignored = set()
+        self.instance = None
+        self.ticks = 0
+        self.changed = True
+        self.t_update = None
+        self.consumer = None
+        self.listing = None
+        self.last_listing = None
+        self.watchers = []
+        self.exitcode = 0
+        if need_instance_info(formatter.fields):
+            self.instance = InstanceFanout(
+                self.handle, args, formatter.fields, self._instance_cb
+            )
+
+    def _event_cb(self, event):
+        if event is None:
+            error = self.consumer.error
+            if error is not None and error.errno == errno.EPERM:
+                #  The journal requires owner credentials. Fall back to
+                #  repeating the listing query:
+                self.consumer = None
+                self.dirty.clear()
+                return
+            if error is not None:
+                LOGGER.error("job manager journal: %s", error.strerror)
+            else:
+                LOGGER.error("job manager journal ended unexpectedly")
+            self.exitcode = 1
+            self.handle.reactor_stop()
+            return
+        jobid = event.jobid
+        if event.name == "submit":
+            userid = event.context.get("userid")
+            if (
+                self.joblist.userid != flux.constants.FLUX_USERID_UNKNOWN
+                and userid != self.joblist.userid
+            ):
+                self.ignored.add(jobid)
+        if jobid in self.ignored:
+            if event.name == "clean":
+                self.ignored.discard(jobid)
+            return
+        state = self.EVENT_STATES.get(event.name, 0)
+        if event.name == "exception" and event.context.get("severity") == 0:
+            state = flux.constants.FLUX_JOB_STATE_CLEANUP
+        self.dirty[jobid] = max(state, self.dirty.get(jobid, 0))
+
+    def _fetch_cb(self, rpc, jobid, expected):
+        self.inflight.discard(jobid)
+        try:
+            job = rpc.get_jobinfo()
+        except OSError:
+            #  Job was purged or is otherwise unavailable
+            job = None
+        if job is not None and job.state_id < expected:
+            #  job-list has not yet processed the event, try again later:
+            self.dirty[jobid] = max(expected, self.dirty.get(jobid, 0))
+            return
+        old = self.jobs.pop(jobid, None)
+        self.lines.pop(jobid, None)
+        if job is not None and self.joblist.match(job):
+            self._keep_instance_info(job, old)
+            self.jobs[jobid] = job
+        self.changed = self.changed or old is not None or jobid in self.jobs
+
+    def _keep_instance_info(self, job, old):
+        #  Keep the last instance info until the next refresh
+        if self.instance is None:
+            return
+        if old is not None and job.state_single == "R":
+            job._instance = old._instance
+        else:
+            job._instance = InstanceInfo()
+
+    def _list_cb(self, rpc):
+        self.listing = None
+        try:
+            listing = rpc.get_jobs()
+        except OSError as exc:
+            LOGGER.error("job-list: %s", exc.strerror)
+            return
+        if listing == self.last_listing:
+            return
+        self.last_listing = listing
+        old = self.jobs
+        self.jobs = {}
+        for job in map(JobInfo, listing):
+            self._keep_instance_info(job, old.get(job.id))
+            self.jobs[job.id] = job
+        self.lines.clear()
+        self.changed = True
+
+    def _fetch_listing(self):
+        #  Repeat the full listing query, if the previous one is complete
+        if self.listing is None:
+            self.listing = self.joblist.fetch_jobs()
+            self.listing.then(self._list_cb)
+
+    def _fetch_dirty(self):
+        for jobid in list(self.dirty):
+            if jobid in self.inflight:
+                continue
+            expected = self.dirty.pop(jobid)
+            self.inflight.add(jobid)
+            job_list_id(self.handle, jobid, self.joblist.attrs).then(
+                self._fetch_cb, jobid, expected
+            )
+
+    def _instance_cb(self):
+        self.lines.clear()
+        self.changed = True
+
+    def _refresh_instance_info(self):
+        if self.instance.busy or self.ticks % self.INSTANCE_INTERVALS:
+            return
+        if self.ticks > 0:
+            self.instance.add_jobs(self.jobs.values(), recursive=False)
+
+    @staticmethod
+    def _sort_key(job):
+        if job.state_id < flux.constants.FLUX_JOB_STATE_RUN:
+            return (0, -(job.priority or 0), job.id)
+        if job.state_id < flux.constants.FLUX_JOB_STATE_INACTIVE:
+            return (1, -job.t_run, job.id)
+        return (2, -job.t_inactive, job.id)
+
+    def _status(self, jobs, width):
+        counts = {"pending": 0, "running": 0, "inactive": 0}
+        for job in jobs:
+            if job.state_id < flux.constants.FLUX_JOB_STATE_RUN:
+                counts["pending"] += 1
+            elif job.state_id < flux.constants.FLUX_JOB_STATE_INACTIVE:
+                counts["running"] += 1
+            else:
+                counts["inactive"] += 1
+        text = f"{len(jobs)} jobs: " + ", ".join(
+            f"{count} {name}" for name, count in counts.items()
+        )
+        updated = time.strftime("%H:%M:%S", time.localtime(self.t_update))
+        return text + f"updated {updated}".rjust(width - len(text))
+
+    def _line(self, job):
+        try:
+            return self.lines[job.id]
+        except KeyError:
+            line = self.sformatter.format(job)
+            code = color_code(self.args, job)
+            if code:
+                line = f"{code}{line}\033[0;0m"
+            self.lines[job.id] = line
+            return line
+
+    def render(self):
+        jobs = sorted(self.jobs.values(), key=self._sort_key)
+        if self.args.count:
+            for job in jobs[self.args.count :]:
+                del self.jobs[job.id]
+                self.lines.pop(job.id, None)
+            jobs = jobs[: self.args.count]
+
+        sformatter = JobInfoFormat(self.formatter.filter_empty(jobs))
+        if self.sformatter is None or sformatter.fmt != self.sformatter.fmt:
+            self.sformatter = sformatter
+            self.lines.clear()
+
+        if not self.tty:
+            if not self.args.no_header:
+                print(self.sformatter.header())
+            for job in jobs:
+                print(self._line(job))
+            print(flush=True)
+            return
+
+        size = shutil.get_terminal_size()
+        lines = []
+        if not self.args.no_header:
+            lines.append(self.sformatter.header())
+        lines.extend(self._line(job) for job in jobs[: size.lines - 1 - len(lines)])
+        sys.stdout.write(
+            "\033[H"  # move cursor home
+            "\033[?7l"  # disable line wrap
+            + "".join(f"{line}\033[K\n" for line in lines)
+            + "\033[J"  # clear to end of screen
+            + f"\033[{size.lines};1H"  # move cursor to bottom row
+            + f"\033[7m{self._status(jobs, size.columns)}\033[0m"
+            + "\033[?7h"  # enable line wrap
+        )
+        sys.stdout.flush()
+
+    def _tick_cb(self, *args):
+        if self.instance is not None:
+            self._refresh_instance_info()
+        if self.consumer is not None:
+            self._fetch_dirty()
+        else:
+            self._fetch_listing()
+        self.ticks += 1
+        if self.changed:
+            self.changed = False
+            self.t_update = time.time()
+            self.render()
+
+    def _stop_cb(self, *args):
+        self.handle.reactor_stop()
+
+    def _resize_cb(self, *args):
+        self.render()
+
+    def run(self):
+        #  Start the journal consumer before the initial listing so that
+        #  no events are missed. Events replayed from the journal backlog,
+        #  or already reflected in the listing, only cause an unnecessary
+        #  refetch of the affected jobs. The journal requires owner
+        #  credentials, so other users repeat the listing query instead.
+        if int(self.handle.attr_get("security.owner")) == os.getuid():
+            self.consumer = JournalConsumer(self.handle)
+            self.consumer.set_callback(self._event_cb).start()
+        for job in self.joblist.jobs():
+            self.jobs[job.id] = job
+        for err in self.joblist.errors:
+            LOGGER.error(err)
+        if self.instance is not None:
+            self.instance.add_jobs(self.jobs.values(), recursive=False).run()
+
+        self.watchers = [
+            self.handle.timer_watcher_create(0.0, self._tick_cb, self.args.watch),
+            self.handle.signal_watcher_create(signal.SIGINT, self._stop_cb),
+            self.handle.signal_watcher_create(signal.SIGTERM, self._stop_cb),
+            self.handle.signal_watcher_create(signal.SIGWINCH, self._resize_cb),
+        ]
+        for watcher in self.watchers:
+            watcher.start()
+
+        if self.tty:
+            #  Switch to the alternate screen and hide the cursor
+            sys.stdout.write("\033[?1049h\033[?25l")
+        try:
+            self.handle.reactor_run()
+        finally:
+            if self.tty:
+                sys.stdout.write("\033[?25h\033[?1049l")
+                sys.stdout.flush()
+            if self.consumer is not None:
+                self.consumer.stop()
+            if self.instance is not None:
+                self.instance.close()
+        return self.exitcode
+
+
 @flux.util.CLIMain(LOGGER)
 def main():
 
@@ -471,6 +1062,14 @@ def main():
         LOGGER.error("--json incompatible with --stats or --stats-only")
         sys.exit(1)
 
+    if args.watch is not None:
+        if args.json or args.recursive or args.recurse_all or args.from_stdin:
+            LOGGER.error("--watch incompatible with --json or --recursive")
+            sys.exit(1)
+        if args.watch <= 0:
+            LOGGER.error("--watch interval must be greater than zero")
+            sys.exit(1)
+
     if args.jobids and args.filtered and not args.recursive:
         LOGGER.warning("Filtering options ignored with jobid list")
 
@@ -498,13 +1097,16 @@ def main():
         if args.stats_only:
             sys.exit(0 if stats.active else 1)
 
-    jobs = fetch_jobs(args, formatter.fields)
-    sformatter = JobInfoFormat(formatter.filter_empty(jobs))
+    if args.watch is not None:
+        sys.exit(JobsWatch(args, formatter).run())
 
-    if not args.no_header:
-        print(sformatter.header())
+    if can_stream(args, formatter.fields):
+        print_jobs_paged(args, formatter)
+        return
+
+    jobs = fetch_jobs(args, formatter.fields)
 
-    result = print_jobs(jobs, args, sformatter)
+    result = print_jobs(jobs, args, formatter, header=not args.no_header)
     if args.json:
         # Only emit single JSON object if user asked for one specific job
         if args.jobids and len(args.jobids) == 1:
@@ -17,7 +17,8 @@ from itertools import islice
 from pathlib import PurePath
 
 import flux
-from flux.job import JobID, JobInfoFormat, JobList
+from flux.constraint.parser import ConstraintSyntaxError
+from flux.job import JobID, JobInfoFormat, JobList, JobListConstraintParser
 from flux.util import FilterActionSetUpdate, UtilConfig
 
 PROGRAM = PurePath(sys.argv[0]).stem
@@ -116,12 +117,20 @@ def fetch_jobs(args, flux_handle=None):
     if not args.filter:
         args.filter = {"pending", "running"}
 
+    constraint = None
+    if args.filter_expr:
+        try:
+            constraint = JobListConstraintParser().parse(args.filter_expr)
+        except (ConstraintSyntaxError, ValueError) as exc:
+            raise ValueError(f"--filter-expr='{args.filter_expr}': {exc}") from None
+
     jobs_rpc = JobList(
         flux_handle,
         filters=args.filter,
         user=args.user,
         max_entries=args.max_entries,
         queue=args.queue,
+        constraint=constraint,
     )
     jobs = jobs_rpc.jobs()
 
@@ -171,6 +180,12 @@ def parse_args():
         metavar="QUEUE",
         help="Limit output to specific queue",
     )
+    parser.add_argument(
+        "--filter-expr",
+        type=str,
+        metavar="QUERY",
+        help="Only match jobs matching constraint QUERY",
+    )
     parser.add_argument(
         "-c",
         "--count",
@@ -219,24 +234,24 @@ def parse_args():
 def pkill(fh, args, jobs):
     success = 0
     exitcode = 0
+    canceled = []
 
-    def wait_cb(future, job):
-        future.get_dict()
-
-    def cancel_cb(future, args, job):
+    def cancel_cb(future, job):
         nonlocal success, exitcode
         try:
             future.get()
             success = success + 1
-            if args.wait:
-                flux.job.result_async(fh, job.id).then(wait_cb, job)
+            canceled.append(job.id)
         except OSError as exc:
             exitcode = 1
             LOGGER.error(f"{job.id}: cancel: {exc}")
 
     for job in jobs:
-        flux.job.cancel_async(fh, job.id).then(cancel_cb, args, job)
+        flux.job.cancel_async(fh, job.id).then(cancel_cb, job)
     fh.reactor_run()
+    if args.wait:
+        for _ in flux.job.results(fh, canceled):
+            pass
     LOGGER.info("Canceled %d job%s", success, "s" if success != 1 else "")
     sys.exit(exitcode)
 
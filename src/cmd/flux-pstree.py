@@ -98,6 +98,14 @@ class TreeFormatter:
                     sys.exit(1)
             self.prefix = JobInfoFormat(args.prefix_format)
 
+    @property
+    def fields(self):
+        """All fields used by the label, parent label, and prefix formats"""
+        fields = self.label.fields + self.parent.fields
+        if self.prefix:
+            fields += self.prefix.fields
+        return fields
+
     def format(self, job, parent):
         """Format provided job label (as parent label if parent == True)"""
         if parent:
@@ -113,7 +121,7 @@ class TreeFormatter:
 
 def process_entry(entry, formatter, filters, level, max_level, combine):
 
-    job = JobInfo(entry).get_instance_info()
+    job = JobInfo(entry).get_instance_info(formatter.fields)
 
     # pylint: disable=comparison-with-callable
     parent = job.uri and job.state_single == "R"
@@ -345,7 +353,7 @@ class RootJobID(JobID):
         return "."
 
 
-def get_root_jobinfo():
+def get_root_jobinfo(fields=None):
     """Fetch a mock JobInfo object for the current enclosing instance"""
 
     handle = flux.Flux()
@@ -385,7 +393,7 @@ def get_root_jobinfo():
     info["ranks"] = "0-{}".format(int(size) - 1)
 
     #  Fetch instance-specific information for the current instance:
-    job = JobInfo(info).get_instance_info()
+    job = JobInfo(info).get_instance_info(fields)
 
     #  If no jobid was discovered for the root instance, use RootJobID()
     if job.id == 0:
@@ -422,7 +430,7 @@ def main():
         label = "."
         prefix = None
     else:
-        root = get_root_jobinfo()
+        root = get_root_jobinfo(formatter.fields)
         label = formatter.format(root, True)
         prefix = formatter.format_prefix(root)
 
@@ -9,19 +9,80 @@
 # SPDX-License-Identifier: LGPL-3.0
 ##############################################################
 
-import sys
-import time
 import argparse
 import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
 
 import flux
 from flux import job
-from flux.job import JobspecV1
+from flux.constants import FLUX_JOB_URGENCY_HOLD
+from flux.job import FluxExecutor, JobInfo, JobspecV1, JournalConsumer
+from flux.job.info import JobInfoFormat
 from flux.progress import Bottombar
 
+#  Registered benchmarks, in order of registration. See benchmark() below.
+BENCHMARKS = {}
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Run job throughput test")
+    parser.add_argument(
+        "-b",
+        "--bench",
+        metavar="NAME,...",
+        help="Run benchmarks NAME,... or 'all' (default=events). "
+        + "Use --list to show available benchmarks.",
+        default="events",
+    )
+    parser.add_argument(
+        "-l",
+        "--list",
+        help="List available benchmarks and exit",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-j",
+        "--json",
+        metavar="FILE",
+        help="Write machine-readable results to FILE ('-' for stdout, "
+        + "in which case all other output goes to stderr)",
+    )
+    parser.add_argument(
+        "-B",
+        "--baseline",
+        metavar="FILE",
+        help="Compare results against baseline results in FILE, as written "
+        + "by a previous run with --json. Exit with nonzero status if any "
+        + "benchmark regressed by more than --threshold.",
+    )
+    parser.add_argument(
+        "-T",
+        "--threshold",
+        type=float,
+        metavar="PCT",
+        help="Regression threshold in percent for --baseline (default=10)",
+        default=10.0,
+    )
+    parser.add_argument(
+        "--list-queries",
+        type=int,
+        metavar="N",
+        help="Number of queries to time in the joblist benchmark (default=5)",
+        default=5,
+    )
+    parser.add_argument(
+        "--output-size",
+        type=float,
+        metavar="MB",
+        help="Output written by each job in the output-rate benchmark "
+        + "(default=16)",
+        default=16.0,
+    )
     parser.add_argument(
         "-n",
         "--njobs",
@@ -72,12 +133,12 @@ def parse_args():
     return parser.parse_args()
 
 
-def create_test_jobspec(args):
+def create_test_jobspec(args, command=None, simulate=True):
 
     #  Create a test jobspec
     if not args.command:
         args.command = ["true"]
-    jobspec = JobspecV1.from_command(args.command)
+    jobspec = JobspecV1.from_command(command or args.command)
 
     #  Set any requested shell options
     if args.setopt is not None:
@@ -103,7 +164,7 @@ def create_test_jobspec(args):
                 val = tmp[1]
             jobspec.setattr(key, val)
 
-    if not args.exec:
+    if simulate and not args.exec:
         jobspec.setattr("system.exec.test.run_duration", args.runtime)
 
     return jobspec
@@ -178,15 +239,25 @@ class BulkRun:
         return self
 
 
-def main():
+def benchmark(name, description):
+    """Register a benchmark function under name"""
 
-    args = parse_args()
+    def decorator(func):
+        BENCHMARKS[name] = (func, description)
+        return func
 
-    time0 = time.time()
+    return decorator
 
-    jobspec = create_test_jobspec(args)
 
-    bulk = BulkRun(flux.Flux(), args.njobs, jobspec).run(args)
+def rate(njobs, elapsed):
+    return njobs / elapsed if elapsed > 0 else 0.0
+
+
+@benchmark("events", "submit and run jobs with a per-job eventlog watch")
+def bench_events(handle, args, jobspec):
+    time0 = time.time()
+
+    bulk = BulkRun(handle, args.njobs, jobspec).run(args)
 
     jobs = bulk.jobs
 
@@ -199,18 +270,407 @@ def main():
     #  Get the job with the latest 't_submit' time:
     lastsubmit = jobs[max(jobs.keys(), key=lambda x: jobs[x]["t_submit"])]
     submit_time = lastsubmit["t_submit"] - time0
-    sjps = args.njobs / submit_time
 
     script_runtime = time.time() - time0
     job_runtime = last["clean"].timestamp - first["submit"].timestamp
-    jps = args.njobs / job_runtime
-    jpsb = args.njobs / script_runtime
 
     print(f"number of jobs: {args.njobs}")
-    print(f"submit time:    {submit_time:<6.3f}s ({sjps:5.1f} job/s)")
+    print(
+        f"submit time:    {submit_time:<6.3f}s "
+        f"({rate(args.njobs, submit_time):5.1f} job/s)"
+    )
     print(f"script runtime: {script_runtime:<6.3f}s")
     print(f"job runtime:    {job_runtime:<6.3f}s")
-    print(f"throughput:     {jps:<.1f} job/s (script: {jpsb:5.1f} job/s)")
+    print(
+        f"throughput:     {rate(args.njobs, job_runtime):<.1f} job/s "
+        f"(script: {rate(args.njobs, script_runtime):5.1f} job/s)"
+    )
+    return {
+        "njobs": args.njobs,
+        "elapsed": script_runtime,
+        "jps": rate(args.njobs, job_runtime),
+        "submit_time": submit_time,
+        "submit_jps": rate(args.njobs, submit_time),
+        "job_runtime": job_runtime,
+    }
+
+
+@benchmark("submit", "submit held jobs only (jobs are canceled afterwards)")
+def bench_submit(handle, args, jobspec):
+    spec = jobspec.dumps()
+    time0 = time.time()
+    futures = [
+        job.submit_async(handle, spec, urgency=FLUX_JOB_URGENCY_HOLD)
+        for _ in range(args.njobs)
+    ]
+    jobids = [future.get_id() for future in futures]
+    elapsed = time.time() - time0
+
+    #  Clean up held jobs so they do not affect subsequent benchmarks:
+    for future in [job.cancel_async(handle, jobid) for jobid in jobids]:
+        future.get()
+
+    return {"njobs": args.njobs, "elapsed": elapsed, "jps": rate(args.njobs, elapsed)}
+
+
+class JournalRun:
+    """
+    Submit jobs and wait for completion using a single JournalConsumer
+    instead of per-job eventlog watches
+    """
+
+    def __init__(self, handle, total, jobspec):
+        self.handle = handle
+        self.total = total
+        self.jobspec = jobspec
+        self.pending = set()
+        self.early = set()
+        self.complete = 0
+        self.consumer = None
+
+    def done(self):
+        if self.complete == self.total:
+            self.consumer.stop()
+
+    def clean_cb(self, event):
+        if event is None:
+            if self.consumer.error is not None:
+                raise self.consumer.error
+            return
+        if event.jobid in self.pending:
+            self.pending.discard(event.jobid)
+            self.complete += 1
+            self.done()
+        else:
+            #  clean event arrived before submit response, or not our job:
+            self.early.add(event.jobid)
+
+    def submit_cb(self, future):
+        jobid = future.get_id()
+        if jobid in self.early:
+            self.early.discard(jobid)
+            self.complete += 1
+            self.done()
+        else:
+            self.pending.add(jobid)
+
+    def run(self):
+        self.consumer = JournalConsumer(self.handle, allow=["clean"])
+        self.consumer.set_callback(self.clean_cb).start()
+        spec = self.jobspec.dumps()
+        for _ in range(self.total):
+            job.submit_async(self.handle, spec).then(self.submit_cb)
+        self.handle.reactor_run()
+        return self
+
+
+@benchmark("complete", "submit and run jobs, watching completion via the journal")
+def bench_complete(handle, args, jobspec):
+    time0 = time.time()
+    JournalRun(handle, args.njobs, jobspec).run()
+    elapsed = time.time() - time0
+    return {"njobs": args.njobs, "elapsed": elapsed, "jps": rate(args.njobs, elapsed)}
+
+
+@benchmark("executor", "submit and run jobs with FluxExecutor")
+def bench_executor(handle, args, jobspec):
+    time0 = time.time()
+    with FluxExecutor() as executor:
+        futures = [executor.submit(jobspec) for _ in range(args.njobs)]
+        for future in futures:
+            future.result()
+    elapsed = time.time() - time0
+    return {"njobs": args.njobs, "elapsed": elapsed, "jps": rate(args.njobs, elapsed)}
+
+
+def cli_options(args):
+    """Return flux-submit(1) options equivalent to create_test_jobspec()"""
+    opts = []
+    for keyval in args.setopt or []:
+        opts.append(f"--setopt={keyval}")
+    for keyval in args.setattr or []:
+        opts.append(f"--setattr={keyval}")
+    if not args.exec:
+        opts.append(f"--setattr=system.exec.test.run_duration={args.runtime}")
+    return opts
+
+
+def run_cli(cmd, args, stdin=None):
+    time0 = time.time()
+    subprocess.run(cmd, input=stdin, text=True, stdout=sys.stdout, check=True)
+    elapsed = time.time() - time0
+    return {"njobs": args.njobs, "elapsed": elapsed, "jps": rate(args.njobs, elapsed)}
+
+
+@benchmark("cli-submit", "flux submit --cc=1-N --wait")
+def bench_cli_submit(handle, args, jobspec):
+    cmd = ["flux", "submit", "--quiet", "--wait", f"--cc=1-{args.njobs}"]
+    return run_cli(cmd + cli_options(args) + args.command, args)
+
+
+@benchmark("cli-bulksubmit", "flux bulksubmit --wait with N inputs")
+def bench_cli_bulksubmit(handle, args, jobspec):
+    cmd = ["flux", "bulksubmit", "--quiet", "--wait", "--setattr=user.bench={}"]
+    stdin = "".join(f"{i}\n" for i in range(args.njobs))
+    return run_cli(cmd + cli_options(args) + args.command, args, stdin=stdin)
+
+
+@benchmark("joblist", "job-list query latency with at least N inactive jobs")
+def bench_joblist(handle, args, jobspec):
+    def query(attrs):
+        times = []
+        count = 0
+        for _ in range(args.list_queries):
+            time0 = time.time()
+            count = len(job.job_list(handle, max_entries=0, attrs=attrs).get_jobs())
+            times.append(time.time() - time0)
+        return count, statistics.median(times), min(times)
+
+    #  Ensure at least njobs jobs exist in the instance:
+    count, _, _ = query([])
+    if count < args.njobs:
+        JournalRun(handle, args.njobs - count, jobspec).run()
+
+    result = {}
+    for label, attrs in (("ids", []), ("all", ["all"])):
+        count, median, fastest = query(attrs)
+        result[f"{label}_latency"] = median
+        result[f"{label}_latency_min"] = fastest
+    result["njobs"] = count
+    result["elapsed"] = result["all_latency"]
+    result["jps"] = rate(count, result["all_latency"])
+    return result
+
+
+class OutputRun:
+    """
+    Submit jobs and watch output of each job until EOF
+    """
+
+    def __init__(self, handle, total, jobspec):
+        self.handle = handle
+        self.total = total
+        self.jobspec = jobspec
+        self.lines = 0
+        self.bytes = 0
+        self.complete = 0
+        self.t_first = None
+        self.t_last = None
+
+    def output_cb(self, future):
+        stream, data = future.get_output()
+        if stream is None:
+            self.complete += 1
+        else:
+            if self.t_first is None:
+                self.t_first = time.time()
+            self.t_last = time.time()
+            self.lines += 1
+            self.bytes += len(data)
+
+    def submit_cb(self, future):
+        jobid = future.get_id()
+        job.output_watch_async(self.handle, jobid).then(self.output_cb)
+
+    def run(self):
+        spec = self.jobspec.dumps()
+        for _ in range(self.total):
+            job.submit_async(self.handle, spec).then(self.submit_cb)
+        self.handle.reactor_run()
+        return self
+
+
+@benchmark("output", "run jobs for real and watch their output")
+def bench_output(handle, args, jobspec):
+    #  Output is only produced by real job execution, so ignore the
+    #  simulated execution duration. Use `echo` unless a command was given:
+    command = args.command
+    if command == ["true"]:
+        command = ["echo", "hello"]
+    jobspec = create_test_jobspec(args, command=command, simulate=False)
+    time0 = time.time()
+    run = OutputRun(handle, args.njobs, jobspec).run()
+    elapsed = time.time() - time0
+    return {
+        "njobs": args.njobs,
+        "elapsed": elapsed,
+        "jps": rate(args.njobs, elapsed),
+        "lines": run.lines,
+    }
+
+
+@benchmark("output-rate", "measure MB/s of job output delivered to output watchers")
+def bench_output_rate(handle, args, jobspec):
+    #  Like `flux job attach`, watch the output of each job as it is
+    #  produced. Each job writes --output-size MB to stdout:
+    nbytes = int(args.output_size * 1024 * 1024)
+    command = ["sh", "-c", f"yes flux-output-benchmark | head -c {nbytes}"]
+    jobspec = create_test_jobspec(args, command=command, simulate=False)
+    time0 = time.time()
+    run = OutputRun(handle, args.njobs, jobspec).run()
+    elapsed = time.time() - time0
+
+    #  Rate is computed from the first to the last chunk of output
+    #  received, so it excludes job startup:
+    output_time = 0.0
+    if run.t_first is not None:
+        output_time = run.t_last - run.t_first
+    megabytes = run.bytes / (1024 * 1024)
+    return {
+        "njobs": args.njobs,
+        "elapsed": elapsed,
+        "jps": rate(args.njobs, elapsed),
+        "bytes": run.bytes,
+        "output_time": output_time,
+        "mbps": rate(megabytes, output_time),
+    }
+
+
+def synthetic_jobs(njobs):
+    """Return njobs synthetic job-list responses for offline benchmarks"""
+    t_submit = time.time() - 3600.0
+    userid = os.getuid()
+    return [
+        {
+            "id": (i + 1) << 24,
+            "userid": userid,
+            "urgency": 16,
+            "priority": 16,
+            "state": flux.constants.FLUX_JOB_STATE_INACTIVE,
+            "result": flux.constants.FLUX_JOB_RESULT_COMPLETED,
+            "name": f"job{i}",
+            "queue": "batch",
+            "ntasks": 1,
+            "ncores": 1,
+            "nnodes": 1,
+            "ranks": "0",
+            "nodelist": "node0",
+            "duration": 60.0,
+            "expiration": t_submit + 60.0,
+            "waitstatus": 0,
+            "success": True,
+            "t_submit": t_submit + i * 0.001,
+            "t_depend": t_submit + i * 0.001,
+            "t_run": t_submit + i * 0.001 + 0.1,
+            "t_cleanup": t_submit + i * 0.001 + 0.2,
+            "t_inactive": t_submit + i * 0.001 + 0.3,
+            "exception_occurred": False,
+            "annotations": {"sched": {"queue": "batch"}},
+        }
+        for i in range(njobs)
+    ]
+
+
+@benchmark("jobinfo", "construct and format JobInfo objects (no instance required)")
+def bench_jobinfo(handle, args, jobspec):
+    entries = synthetic_jobs(args.njobs)
+    fmt = JobInfoFormat(
+        "{id.f58:>12} ?:{queue:<8.8} {username:<8.8} {name:<10.10+} "
+        "{status_abbrev:>2.2} {ntasks:>6} {nnodes:>6h} "
+        "{contextual_time!F:>8h} {contextual_info}"
+    )
+
+    time0 = time.time()
+    jobs = [JobInfo(entry) for entry in entries]
+    construct_time = time.time() - time0
+
+    time0 = time.time()
+    fmt = JobInfoFormat(fmt.filter_empty(jobs))
+    lines = [fmt.format(job) for job in jobs]
+    format_time = time.time() - time0
+
+    elapsed = construct_time + format_time
+    return {
+        "njobs": len(lines),
+        "elapsed": elapsed,
+        "jps": rate(len(lines), elapsed),
+        "construct_time": construct_time,
+        "format_time": format_time,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Print comparison of results against baseline. Return the number of
+    benchmarks with a throughput regression greater than threshold percent.
+    """
+    regressions = 0
+    print(f"{'BENCHMARK':<16} {'BASELINE':>12} {'CURRENT':>12} {'CHANGE':>8}")
+    for name, result in results.items():
+        if name not in baseline["benchmarks"]:
+            continue
+        base = baseline["benchmarks"][name]["jps"]
+        change = 100.0 * (result["jps"] - base) / base if base else 0.0
+        flag = ""
+        if change < -threshold:
+            flag = " REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<16} {base:>12.1f} {result['jps']:>12.1f} "
+            f"{change:>+7.1f}%{flag}"
+        )
+    return regressions
+
+
+def main():
+
+    args = parse_args()
+
+    if args.list:
+        for name, (_, description) in BENCHMARKS.items():
+            print(f"{name:<16} {description}")
+        sys.exit(0)
+
+    names = args.bench.split(",")
+    if names == ["all"]:
+        names = list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"unknown benchmark {name}")
+
+    #  With --json=-, stdout is reserved for the JSON results, so send
+    #  all human-readable output to stderr:
+    json_stream = sys.stdout
+    if args.json == "-":
+        sys.stdout = sys.stderr
+
+    jobspec = create_test_jobspec(args)
+    handle = flux.Flux()
+
+    results = {}
+    for name in names:
+        func, _ = BENCHMARKS[name]
+        results[name] = func(handle, args, jobspec)
+        if name != "events":
+            result = results[name]
+            print(
+                f"{name}: {result['njobs']} jobs in {result['elapsed']:.3f}s "
+                f"({result['jps']:.1f} job/s)"
+            )
+            if "mbps" in result:
+                print(f"{name}: {result['mbps']:.1f} MB/s of output")
+
+    if args.json:
+        output = {
+            "version": 1,
+            "timestamp": time.time(),
+            "host": platform.node(),
+            "flux-version": handle.attr_get("version"),
+            "njobs": args.njobs,
+            "exec": args.exec,
+            "benchmarks": results,
+        }
+        if args.json == "-":
+            print(json.dumps(output, indent=2), file=json_stream)
+        else:
+            with open(args.json, "w") as fp:
+                json.dump(output, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -53,6 +53,29 @@ allowed-types = [ "none" ]
         with self.assertRaisesRegex(EnvironmentError, "sign-unwrap:.*"):
             unwrapped_payload, wrapping_user = self.context.sign_unwrap(b"foo")
 
+    def test_02_signed_jobspec_cache(self):
+        from flux.job import JobspecV1, SignedJobspecCache
+
+        jobspec = JobspecV1.from_command(["true"])
+        signer = SignedJobspecCache(context=self.context, ttl=60)
+        signed = signer.sign(jobspec)
+        self.assertIs(signer.sign(jobspec), signed)
+        self.assertEqual(signer.hits, 1)
+        self.assertEqual(signer.misses, 1)
+        payload, userid = self.context.sign_unwrap(signed)
+        self.assertEqual(payload[:].decode("utf-8"), jobspec.dumps())
+
+        # A different jobspec is signed separately:
+        other = JobspecV1.from_command(["false"])
+        self.assertIsNot(signer.sign(other), signed)
+        self.assertEqual(signer.misses, 2)
+
+        # Expired signatures are not reused:
+        signer = SignedJobspecCache(context=self.context, ttl=0)
+        signer.sign(jobspec)
+        signer.sign(jobspec)
+        self.assertEqual(signer.hits, 0)
+
 
 if __name__ == "__main__":
     from subflux import rerun_under_flux
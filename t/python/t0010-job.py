@@ -27,6 +27,7 @@ import flux.kvs
 import yaml
 from flux import job
 from flux.job import JobInfo, Jobspec, JobspecV1, ffi
+from flux.job.info import InstanceInfo, InstanceResources
 from flux.job.stats import JobStats
 
 
@@ -713,6 +714,35 @@ class TestJob(unittest.TestCase):
         # synchronous job.result() test
         self.assertEqual(job.result(self.fh, ids[3]), result[ids[3]].get_info())
 
+    def test_32_1_job_results(self):
+        ids = [
+            job.submit(self.fh, JobspecV1.from_command(["true"])),
+            job.submit(self.fh, JobspecV1.from_command(["false"])),
+            job.submit(self.fh, JobspecV1.from_command(["true"])),
+        ]
+        results = {}
+        for result in job.results(self.fh, ids + [123456], max_concurrency=2):
+            results[result["id"]] = result
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[ids[0]]["waitstatus"], 0)
+        self.assertEqual(results[ids[1]]["waitstatus"] >> 8, 1)
+        self.assertEqual(results[123456]["errno"], errno.ENOENT)
+
+        # asynchronous interface with get_info()
+        infos = []
+
+        def cb(future):
+            info = future.get_info()
+            if info is not None:
+                infos.append(info)
+
+        job.results_async(self.fh, ids).then(cb)
+        self.fh.reactor_run()
+        self.assertListEqual(sorted(x.id for x in infos), sorted(ids))
+
+        # empty list of jobids
+        self.assertListEqual(list(job.results(self.fh, [])), [])
+
     def test_33_get_job(self):
         self.sleep_jobspec = JobspecV1.from_command(["sleep", "5"])
         jobid = job.submit(self.fh, self.sleep_jobspec)
@@ -764,6 +794,125 @@ class TestJob(unittest.TestCase):
         except OSError:
             pass
 
+    def test_35_jobinfo_lazy(self):
+        resp = {
+            "id": 1234,
+            "state": flux.constants.FLUX_JOB_STATE_SCHED,
+            "t_submit": 1.0,
+            "annotations": {"sched": {"t_estimate": 10.0}, "user": {"a": 1}},
+        }
+        info = JobInfo(resp)
+        self.assertEqual(info.id, 1234)
+        self.assertEqual(info.state, "SCHED")
+        self.assertEqual(info.state_id, flux.constants.FLUX_JOB_STATE_SCHED)
+        self.assertEqual(info.result_id, "")
+        self.assertEqual(info.name, "")
+        self.assertEqual(info.sched.t_estimate, 10.0)
+        self.assertEqual(str(info.sched.nosuchkey), "")
+        self.assertFalse(info.exception.occurred)
+        self.assertListEqual(info.dependencies, [])
+        with self.assertRaises(AttributeError):
+            info.nosuchattr
+
+        #  The job-list response is not modified:
+        self.assertListEqual(
+            list(resp.keys()), ["id", "state", "t_submit", "annotations"]
+        )
+
+        #  Sub-objects are memoized:
+        self.assertIs(info.annotations, info.annotations)
+
+        #  Jobs with the same annotation keys share a namedtuple type:
+        resp["id"] = 1235
+        info2 = JobInfo(resp)
+        self.assertIs(type(info.annotations.atuple), type(info2.annotations.atuple))
+
+    def test_36_instance_resources(self):
+        def rv1(*entries):
+            r_lite = [{"rank": r, "children": c} for r, c in entries]
+            return {"version": 1, "execution": {"R_lite": r_lite}}
+
+        resp = {
+            "all": rv1(("0-3", {"core": "0-3", "gpu": "0"})),
+            "down": rv1(("3", {"core": "0-3", "gpu": "0"})),
+            "allocated": rv1(
+                ("0-1", {"core": "0-1"}), ("2", {"core": "0-3", "gpu": "0"})
+            ),
+        }
+        expected = {
+            "all": (16, 4, 4),
+            "down": (4, 1, 1),
+            "allocated": (8, 1, 3),
+            "up": (12, 3, 3),
+            "free": (4, 2, 2),
+        }
+        resources = InstanceResources(resp)
+        for state, counts in expected.items():
+            res = resources[state]
+            self.assertEqual((res.ncores, res.ngpus, res.nnodes), counts, state)
+
+        info = InstanceInfo()
+        info._update(self.fh, {"resource-status": resp})
+        self.assertEqual(info.utilization, 0.5)
+        self.assertEqual(info.gpu_utilization, 0.25)
+
+    def test_37_instance_info_requests(self):
+        self.assertSetEqual(
+            InstanceInfo.requests(["id", "instance.stats.total"]), {"job-stats"}
+        )
+        self.assertSetEqual(
+            InstanceInfo.requests(["instance.resources.up.ncores"]),
+            {"resource-status"},
+        )
+        self.assertSetEqual(InstanceInfo.requests(["id", "name"]), set())
+        self.assertSetEqual(InstanceInfo.requests(), {"job-stats", "resource-status"})
+
+        #  No requests are needed, so no connection is attempted:
+        cache = {}
+        uri = "local:///nonexistent"
+        info = InstanceInfo.cached(cache, uri, ["id"])
+        self.assertFalse(info.initialized)
+        self.assertIs(InstanceInfo.lookup(cache, uri, ["id"]), info)
+        self.assertIsNone(InstanceInfo.lookup(cache, uri, ["instance.progress"]))
+        self.assertIsNone(InstanceInfo.lookup({}, uri, ["id"]))
+
+        #  A failed fetch is not cached:
+        info = InstanceInfo.cached(cache, uri, ["instance.progress"])
+        self.assertFalse(info.initialized)
+        self.assertSetEqual(info.fetched, set())
+        self.assertIsNone(InstanceInfo.lookup(cache, uri, ["instance.progress"]))
+
+    def test_38_parse_eventlog(self):
+        jobid = job.submit(self.fh, JobspecV1.from_command(["true"]), waitable=True)
+        job.wait(self.fh, jobid)
+        data = job.job_kvs_lookup(self.fh, jobid, keys=["eventlog"], decode=False)
+        eventlog = data["eventlog"]
+        records = job.parse_eventlog(eventlog)
+        events = [job.EventLogEvent(line) for line in eventlog.splitlines()]
+        self.assertEqual(len(records), len(events))
+        for record, event in zip(records, events):
+            self.assertIsInstance(record, job.EventLogRecord)
+            self.assertEqual(record.name, event.name)
+            self.assertEqual(record.timestamp, event.timestamp)
+            self.assertDictEqual(record.context, event.context)
+            self.assertEqual(record.context_string, event.context_string)
+            self.assertDictEqual(record.to_event(), event)
+
+        records = job.parse_eventlog(eventlog, names=["start", "finish"])
+        self.assertListEqual([x.name for x in records], ["start", "finish"])
+        self.assertEqual(records[1].context["status"], 0)
+
+        #  Entries not in libeventlog's compact form are also handled
+        records = job.parse_eventlog(
+            '{"name": "foo", "timestamp": 1.5}\n'
+            '{"timestamp":2.0,"name":"bar","context":{"a":"}"}}\n'
+        )
+        self.assertEqual(records[0].name, "foo")
+        self.assertEqual(records[0].timestamp, 1.5)
+        self.assertDictEqual(records[0].context, {})
+        self.assertEqual(records[1].name, "bar")
+        self.assertDictEqual(records[1].context, {"a": "}"})
+
 
 if __name__ == "__main__":
     from subflux import rerun_under_flux
@@ -320,6 +320,77 @@ class TestJob(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             rpc_handle.get_jobinfo()
 
+    # JobList.columns() returns the same jobs as JobList.jobs()
+    def test_19_list_columns(self):
+        joblist = flux.job.JobList(self.fh, filters=["inactive"], max_entries=0)
+        jobs = joblist.jobs()
+        columns = joblist.columns()
+        self.assertSetEqual(set(columns.keys()), set(flux.job.JobList.COLUMNS))
+        self.assertListEqual(columns["id"], [job.id for job in jobs])
+        self.assertListEqual(columns["t_submit"], [job.t_submit for job in jobs])
+        for state in columns["state"]:
+            self.assertEqual(state, flux.constants.FLUX_JOB_STATE_INACTIVE)
+
+        columns = joblist.columns(["id", "name"])
+        self.assertListEqual(list(columns.keys()), ["id", "name"])
+        self.assertListEqual(columns["name"], [job.name for job in jobs])
+
+    # JobList.pages() returns the same jobs as JobList.jobs()
+    def test_20_list_pages(self):
+        for max_entries in (0, 5):
+            joblist = flux.job.JobList(
+                self.fh, filters=["inactive"], max_entries=max_entries
+            )
+            expected = [job.id for job in joblist.jobs()]
+            #  Query size grows from page_size up to max_query_size:
+            for max_query_size in (None, 3, 7):
+                pages = list(joblist.pages(page_size=3, max_query_size=max_query_size))
+                for page in pages:
+                    self.assertLessEqual(len(page), 3)
+                self.assertListEqual(
+                    [job.id for page in pages for job in page], expected
+                )
+
+        with self.assertRaises(ValueError):
+            next(flux.job.JobList(self.fh).pages(page_size=0))
+
+    def test_21_list_constraint(self):
+        parser = flux.job.JobListConstraintParser()
+        jobs = flux.job.JobList(self.fh, filters=["inactive"]).jobs()
+        t_first = min(job.t_inactive for job in jobs)
+        for query, expected in (
+            ("hostname", [job.id for job in jobs if job.name == "hostname"]),
+            ("-hostname", [job.id for job in jobs if job.name != "hostname"]),
+            ("name:sleep,hostname", [job.id for job in jobs]),
+            (
+                f"t_inactive:>{t_first}",
+                [job.id for job in jobs if job.t_inactive > t_first],
+            ),
+            ("result:completed | result:failed", [job.id for job in jobs]),
+            ("state:run", []),
+        ):
+            joblist = flux.job.JobList(
+                self.fh, filters=["inactive"], constraint=parser.parse(query)
+            )
+            self.assertListEqual([job.id for job in joblist.jobs()], expected)
+
+        for query in ("hostlist:foo", "state:foo", "t_run:1234", "user:nosuchuser"):
+            with self.assertRaises(ValueError):
+                parser.parse(query)
+
+    def test_22_list_match(self):
+        parser = flux.job.JobListConstraintParser()
+        jobs = flux.job.JobList(self.fh, filters=["inactive"]).jobs()
+        for constraint in (None, parser.parse("-hostname"), parser.parse("sleep")):
+            joblist = flux.job.JobList(
+                self.fh, filters=["inactive"], constraint=constraint
+            )
+            expected = [job.id for job in joblist.jobs()]
+            self.assertListEqual(
+                [job.id for job in jobs if joblist.match(job)], expected
+            )
+        self.assertFalse(flux.job.JobList(self.fh, filters=["running"]).match(jobs[0]))
+
 
 if __name__ == "__main__":
     from subflux import rerun_under_flux
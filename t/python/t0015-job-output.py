@@ -19,16 +19,19 @@ import subflux  # noqa: F401 - for PYTHONPATH
 from flux.constants import FLUX_JOB_URGENCY_DEFAULT, FLUX_JOB_URGENCY_HOLD
 from flux.job import (
     JobspecV1,
+    OutputSink,
     event_wait,
     job_output,
+    job_outputs,
     output_event_watch,
     output_event_watch_async,
     output_watch,
     output_watch_async,
     output_watch_lines,
     output_watch_lines_async,
+    write_output,
 )
-from flux.job.output import LOG_QUIET, LOG_TRACE
+from flux.job.output import LOG_QUIET, LOG_TRACE, OutputEvent
 
 
 def __flux_size():
@@ -111,6 +114,86 @@ class TestJobOutput(unittest.TestCase):
         self.assertNotIn("0: line 1", output.stdout)
         self.assertNotIn("0: error 1", output.stderr)
 
+    def test_job_output_nowait_task_filter(self):
+        jobid = self.submit(ntasks=2)
+        flux.job.wait(self.fh, jobid)
+        output = job_output(self.fh, jobid, tasks="0", labelio=True, nowait=True)
+        self.assertIn("0: line 1", output.stdout)
+        self.assertNotIn("1: line 1", output.stdout)
+
+    def test_job_output_binary(self):
+        jobid = self.submit(cmd="printf 'text\\n\\377\\376\\n'")
+        output = job_output(self.fh, jobid, binary=True)
+        self.assertEqual(output.stdout, b"text\n\xff\xfe\n")
+        self.assertEqual(output.stderr, b"")
+
+        chunks = [data for stream, data in output_watch(self.fh, jobid, binary=True)]
+        self.assertEqual(b"".join(chunks), b"text\n\xff\xfe\n")
+
+        rfd, wfd = os.pipe()
+        write_output(wfd, [b"a", memoryview(b"bc"), b"", b"d\n"])
+        os.close(wfd)
+        self.assertEqual(os.read(rfd, 64), b"abcd\n")
+        os.close(rfd)
+
+    def test_job_outputs(self):
+        finished = [self.submit() for _ in range(3)]
+        for jobid in finished:
+            flux.job.wait(self.fh, jobid)
+        active = [self.submit(cmd="echo first; sleep 1; echo second")]
+        held = self.submit(hold=True)
+        flux.job.cancel(self.fh, held)
+        invalid = flux.job.JobID(1234)
+        jobids = finished + active + [held, invalid]
+
+        results = job_outputs(self.fh, jobids, max_active=2)
+        self.assertEqual(set(results.keys()), set(jobids))
+        for jobid in finished:
+            self.assertEqual(results[jobid].stdout, self.test_stdout)
+            self.assertEqual(results[jobid].stderr, self.test_stderr)
+        self.assertEqual(results[active[0]].stdout, "first\nsecond\n")
+        self.assertIsInstance(results[held], flux.job.JobException)
+        self.assertIsInstance(results[invalid], FileNotFoundError)
+
+        collected = {}
+
+        def sink(jobid, result):
+            collected[jobid] = result
+
+        results = job_outputs(self.fh, finished, binary=True, sink=sink)
+        self.assertEqual(results, {})
+        self.assertEqual(set(collected.keys()), set(finished))
+        for output in collected.values():
+            self.assertEqual(output.stdout, self.test_stdout.encode())
+
+    def test_output_sink(self):
+        rfd, wfd = os.pipe()
+        with os.fdopen(wfd, "w") as stream:
+            sink = OutputSink(stream, high_water=4)
+            sink.write("a\nb\n", label="0: ")
+            sink.write([b"bin", b"ary\n"])
+            sink.write("c\n")
+            sink.flush()
+            self.assertEqual(os.read(rfd, 64), b"0: a\n0: b\nbinary\nc\n")
+            sink.write("d\n")
+            sink.close()
+            with self.assertRaises(ValueError):
+                sink.write("closed\n")
+        self.assertEqual(os.read(rfd, 64), b"d\n")
+        os.close(rfd)
+
+    def test_output_event_shared_taskset(self):
+        entry = {
+            "timestamp": 1.0,
+            "name": "data",
+            "context": {"rank": "0-1", "stream": "stdout", "data": "a\nb\n"},
+        }
+        event1 = OutputEvent(entry, labelio=True)
+        event2 = OutputEvent(entry)
+        self.assertIs(event1.rank, event2.rank)
+        self.assertEqual(event1.data, "0-1: a\n0-1: b\n")
+        self.assertEqual(event2.data, "a\nb\n")
+
     def test_job_output_with_logs(self):
         jobid = self.submit(verbose=True)
         output = job_output(self.fh, jobid)
@@ -590,6 +673,22 @@ class TestJobOutput(unittest.TestCase):
         with self.assertRaises(NameError):
             self.fh.reactor_run()
 
+    def test_output_watch_lines_ordered(self):
+        #  Many chunks of output are all delivered, in order, through
+        #  the single output watch future:
+        jobid = self.submit(cmd="seq 1 10000")
+        lines = [line for stream, line in output_watch_lines(self.fh, jobid)]
+        self.assertListEqual(lines, [str(i) for i in range(1, 10001)])
+
+        future = output_watch_lines_async(self.fh, jobid)
+        stream, line = future.getline()
+        self.assertEqual((stream, line), ("stdout", "1"))
+
+        #  get() does not consume the current line, reset() does:
+        future.get()
+        future.reset()
+        self.assertEqual(future.getline(), ("stdout", "3"))
+
 
 if __name__ == "__main__":
     from subflux import rerun_under_flux
@@ -10,11 +10,21 @@
 # SPDX-License-Identifier: LGPL-3.0
 ###############################################################
 
+import io
+import os
+import pwd
 import unittest
+from contextlib import redirect_stdout
 from datetime import datetime
 
 import subflux  # noqa: F401 - To set up PYTHONPATH
-from flux.util import UtilDatetime, parse_datetime
+from flux.util import (
+    OutputFormat,
+    PasswdCache,
+    UtilDatetime,
+    _split_field_name,
+    parse_datetime,
+)
 from pycotap import TAPTestRunner
 
 
@@ -92,5 +102,113 @@ class TestUtilDatetime(unittest.TestCase):
         self.assertEqual(f"{self.ts:%b%d %R::>12h}", " Jun10 08:00")
 
 
+class TestOutputFormat(unittest.TestCase):
+    headings = {"a": "A", "b.c": "BC", "d[0]": "D", "t": "T", "n": "N"}
+
+    class Item:
+        def __init__(self, a, c, d, t, n=""):
+            self.a = a
+            self.b = type("B", (), {"c": c})
+            self.d = d
+            self.t = t
+            self.n = n
+
+    def test_compiled_format(self):
+        fmt = "x{a:>4}|{b.c!r:<6}|{d[0]:03d}|{t!H}|{n:>4h}|{n:<3.3+}y"
+        formatter = OutputFormat(fmt, headings=self.headings)
+        for item in (
+            self.Item(1, "foo", [1], 61.0, "longname"),
+            self.Item("bar", 2.5, [42], 0.5),
+        ):
+            self.assertEqual(
+                formatter.format(item),
+                formatter.formatter().format(formatter.get_format(), item),
+            )
+        self.assertEqual(
+            formatter.format(self.Item(1, "foo", [1], 61.0, "longname")),
+            "x   1|'foo' |001|0:01:01|longname|lo+y",
+        )
+
+    def test_compiled_format_errors(self):
+        formatter = OutputFormat("{a} {b.c}", headings=self.headings)
+        with self.assertRaises(AttributeError):
+            formatter.format(object())
+
+    def test_split_field_name(self):
+        self.assertEqual(_split_field_name("0"), (0, []))
+        self.assertEqual(
+            _split_field_name("0.a.b[3][x.y].c"),
+            (0, [(True, "a"), (True, "b"), (False, 3), (False, "x.y"), (True, "c")]),
+        )
+        self.assertEqual(_split_field_name("name[0]"), ("name", [(False, 0)]))
+        for name in ("0.", "0..a", "0[]", "0[a]b"):
+            self.assertEqual(_split_field_name(name), (None, None))
+
+    def test_print_items_collapsible(self):
+        fmt = "{a:>4} ?:{n:>6} ?:{b.c:<4}|{t!H}"
+        items = [self.Item(1, "", [1], 61.0), self.Item(2, "x", [2], 1.0)]
+        for items, expected_fmt in (
+            (items, "{a:>4} {b.c:<4}|{t!H}"),
+            (items + [self.Item(3, "", [3], 2.0, "name")], fmt.replace("?:", "")),
+        ):
+            formatter = OutputFormat(fmt, headings=self.headings)
+            expected = OutputFormat(expected_fmt, headings=self.headings)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                result = formatter.print_items(items)
+            self.assertEqual(result.get_format(orig=True), expected_fmt)
+            lines = [expected.header()] + [expected.format(x) for x in items]
+            self.assertEqual(output.getvalue(), "\n".join(lines) + "\n")
+
+
+class TestPasswdCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.orig = (pwd.getpwuid, pwd.getpwnam)
+
+        def counted(func):
+            def wrapper(arg):
+                self.calls.append(arg)
+                return func(arg)
+
+            return wrapper
+
+        pwd.getpwuid, pwd.getpwnam = map(counted, self.orig)
+
+    def tearDown(self):
+        pwd.getpwuid, pwd.getpwnam = self.orig
+
+    def test_cached(self):
+        cache = PasswdCache()
+        entry = cache.getpwuid(os.getuid())
+        self.assertEqual(entry, self.orig[0](os.getuid()))
+        self.assertEqual(cache.getpwuid(os.getuid()), entry)
+        self.assertEqual(cache.getpwnam(entry.pw_name), entry)
+        self.assertEqual(self.calls, [os.getuid()])
+
+    def test_negative(self):
+        cache = PasswdCache()
+        for i in range(2):
+            with self.assertRaises(KeyError):
+                cache.getpwnam("nosuchuser-flux")
+        self.assertEqual(self.calls, ["nosuchuser-flux"])
+
+    def test_ttl(self):
+        cache = PasswdCache(ttl=0.0, negative_ttl=0.0)
+        cache.getpwuid(os.getuid())
+        cache.getpwuid(os.getuid())
+        self.assertEqual(len(self.calls), 2)
+
+    def test_maxsize(self):
+        cache = PasswdCache(maxsize=2)
+        for name in ("nosuchuser-a", "nosuchuser-b", "nosuchuser-c"):
+            with self.assertRaises(KeyError):
+                cache.getpwnam(name)
+        self.assertEqual(len(cache._cache), 2)
+        with self.assertRaises(KeyError):
+            cache.getpwnam("nosuchuser-a")
+        self.assertEqual(len(self.calls), 4)
+
+
 if __name__ == "__main__":
     unittest.main(testRunner=TAPTestRunner())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+###############################################################
+# Copyright 2023 Lawrence Livermore National Security, LLC
+# (c.f. AUTHORS, NOTICE.LLNS, COPYING)
+#
+# This file is part of the Flux resource manager framework.
+# For details, see https://github.com/flux-framework.
+#
+# SPDX-License-Identifier: LGPL-3.0
+###############################################################
+
+import errno
+import os
+import unittest
+
+import flux
+import subflux  # noqa: F401 - for PYTHONPATH
+from flux import job
+from flux.job import JobspecV1, JournalConsumer, JournalEvent
+
+
+def __flux_size():
+    return 1
+
+
+class TestJobJournal(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.fh = flux.Flux()
+
+    def submit(self, command=None):
+        if command is None:
+            command = ["true"]
+        return job.submit(self.fh, JobspecV1.from_command(command), waitable=True)
+
+    def test_00_journal_poll(self):
+        consumer = JournalConsumer(self.fh).start()
+        jobid = self.submit()
+        consumer.add_job(jobid)
+        events = []
+        for event in consumer:
+            self.assertIsInstance(event, JournalEvent)
+            self.assertEqual(event.jobid, jobid)
+            events.append(event.name)
+            if event.name == "clean":
+                consumer.stop()
+        self.assertEqual(events[0], "submit")
+        self.assertEqual(events[-1], "clean")
+
+    def test_01_journal_allow(self):
+        consumer = job.journal_consumer(self.fh, allow=["start", "clean"])
+        jobid = self.submit()
+        consumer.add_job(jobid)
+        events = []
+        for event in consumer:
+            events.append(event.name)
+            if event.name == "clean":
+                consumer.stop()
+        self.assertListEqual(events, ["start", "clean"])
+
+    def test_02_journal_demux_callbacks(self):
+        jobids = [self.submit() for _ in range(4)]
+        events = {jobid: [] for jobid in jobids}
+
+        def cb(event, consumer, jobid):
+            self.assertEqual(event.jobid, jobid)
+            events[jobid].append(event.name)
+            if event.name == "clean":
+                consumer.remove_job(jobid)
+                if not consumer.jobids:
+                    consumer.stop()
+
+        consumer = JournalConsumer(self.fh)
+        for jobid in jobids:
+            consumer.add_job(jobid, cb, consumer, jobid)
+        consumer.start()
+        self.fh.reactor_run()
+        for jobid in jobids:
+            self.assertEqual(events[jobid][0], "submit")
+            self.assertEqual(events[jobid][-1], "clean")
+
+    def test_03_journal_resume(self):
+        jobid = self.submit()
+        job.wait(self.fh, jobid)
+        consumer = JournalConsumer(self.fh, jobids=[jobid]).start()
+        names = []
+        for event in consumer:
+            names.append(event.name)
+            if event.name == "start":
+                break
+        consumer.stop()
+
+        #  A new consumer resumed from the first skips events already seen:
+        consumer2 = JournalConsumer(
+            self.fh, jobids=[jobid], resume=consumer.last_seq
+        ).start()
+        event = consumer2.poll()
+        self.assertEqual(event.eventlog_seq, consumer.last_seq[jobid] + 1)
+        consumer2.stop()
+        self.assertEqual(names[0], "submit")
+
+    def test_04_journal_guest(self):
+        #  The journal requires owner credentials:
+        os.environ["FLUX_HANDLE_ROLEMASK"] = "0x2"
+        try:
+            handle = flux.Flux()
+        finally:
+            del os.environ["FLUX_HANDLE_ROLEMASK"]
+
+        consumer = JournalConsumer(handle).start()
+        with self.assertRaises(OSError) as cm:
+            consumer.poll()
+        self.assertEqual(cm.exception.errno, errno.EPERM)
+
+        #  With callbacks, the error is stored and the stream ends:
+        events = []
+        consumer = JournalConsumer(handle).set_callback(events.append).start()
+        handle.reactor_run()
+        self.assertListEqual(events, [None])
+        self.assertEqual(consumer.error.errno, errno.EPERM)
+
+    def check_event_wait_many(self, future, jobids, canceled, invalid):
+        results = {}
+        for jobid, result in future:
+            self.assertNotIn(jobid, results)
+            results[jobid] = result
+        for jobid in jobids:
+            self.assertIsInstance(results[jobid], job.EventLogEvent)
+            self.assertEqual(results[jobid].name, "start")
+        self.assertIsInstance(results[canceled], job.JobException)
+        self.assertIsInstance(results[invalid], FileNotFoundError)
+
+    def test_05_event_wait_many(self):
+        jobids = [self.submit() for _ in range(4)]
+        job.wait(self.fh, jobids[0])
+        canceled = job.submit(
+            self.fh, JobspecV1.from_command(["true"]), waitable=True, urgency=0
+        )
+        job.cancel(self.fh, canceled)
+        invalid = job.JobID(1234)
+
+        future = job.event_wait_many(self.fh, jobids + [canceled, invalid], "start")
+        self.assertIsInstance(future, job.EventWaitManyFuture)
+        self.check_event_wait_many(future, jobids, canceled, invalid)
+        self.assertIsNotNone(future.consumer)
+
+        #  Without the journal, as for a user other than the instance
+        #  owner, the eventlog of each job is watched instead
+        future = job.EventWaitManyFuture(
+            self.fh, jobids + [canceled, invalid], "start", journal=False
+        )
+        self.check_event_wait_many(future, jobids, canceled, invalid)
+        self.assertIsNone(future.consumer)
+
+        #  With raiseJobException=False, a job that never starts results
+        #  in ENODATA once its eventlog is complete
+        for journal in (None, False):
+            future = job.EventWaitManyFuture(
+                self.fh, [canceled], "start", raiseJobException=False, journal=journal
+            )
+            jobid, result = future.get_event()
+            self.assertEqual(jobid, canceled)
+            self.assertIsInstance(result, OSError)
+            self.assertEqual(result.errno, errno.ENODATA)
+            self.assertIsNone(future.get_event())
+
+
+if __name__ == "__main__":
+    from subflux import rerun_under_flux
+
+    if rerun_under_flux(size=__flux_size(), personality="job"):
+        from pycotap import TAPTestRunner
+
+        unittest.main(testRunner=TAPTestRunner())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+###############################################################
+# Copyright 2023 Lawrence Livermore National Security, LLC
+# (c.f. AUTHORS, NOTICE.LLNS, COPYING)
+#
+# This file is part of the Flux resource manager framework.
+# For details, see https://github.com/flux-framework.
+#
+# SPDX-License-Identifier: LGPL-3.0
+###############################################################
+
+import json
+import unittest
+
+import flux
+import subflux  # noqa: F401 - for PYTHONPATH
+from flux import job
+from flux.job import JobspecV1
+from flux.job.timeline import PHASES, JobTimelines, Phase, job_timelines
+
+
+def __flux_size():
+    return 1
+
+
+def eventlog(*events):
+    return "".join(
+        json.dumps({"timestamp": timestamp, "name": name}) + "\n"
+        for name, timestamp in events
+    )
+
+
+class TestJobTimeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.fh = flux.Flux()
+
+    def test_00_timeline_columns(self):
+        timelines = JobTimelines()
+        for i in range(1, 5):
+            timelines.add(
+                i,
+                {
+                    "eventlog": eventlog(
+                        ("submit", 0.0),
+                        ("priority", 0.5),
+                        ("alloc", float(i)),
+                        ("start", i + 1.0),
+                        ("finish", i + 3.0),
+                        ("clean", i + 3.5),
+                    )
+                },
+            )
+        #  A job that is still pending:
+        timelines.add(5, {"eventlog": eventlog(("submit", 0.0))})
+
+        self.assertEqual(len(timelines), 5)
+        self.assertListEqual(timelines.columns["queue"], [1.0, 2.0, 3.0, 4.0, None])
+        self.assertListEqual(timelines.columns["run"], [2.0] * 4 + [None])
+        self.assertListEqual(timelines.columns["prolog"], [None] * 5)
+        self.assertListEqual(timelines.columns["exec.shell"], [None] * 5)
+
+        rows = list(timelines.rows())
+        self.assertEqual(rows[0]["id"], 1)
+        self.assertEqual(rows[0]["sched"], 0.5)
+
+        summary = timelines.summary(percentiles=(50, 90))
+        self.assertEqual(summary["queue"]["count"], 4)
+        self.assertEqual(summary["queue"]["min"], 1.0)
+        self.assertEqual(summary["queue"]["max"], 4.0)
+        self.assertEqual(summary["queue"]["mean"], 2.5)
+        self.assertEqual(summary["queue"]["p50"], 2.5)
+        self.assertAlmostEqual(summary["queue"]["p90"], 3.7)
+        self.assertEqual(summary["epilog"]["count"], 0)
+        self.assertIsNone(summary["epilog"]["p50"])
+
+    def test_01_timeline_custom_phases(self):
+        timelines = JobTimelines([Phase("total", "submit", "clean")])
+        self.assertSetEqual(timelines.eventlogs, {"eventlog"})
+        timelines.add(1, {"eventlog": eventlog(("submit", 1.0), ("clean", 4.0))})
+        self.assertDictEqual(timelines.columns, {"total": [3.0]})
+
+    def test_02_job_timelines(self):
+        jobspec = JobspecV1.from_command(["true"])
+        jobids = [job.submit(self.fh, jobspec, waitable=True) for _ in range(4)]
+        for jobid in jobids:
+            job.wait(self.fh, jobid)
+        job.event_wait(self.fh, jobids[-1], "clean")
+
+        timelines = job_timelines(self.fh, jobids + [job.JobID(1234)])
+        self.assertListEqual(timelines.jobids, jobids)
+        self.assertEqual(len(timelines.errors), 1)
+        for phase in PHASES:
+            if phase.name in ("prolog", "epilog"):
+                continue
+            for duration in timelines.columns[phase.name]:
+                self.assertIsNotNone(duration, msg=phase.name)
+                self.assertGreaterEqual(duration, 0.0)
+        summary = timelines.summary()
+        self.assertEqual(summary["run"]["count"], 4)
+        self.assertLessEqual(summary["run"]["p50"], summary["run"]["p99"])
+
+
+if __name__ == "__main__":
+    from subflux import rerun_under_flux
+
+    if rerun_under_flux(size=__flux_size(), personality="job"):
+        from pycotap import TAPTestRunner
+
+        unittest.main(testRunner=TAPTestRunner())
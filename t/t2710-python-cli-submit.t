@@ -259,6 +259,40 @@ test_expect_success 'flux submit --cc works' '
 	EOF
 	test_cmp cc.output.expected cc.output.sorted
 '
+test_expect_success 'flux submit --max-inflight limits outstanding requests' '
+	flux submit --max-inflight=2 --cc=1-8 --wait true >inflight.jobids &&
+	test $(wc -l < inflight.jobids) -eq 8 &&
+	flux submit --max-inflight=auto --cc=1-8 true >inflight-auto.jobids &&
+	test $(wc -l < inflight-auto.jobids) -eq 8
+'
+test_expect_success 'flux submit --max-inflight bounds outstanding submit RPCs' '
+	FLUX_HANDLE_TRACE=1 flux submit --max-inflight=2 --cc=1-16 true \
+		>inflight-trace.jobids 2>inflight-trace.out &&
+	test $(wc -l < inflight-trace.jobids) -eq 16 &&
+	awk "/^> job-ingest.submit/ { if (++n > max) max = n }
+	     /^< job-ingest.submit/ { n-- }
+	     END { print max }" inflight-trace.out >inflight.max &&
+	test_debug "cat inflight.max" &&
+	test $(cat inflight.max) -eq 2
+'
+test_expect_success 'flux submit reports jobspec error for a queued --cc job' '
+	test_must_fail flux submit --max-inflight=1 --cc=1-4 -n2 -N{cc} true \
+		>cc-error.jobids 2>cc-error.err &&
+	test_debug "cat cc-error.err" &&
+	test $(wc -l < cc-error.jobids) -eq 2 &&
+	grep "node count must not be greater than task count" cc-error.err &&
+	test_must_fail grep Traceback cc-error.err
+'
+test_expect_success 'flux submit jobspec error for first job submits no jobs' '
+	test_must_fail flux submit --cc=1-4 -n2 -N3 true \
+		>cc-error-first.jobids 2>cc-error-first.err &&
+	test_debug "cat cc-error-first.err" &&
+	test_must_be_empty cc-error-first.jobids
+'
+test_expect_success 'flux submit --max-inflight fails with invalid value' '
+	test_must_fail flux submit --max-inflight=0 true &&
+	test_must_fail flux submit --max-inflight=foo true
+'
 test_expect_success 'flux submit does not substitute {} without --cc' '
 	flux submit \
 		--env=-* \
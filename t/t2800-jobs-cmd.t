@@ -275,6 +275,27 @@ test_expect_success 'flux-jobs --queue works' '
 	test $(flux jobs -an --queue=foobar | wc -l) -eq 0
 '
 
+test_expect_success 'flux-jobs --filter-expr works' '
+	test $(flux jobs -an --filter-expr=queue:queue1 | wc -l) \
+		-eq $(job_list_state_count completed) &&
+	test $(flux jobs -an --filter-expr="queue:queue1,queue2" | wc -l) \
+		-eq $(job_list_state_count completed sched run) &&
+	test $(flux jobs -an --filter-expr="state:sched|state:run" | wc -l) \
+		-eq $(job_list_state_count sched run) &&
+	test $(flux jobs -an --filter-expr="-queue:queue1 result:completed" \
+		| wc -l) -eq 0 &&
+	test $(flux jobs -an --filter-expr=nosuchcommand | wc -l) -eq 1
+'
+
+test_expect_success 'flux-jobs --filter-expr with invalid query fails' '
+	test_must_fail flux jobs --filter-expr="hostlist:foo" 2>fexpr.err &&
+	grep "unsupported job-list operator" fexpr.err &&
+	test_must_fail flux jobs --filter-expr="t_run:-1h" 2>fexpr2.err &&
+	grep "comparison operator" fexpr2.err &&
+	test_must_fail flux jobs --filter-expr="(queue:queue1" &&
+	test_must_fail flux jobs --filter-expr="state:foo"
+'
+
 # Recall pending = depend | priority | sched, running = run | cleanup,
 #  active = pending | running
 test_expect_success 'flux-jobs --filter works (job states)' '
@@ -408,6 +429,16 @@ test_expect_success 'flux-jobs --count works' '
 	test $count -eq 8
 '
 
+test_expect_success 'flux-jobs --count=0 streamed output matches unstreamed' '
+	flux jobs -a --count=0 >count0.out &&
+	flux jobs -a --count=100000 >count100000.out &&
+	test_cmp count100000.out count0.out &&
+	flux jobs -a --count=0 -f inactive,running >count0-filter.out &&
+	flux jobs -a --count=100000 -f inactive,running \
+		>count100000-filter.out &&
+	test_cmp count100000-filter.out count0-filter.out
+'
+
 #
 # test specific IDs
 #
@@ -1527,4 +1558,49 @@ test_expect_success 'flux-jobs --stats works after jobs purged (defaultqueue)' '
 	test_cmp statspurgeqdefault.expected statspurgeqdefault.actual
 '
 
+test_expect_success 'flux-jobs --watch is incompatible with --json' '
+	test_must_fail flux jobs --watch --json 2>watch-json.err &&
+	grep "incompatible" watch-json.err &&
+	test_must_fail flux jobs --watch=0 2>watch-zero.err &&
+	grep "greater than zero" watch-zero.err
+'
+
+test_expect_success 'flux-jobs --watch follows job state changes' '
+	flux jobs -an --name=watchtest --watch=0.1 \
+		--format="{id.f58} {status_abbrev}" >watch.out &
+	pid=$! &&
+	count=0 &&
+	while ! test -s watch.out && test $count -lt 100; do
+		sleep 0.1 && count=$((count+1))
+	done &&
+	jobid=$(flux submit --job-name=watchtest --wait-event=clean true) &&
+	count=0 &&
+	while ! grep "^$jobid CD$" watch.out && test $count -lt 100; do
+		sleep 0.1 && count=$((count+1))
+	done &&
+	kill $pid &&
+	wait $pid &&
+	test_debug "cat watch.out" &&
+	grep "^$jobid CD$" watch.out
+'
+test_expect_success 'flux-jobs --watch works for a guest user' '
+	FLUX_HANDLE_ROLEMASK=0x2 FLUX_HANDLE_USERID=$(id -u) \
+		flux jobs -an --name=watchguest --watch=0.1 \
+		--format="{id.f58} {status_abbrev}" >watch-guest.out &
+	pid=$! &&
+	count=0 &&
+	while ! test -s watch-guest.out && test $count -lt 100; do
+		sleep 0.1 && count=$((count+1))
+	done &&
+	jobid=$(flux submit --job-name=watchguest --wait-event=clean true) &&
+	count=0 &&
+	while ! grep "^$jobid CD$" watch-guest.out && test $count -lt 100; do
+		sleep 0.1 && count=$((count+1))
+	done &&
+	kill $pid &&
+	wait $pid &&
+	test_debug "cat watch-guest.out" &&
+	grep "^$jobid CD$" watch-guest.out
+'
+
 test_done
@@ -66,4 +66,12 @@ test_expect_success 'flux-jobs {instance.stats.total} works' '
 test_expect_success 'flux-jobs {instance.progress} works' '
 	test $(flux jobs -no {instance.progress:.1f} $id2) = 0.2
 '
+test_expect_success 'flux-jobs {instance.resources.*} counts work' '
+	flux jobs -no \
+		"{instance.resources.all.ncores} {instance.resources.up.nnodes}" \
+		$id2 >resources.out &&
+	test_debug "cat resources.out" &&
+	echo "2 2" >resources.expected &&
+	test_cmp resources.expected resources.out
+'
 test_done
@@ -101,6 +101,43 @@ test_expect_success 'flux jobs --json works with recursive jobs' '
 	jq -e ".jobs[] | select(.uri)" < recursive.json &&
 	jq -e ".jobs[] | select(.uri) | .jobs[0].id > 0" < recursive.json
 '
+test_expect_success 'flux jobs --recursive gets instance.* fields of nested instances' '
+	flux jobs --recursive -no "{id.f58} {instance.stats.total}" \
+		>recursive-instance.out &&
+	test_debug "cat recursive-instance.out" &&
+	grep "^$(flux job id -t f58 $rid) 2$" recursive-instance.out &&
+	test $(grep -c " 1$" recursive-instance.out) -eq 2
+'
+test_expect_success 'flux jobs --recursive --stats works with instance.* fields' '
+	flux jobs --recursive --stats -no "{id.f58} {instance.stats.total}" \
+		>recursive-instance-stats.out &&
+	test_debug "cat recursive-instance-stats.out" &&
+	test $(grep -c running recursive-instance-stats.out) -eq 4 &&
+	grep "^$(flux job id -t f58 $rid) 2$" recursive-instance-stats.out &&
+	test $(grep -c " 1$" recursive-instance-stats.out) -eq 2
+'
+test_expect_success 'start a job with an unreachable instance uri' '
+	badid=$(flux submit sleep 300) &&
+	flux job wait-event $badid start &&
+	flux job memo $badid uri=local:///nonexistent/local
+'
+test_expect_success 'flux jobs instance.* fields are empty for unreachable instance' '
+	flux jobs -no "{id.f58}:{instance.stats.total}" $badid >unreachable.out &&
+	test_debug "cat unreachable.out" &&
+	echo "$(flux job id -t f58 $badid):" >unreachable.expected &&
+	test_cmp unreachable.expected unreachable.out
+'
+test_expect_success 'flux jobs --recursive --stats skips unreachable instance' '
+	flux jobs --recursive --stats -no "{id.f58} {instance.stats.total}" \
+		>recursive-unreachable.out &&
+	test_debug "cat recursive-unreachable.out" &&
+	grep "^$(flux job id -t f58 $badid)" recursive-unreachable.out &&
+	grep "^$(flux job id -t f58 $rid) 2$" recursive-unreachable.out &&
+	test $(grep -c " 1$" recursive-unreachable.out) -eq 2
+'
+test_expect_success 'cancel job with unreachable instance uri' '
+	flux cancel $badid
+'
 test_expect_success FLUX_SECURITY 'cancel alternate user job' '
 	flux cancel $(cat altid)
 '
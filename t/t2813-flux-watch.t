@@ -130,4 +130,22 @@ test_expect_success 'flux-watch: --filter works' '
 	test_debug "cat failed.out" &&
 	grep "Watching ${nfailed} job" failed.out
 '
+test_expect_success 'flux-watch: JobWatcher limits concurrent output watches' '
+	flux submit --cc=1-8 --env=TEST_OUTPUT=queued{cc} ./test.sh \
+	    >queued.ids &&
+	cat <<-EOF >watch-limit.py &&
+	import sys
+	import flux
+	from flux.job import JobID, JobWatcher
+	h = flux.Flux()
+	watcher = JobWatcher(h, max_output_watch=2).start()
+	for jobid in sys.argv[1:]:
+	    watcher.add_jobid(JobID(jobid))
+	h.reactor_run()
+	sys.exit(watcher.exitcode)
+	EOF
+	flux python watch-limit.py $(cat queued.ids) >queued.out &&
+	test_debug "cat queued.out" &&
+	test $(grep -c "^queued" queued.out) -eq 8
+'
 test_done